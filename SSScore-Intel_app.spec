@@ -65,8 +65,6 @@ hiddenImports += [
 ]
 
 RUNTIME_DEPS = (
-    "haversine",
-    "geopy",
     "click",
     "psutil",
     "importlib_resources",
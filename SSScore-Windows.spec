@@ -54,7 +54,7 @@ hiddenImports += [
 ]
 
 RUNTIME_DEPS = (
-    'haversine', 'geopy', 'click', 'psutil', 'importlib_resources',
+    'click', 'psutil', 'importlib_resources',
     'webview', 'pythonnet',          # explicit for Windows
 )
 for runtimeDep in RUNTIME_DEPS:
@@ -93,8 +93,6 @@ hiddenImports += [
 # ssscoring depends on at runtime — but that isn't already pulled in by the
 # asset-package collect_all() above — must be declared here explicitly.
 RUNTIME_DEPS = (
-    'haversine',
-    'geopy',
     'click',
     'psutil',
     'importlib_resources',
@@ -9,10 +9,12 @@ from importlib_resources import files
 from io import StringIO
 
 import base64
+import hashlib
 
 from ssscoring import __VERSION__
 from ssscoring.calc import isValidMaximumAltitude
 from ssscoring.calc import isValidMinimumAltitude
+from ssscoring.calc import processAllJumpFiles
 from ssscoring.constants import DEFAULT_PLOT_INCREMENT
 from ssscoring.constants import DEFAULT_PLOT_MAX_V_SCALE
 from ssscoring.constants import DZ_DIRECTORY
@@ -50,6 +52,17 @@ DEFAULT_DATA_LAKE = './data'
 Default data lake directory when reading files from the local file system.
 """
 
+JUMP_RESULTS_CACHE_MAX_ENTRIES = 256
+"""
+Maximum number of processed track files held by the uploaded tracks cache.
+"""
+
+JUMP_RESULTS_CACHE_TTL = 3600
+"""
+Time to live, in seconds, of the processed track files in the uploaded tracks
+cache.
+"""
+
 STREAMLIT_SIG_KEY = 'HOSTNAME'
 """
 Environment key used by the Streamlig.app environment when running an
@@ -305,6 +318,41 @@ def plotJumpResult(tag: str, jumpResult: JumpResults):
         st.plotly_chart(figure, width='stretch')
 
 
+@st.cache_data(max_entries=JUMP_RESULTS_CACHE_MAX_ENTRIES, ttl=JUMP_RESULTS_CACHE_TTL, show_spinner=False)
+def _processUploadedJumpFile(digest: str, name: str, altitudeDZMeters: float, _trackFile) -> dict:
+    # Streamlit doesn't hash _trackFile; digest and name stand in for it.
+    _trackFile.seek(0)
+    return processAllJumpFiles([ _trackFile, ], altitudeDZMeters=altitudeDZMeters)
+
+
+def processUploadedJumpFiles(trackFiles: list, altitudeDZMeters: float = 0.0) -> dict:
+    """
+    Process the track files uploaded to a Streamlit app, with the same results
+    as `ssscoring.calc.processAllJumpFiles`.  Results are cached by the
+    SHA-256 digest of each file's bytes, the file name, and the DZ elevation,
+    so that widget interactions that rerun the app script don't score the
+    tracks again.  The cache is bounded by `JUMP_RESULTS_CACHE_MAX_ENTRIES` and
+    `JUMP_RESULTS_CACHE_TTL`.
+
+    Arguments
+    ---------
+        trackFiles
+    A list of Streamlit `UploadedFile` or other named `BytesIO` objects.
+
+        altitudeDZMeters
+    Drop zone height above MSL
+
+    Returns
+    -------
+    A dictionary of jump results keyed by tag, in `trackFiles` order.
+    """
+    jumpResults = dict()
+    for trackFile in trackFiles:
+        digest = hashlib.sha256(trackFile.getbuffer()).hexdigest()
+        jumpResults.update(_processUploadedJumpFile(digest, trackFile.name, altitudeDZMeters, trackFile))
+    return jumpResults
+
+
 def initFileUploaderState(filesObject:str, uploaderKey:str ='uploaderKey'):
     """
     Initialize the session state for the Streamlit app uploader so that
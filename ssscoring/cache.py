@@ -0,0 +1,219 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+"""
+Content-addressed, size-bounded cache of scored speed tracks.  Each entry holds
+the `JumpResults` of converting and scoring one track file, keyed by the file
+contents, the DZ elevation, and the scoring rules version (the SSScoring
+version).  Entries are stored as compressed NumPy archives, one array per
+dataframe column, and the least recently used entries are evicted when the
+cache exceeds its size bound.
+"""
+
+
+from pathlib import Path
+
+from ssscoring import __VERSION__
+from ssscoring.constants import CACHE_MAX_BYTES
+from ssscoring.datatypes import JumpResults
+from ssscoring.datatypes import JumpStatus
+from ssscoring.datatypes import PerformanceWindow
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+# +++ constants +++
+
+_CACHE_FILE_SUFFIX = '.npz'
+_EVICTION_LOW_WATER = 0.9
+_FRAMES = ('data', 'table', )
+
+
+# +++ implementation +++
+
+# Running size estimate of each cache directory written to by this process,
+# so that stores only scan the directory when it may exceed its bound:
+_cacheBytes = dict()
+
+
+def jumpCacheKey(buffer: bytes, altitudeDZMeters = 0.0) -> str:
+    """
+    Calculate the cache key for a track file.
+
+    Arguments
+    ---------
+        buffer
+    The raw bytes of a FlySight or Insight track file.
+
+        altitudeDZMeters : float
+    Drop zone height above MSL
+
+    Returns
+    -------
+    A hex digest string of the track contents, the DZ elevation, and the
+    scoring rules version.
+    """
+    digest = hashlib.sha256(buffer)
+    digest.update(('|%r|%s' % (float(altitudeDZMeters), __VERSION__)).encode())
+    return digest.hexdigest()
+
+
+def _cacheFileName(cacheDir: str, key: str) -> Path:
+    return Path(cacheDir) / (key+_CACHE_FILE_SUFFIX)
+
+
+def _floatOrNone(value):
+    return None if value is None else float(value)
+
+
+def loadCachedJumpResult(cacheDir: str, key: str) -> tuple:
+    """
+    Look up a scored track in the cache.  A hit marks the entry as the most
+    recently used one.
+
+    Arguments
+    ---------
+        cacheDir
+    A string or `pathlib.Path` with the cache directory.
+
+        key
+    A cache key from `jumpCacheKey`.
+
+    Returns
+    -------
+    A `(tag, JumpResults)` tuple, or `None` if the entry isn't in the cache or
+    can't be read.
+    """
+    cacheFileName = _cacheFileName(cacheDir, key)
+    try:
+        with np.load(cacheFileName, allow_pickle = False) as archive:
+            meta = json.loads(str(archive['meta']))
+            frames = dict()
+            for frame in _FRAMES:
+                if meta[frame] is None:
+                    frames[frame] = None
+                    continue
+                columns = meta[frame]
+                frames[frame] = pd.DataFrame({ column: archive['%s.%d' % (frame, n)] for n, column in enumerate(columns) },
+                                             index = archive['%s.index' % frame], columns = columns)
+            scores = dict(zip(archive['scores.keys'], archive['scores.values'])) if meta['scores'] else None
+        os.utime(cacheFileName)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    window = None if meta['window'] is None else PerformanceWindow(*meta['window'])
+    jumpResult = JumpResults(
+        frames['data'],
+        meta['maxSpeed'],
+        meta['score'],
+        scores,
+        frames['table'],
+        window,
+        JumpStatus[meta['status']],
+        meta['backFall'],
+        meta['backFallOnset'],
+        meta['forwardReversalM'],
+        meta['lateralReversalM'],
+        meta['jumpRunBearing'],
+    )
+    return (meta['tag'], jumpResult)
+
+
+def _evictFrom(cacheDir: str, maxBytes: int) -> int:
+    # Over-bound caches are evicted down to the low water mark so that the
+    # next few stores don't rescan the directory.  Returns the cache size.
+    entries = list()
+    for cacheFileName in Path(cacheDir).glob('*'+_CACHE_FILE_SUFFIX):
+        try:
+            stat = cacheFileName.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, cacheFileName))
+    totalBytes = sum(entry[1] for entry in entries)
+    if totalBytes <= maxBytes:
+        return totalBytes
+    for _, size, cacheFileName in sorted(entries):
+        if totalBytes <= maxBytes*_EVICTION_LOW_WATER:
+            break
+        cacheFileName.unlink(missing_ok = True)
+        totalBytes -= size
+    return totalBytes
+
+
+def storeJumpResult(cacheDir: str, key: str, tag: str, jumpResult: JumpResults, maxBytes = CACHE_MAX_BYTES):
+    """
+    Store a scored track in the cache, then evict the least recently used
+    entries if the cache is larger than `maxBytes`.  Entries are written
+    atomically, so that concurrent workers never read a partial entry.
+
+    The cache directory is scanned on the first store in each process and
+    whenever the running size estimate exceeds `maxBytes`, not on every store.
+    Entries written by other processes are accounted for at the next scan.
+
+    Arguments
+    ---------
+        cacheDir
+    A string or `pathlib.Path` with the cache directory; created if it doesn't
+    exist.
+
+        key
+    A cache key from `jumpCacheKey`.
+
+        tag
+    The track tag, as returned by `ssscoring.calc.iterJumpResults`.
+
+        jumpResult
+    The `JumpResults` for the track.
+
+        maxBytes
+    Size bound for the cache directory.  Default: `CACHE_MAX_BYTES`.
+    """
+    Path(cacheDir).mkdir(parents = True, exist_ok = True)
+    arrays = dict()
+    meta = {
+        'tag': tag,
+        'maxSpeed': _floatOrNone(jumpResult.maxSpeed),
+        'score': _floatOrNone(jumpResult.score),
+        'scores': jumpResult.scores is not None,
+        'window': None if jumpResult.window is None else [ _floatOrNone(value) for value in jumpResult.window ],
+        'status': jumpResult.status.name,
+        'backFall': bool(jumpResult.backFall),
+        'backFallOnset': _floatOrNone(jumpResult.backFallOnset),
+        'forwardReversalM': float(jumpResult.forwardReversalM),
+        'lateralReversalM': float(jumpResult.lateralReversalM),
+        'jumpRunBearing': _floatOrNone(jumpResult.jumpRunBearing),
+    }
+    for frame in _FRAMES:
+        data = getattr(jumpResult, frame)
+        if data is None:
+            meta[frame] = None
+            continue
+        meta[frame] = [ str(column) for column in data.columns ]
+        arrays['%s.index' % frame] = data.index.to_numpy()
+        for n, column in enumerate(data.columns):
+            arrays['%s.%d' % (frame, n)] = data[column].to_numpy()
+    if jumpResult.scores is not None:
+        arrays['scores.keys'] = np.fromiter(jumpResult.scores.keys(), dtype = float, count = len(jumpResult.scores))
+        arrays['scores.values'] = np.fromiter(jumpResult.scores.values(), dtype = float, count = len(jumpResult.scores))
+    arrays['meta'] = np.array(json.dumps(meta))
+    with tempfile.NamedTemporaryFile(dir = cacheDir, prefix = '.%s.' % key, suffix = '.tmp', delete = False) as outputFile:
+        np.savez_compressed(outputFile, **arrays)
+        tempFileName = outputFile.name
+        entryBytes = outputFile.tell()
+    cacheFileName = _cacheFileName(cacheDir, key)
+    try:
+        entryBytes -= cacheFileName.stat().st_size
+    except OSError:
+        pass
+    os.replace(tempFileName, cacheFileName)
+    directory = Path(cacheDir).resolve()
+    totalBytes = _cacheBytes.get(directory)
+    if totalBytes is None or totalBytes+entryBytes > maxBytes:
+        totalBytes = _evictFrom(cacheDir, maxBytes)
+    else:
+        totalBytes += entryBytes
+    _cacheBytes[directory] = totalBytes
@@ -5,12 +5,15 @@ Functions and logic for analyzing and manipulating FlySight dataframes.
 """
 
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
+from itertools import groupby
 from pathlib import Path
 
-from haversine import haversine
-from haversine import Unit
-
+from ssscoring.cache import jumpCacheKey
+from ssscoring.cache import loadCachedJumpResult
+from ssscoring.cache import storeJumpResult
 from ssscoring.constants import BREAKOFF_ALTITUDE
 from ssscoring.constants import DEG_IN_RADIANS
 from ssscoring.constants import EXIT_SPEED
@@ -20,20 +23,35 @@ from ssscoring.constants import KMH_AS_MS
 from ssscoring.constants import LAST_TIME_TRANCHE
 from ssscoring.constants import MAX_ALTITUDE_METERS
 from ssscoring.constants import MAX_VALID_ELEVATION
+from ssscoring.constants import MIN_FREE_FALL_MAX_SPEED
+from ssscoring.constants import MIN_FREE_FALL_SAMPLES
 from ssscoring.constants import MPS_2_KMH
 from ssscoring.constants import PERFORMANCE_WINDOW_LENGTH
+from ssscoring.constants import RAW_TRACK_COLUMNS
 from ssscoring.constants import SCORING_INTERVAL
 from ssscoring.constants import SPEED_ACCURACY_THRESHOLD
 from ssscoring.constants import TABLE_INTERVAL
 from ssscoring.constants import VALIDATION_WINDOW_LENGTH
+from ssscoring.datatypes import BundleMember
 from ssscoring.datatypes import JumpResults
 from ssscoring.datatypes import JumpStatus
 from ssscoring.datatypes import PerformanceWindow
 from ssscoring.errors import SSScoringError
+from ssscoring.flysight import bundleKindOf
 from ssscoring.flysight import getFlySightDataFromCSVBuffer
 from ssscoring.flysight import getFlySightDataFromCSVFileName
+from ssscoring.flysight import getFlySightDataFromFileBuffer
+from ssscoring.flysight import readBundleMember
+from ssscoring.flysight import readBundleMembers
+from ssscoring.flysight import tagFromFirstTimestampIn
+from ssscoring.flysight import tagVersion1From
+from ssscoring.geodesy import bearingComponents
+from ssscoring.geodesy import haversineDistance
+from ssscoring.trackarchive import isTrackArchive
+from ssscoring.trackarchive import loadTrackArchive
 
 import math
+import multiprocessing
 import re
 import warnings
 
@@ -168,7 +186,31 @@ def calculateDistance(start: tuple, end: tuple) -> float:
     -------
     The distance, in meters, between both points.
     """
-    return haversine(start, end, unit = Unit.METERS)
+    return float(haversineDistance(start[0], start[1], end[0], end[1]))
+
+
+def _unixTimeFrom(time: pd.Series) -> pd.Series:
+    # Same result as pd.Timestamp(t).timestamp() for every t, vectorized:
+    # microseconds since the epoch, then rounded to 6 decimals like
+    # Timestamp.timestamp() does.  Naive timestamps are UTC.
+    time = pd.to_datetime(time, utc = True, format = 'ISO8601')
+    if time.isna().any():
+        raise SSScoringError('time column has missing timestamps')
+    microseconds = (time-pd.Timestamp(0, tz = 'UTC'))/pd.Timedelta(1, unit = 'us')
+    return np.round(microseconds/1_000_000.0, decimals = 6)
+
+
+def _speedAngleFrom(ratio: pd.Series) -> pd.Series:
+    # np.arctan and math.atan may disagree in the last ulp; recompute the few
+    # angles that sit on a 2-decimal rounding tie with math.atan so that the
+    # rounded angles match the scalar implementation exactly.
+    speedAngle = 90.0-np.arctan(ratio)/DEG_IN_RADIANS
+    hundredths = speedAngle.to_numpy()*100.0
+    nearTie = np.abs(np.abs(hundredths-np.trunc(hundredths))-0.5) < 1e-6
+    if nearTie.any():
+        speedAngle = speedAngle.copy()
+        speedAngle[nearTie] = [ 90.0-math.atan(r)/DEG_IN_RADIANS for r in ratio[nearTie] ]
+    return speedAngle
 
 
 def convertFlySight2SSScoring(rawData: pd.DataFrame,
@@ -230,47 +272,91 @@ def convertFlySight2SSScoring(rawData: pd.DataFrame,
     if altitudeDZFt:
         altitudeDZMeters = altitudeDZFt/FT_IN_M
 
-    data = rawData.copy()
-
-    data['altitudeMSLFt'] = data['hMSL'].apply(lambda h: FT_IN_M*h)
-    data['altitudeAGL'] = data.hMSL-altitudeDZMeters
-    data['altitudeAGLFt'] = data.altitudeMSLFt-altitudeDZFt
-    data['timeUnix'] = np.round(data['time'].apply(lambda t: pd.Timestamp(t).timestamp()), decimals = 2)
-    data['hMetersPerSecond'] = (data.velE**2.0+data.velN**2.0)**0.5
-    speedAngle = data['hMetersPerSecond']/data['velD']
-    speedAngle = np.round(90.0-speedAngle.apply(math.atan)/DEG_IN_RADIANS, decimals = 2)
-    speedAccuracyISC = np.round(data.vAcc.apply(lambda a: (2.0**0.5)*a/3.0), decimals = 2)
+    # Derived columns are computed from rawData's columns; the only full
+    # allocation is the SSScoring dataframe itself.
+    altitudeMSLFt = FT_IN_M*rawData.hMSL
+    timeUnix = np.round(_unixTimeFrom(rawData['time']), decimals = 2)
+    hMetersPerSecond = (rawData.velE**2.0+rawData.velN**2.0)**0.5
+    speedAngle = np.round(_speedAngleFrom(hMetersPerSecond/rawData['velD']), decimals = 2)
+    speedAccuracyISC = np.round((2.0**0.5)*rawData.vAcc/3.0, decimals = 2)
 
     data = pd.DataFrame(data = {
-        'timeUnix': data.timeUnix,
-        'altitudeMSL': data.hMSL,
-        'altitudeAGL': data.altitudeAGL,
-        'altitudeMSLFt': data.altitudeMSLFt,
-        'altitudeAGLFt': data.altitudeAGLFt,
-        'vMetersPerSecond': data.velD,
-        'vKMh': 3.6*data.velD,
+        'timeUnix': timeUnix,
+        'altitudeMSL': rawData.hMSL,
+        'altitudeAGL': rawData.hMSL-altitudeDZMeters,
+        'altitudeMSLFt': altitudeMSLFt,
+        'altitudeAGLFt': altitudeMSLFt-altitudeDZFt,
+        'vMetersPerSecond': rawData.velD,
+        'vKMh': 3.6*rawData.velD,
         'speedAngle': speedAngle,
-        'speedAccuracy': data.sAcc,
-        'vAccelMS2': data.velD.diff()/data.timeUnix.diff(),
-        'hMetersPerSecond': data.hMetersPerSecond,
-        'hKMh': 3.6*data.hMetersPerSecond,
-        'latitude': data.lat,
-        'longitude': data.lon,
-        'verticalAccuracy': data.vAcc,
+        'speedAccuracy': rawData.sAcc,
+        'vAccelMS2': rawData.velD.diff()/timeUnix.diff(),
+        'hMetersPerSecond': hMetersPerSecond,
+        'hKMh': 3.6*hMetersPerSecond,
+        'latitude': rawData.lat,
+        'longitude': rawData.lon,
+        'verticalAccuracy': rawData.vAcc,
         'speedAccuracyISC': speedAccuracyISC,
-        'velocityNorth': data.velN,
-        'velocityEast': data.velE,
+        'velocityNorth': rawData.velN,
+        'velocityEast': rawData.velE,
     })
 
     return data
 
 
-def _dataGroups(data):
-    data_ = data.copy()
-    data_['positive'] = (data_.vMetersPerSecond > 0)
-    data_['group'] = (data_.positive != data_.positive.shift(1)).fillna(True).astype(int).cumsum()-1
+def freeFallSegmentsFrom(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Run-length encode the jump data into segments of consecutive descending
+    (`vMetersPerSecond > 0`) and non-descending data points.
+
+    Arguments
+    ---------
+        data : pd.DataFrame
+    Jump data in SSScoring format
+
+    Returns
+    -------
+    A dataframe with one row per segment, in time order:
+
+    - `start` : positional index of the first data point in the segment
+    - `end` : positional index one past the last data point in the segment
+    - `length` : number of data points in the segment
+    - `maxVKMh` : max vertical speed in the segment, in km/h
+    - `freeFall` : `True` if the segment is descending, has at least
+      `MIN_FREE_FALL_SAMPLES` data points, and reaches
+      `MIN_FREE_FALL_MAX_SPEED`
+
+    Callers get every free fall segment in a multi-jump track with
+    `segments[segments.freeFall]`; slice the jump with
+    `data.iloc[segment.start:segment.end]`.
 
-    return data_
+    See
+    ---
+    `ssscoring.constants.MIN_FREE_FALL_MAX_SPEED`
+    `ssscoring.constants.MIN_FREE_FALL_SAMPLES`
+    """
+    return _freeFallSegments(data.vMetersPerSecond.to_numpy(dtype = float), data.vKMh.to_numpy(dtype = float))
+
+
+def _freeFallSegments(vMetersPerSecond: np.ndarray, vKMh: np.ndarray) -> pd.DataFrame:
+    positive = vMetersPerSecond > 0
+    if len(positive):
+        starts = np.flatnonzero(np.concatenate(([ True, ], positive[1:] != positive[:-1])))
+        ends = np.append(starts[1:], len(positive))
+        maxVKMh = np.fmax.reduceat(vKMh, starts)
+    else:
+        starts = ends = np.empty(0, dtype = int)
+        maxVKMh = np.empty(0)
+    lengths = ends-starts
+    freeFall = positive[starts] & (lengths >= MIN_FREE_FALL_SAMPLES) & (maxVKMh >= MIN_FREE_FALL_MAX_SPEED)
+
+    return pd.DataFrame({
+        'start': starts,
+        'end': ends,
+        'length': lengths,
+        'maxVKMh': maxVKMh,
+        'freeFall': freeFall,
+    })
 
 
 def getSpeedSkydiveFrom(data: pd.DataFrame) -> tuple:
@@ -298,56 +384,78 @@ def getSpeedSkydiveFrom(data: pd.DataFrame) -> tuple:
 
     - `None` for the `PerformanceWindow` instance
     - `data`, most likely empty
-    """
-    if len(data):
-        data = _dataGroups(data)
-        groups = data.group.max()+1
-
-        freeFallGroup = -1
-        MIN_DATA_POINTS = 100 # heuristic
-        MIN_MAX_SPEED = 200 # km/h, heuristic; slower ::= no free fall
-        for group in range(groups):
-            subset = data[data.group == group]
-            if len(subset) >= MIN_DATA_POINTS and subset.vKMh.max() >= MIN_MAX_SPEED:
-                freeFallGroup = group
 
-        data = data[data.group == freeFallGroup]
-        data = data.drop('group', axis = 1).drop('positive', axis = 1)
+    The speed skydive is the last free fall segment in the track.
 
-    data = data[data.altitudeAGL <= MAX_VALID_ELEVATION]
-    if len(data) > 0:
-        exitTime = data[data.vMetersPerSecond > EXIT_SPEED].head(1).timeUnix.iat[0]
-        data = data[data.timeUnix >= exitTime]
-        data = data[data.altitudeAGL >= BREAKOFF_ALTITUDE]
-
-        if len(data):
-            windowStart = data.iloc[0].altitudeAGL
-            windowEnd = windowStart-PERFORMANCE_WINDOW_LENGTH
-            if windowEnd < BREAKOFF_ALTITUDE:
-                windowEnd = BREAKOFF_ALTITUDE
-
-            validationWindowStart = windowEnd+VALIDATION_WINDOW_LENGTH
-            data = data[data.altitudeAGL >= windowEnd]
-            refN = float(data.velocityNorth.iloc[0])
-            refE = float(data.velocityEast.iloc[0])
-            refMag = (refN**2.0 + refE**2.0)**0.5
-            unitN, unitE = (refN/refMag, refE/refMag) if refMag > 0.0 else (1.0, 0.0)
-            signedHMPS = (data.velocityNorth*unitN + data.velocityEast*unitE).to_numpy(dtype=float, na_value=0.0)
-            vMS = data.vMetersPerSecond.to_numpy(dtype=float, na_value=0.0)
-            data = data.copy()
-            data['speedAngle'] = np.round(
-                np.where(signedHMPS == 0.0, 90.0, np.degrees(np.arctan(vMS/signedHMPS))),
-                decimals=2,
-            )
-            data = data.drop(['velocityNorth', 'velocityEast',], axis=1)
-            performanceWindow = PerformanceWindow(windowStart, windowEnd, validationWindowStart)
+    See
+    ---
+    `ssscoring.calc.freeFallSegmentsFrom`
+    """
+    window, rows, speedAngle = _speedSkydiveRowsFrom(data, np.arange(len(data)))
+    return window, _speedSkydiveDataFrom(data, rows, speedAngle)
+
+
+def _skydiveRowsFrom(data: pd.DataFrame) -> np.ndarray:
+    # Positional dropNonSkydiveDataFrom().
+    altitudeAGL = data.altitudeAGL.to_numpy(dtype = float)
+    timeUnix = data.timeUnix.to_numpy(dtype = float)
+    timeMaxAlt = timeUnix[altitudeAGL == np.nanmax(altitudeAGL)][0]
+    return np.flatnonzero((timeUnix > timeMaxAlt) & (altitudeAGL > 0))
+
+
+def _speedSkydiveRowsFrom(data: pd.DataFrame, rows: np.ndarray) -> tuple:
+    # Positional getSpeedSkydiveFrom() over the data rows at positions rows.
+    # Every stage narrows the positions array; no dataframe is materialized.
+    # Returns the performance window, the speed skydive row positions, and
+    # their speed angles.
+    altitudeAGL = data.altitudeAGL.to_numpy(dtype = float)
+    timeUnix = data.timeUnix.to_numpy(dtype = float)
+    vMetersPerSecond = data.vMetersPerSecond.to_numpy(dtype = float)
+    if len(rows):
+        segments = _freeFallSegments(vMetersPerSecond[rows], data.vKMh.to_numpy(dtype = float)[rows])
+        freeFalls = segments[segments.freeFall]
+        if len(freeFalls):
+            rows = rows[freeFalls.start.iat[-1]:freeFalls.end.iat[-1]]
         else:
-            data = data.drop(['velocityNorth', 'velocityEast',], axis=1)
-            performanceWindow = None
-
-        return performanceWindow, data
-    else:
-        return None, data.drop(['velocityNorth', 'velocityEast',], axis=1)
+            rows = rows[0:0]
+
+    rows = rows[altitudeAGL[rows] <= MAX_VALID_ELEVATION]
+    if not len(rows):
+        return None, rows, None
+    exitTime = timeUnix[rows][vMetersPerSecond[rows] > EXIT_SPEED][0]
+    rows = rows[timeUnix[rows] >= exitTime]
+    rows = rows[altitudeAGL[rows] >= BREAKOFF_ALTITUDE]
+    if not len(rows):
+        return None, rows, None
+
+    windowStart = altitudeAGL[rows[0]]
+    windowEnd = windowStart-PERFORMANCE_WINDOW_LENGTH
+    if windowEnd < BREAKOFF_ALTITUDE:
+        windowEnd = BREAKOFF_ALTITUDE
+    validationWindowStart = windowEnd+VALIDATION_WINDOW_LENGTH
+    rows = rows[altitudeAGL[rows] >= windowEnd]
+    velocityNorth = data.velocityNorth.to_numpy(dtype=float, na_value=np.nan)[rows]
+    velocityEast = data.velocityEast.to_numpy(dtype=float, na_value=np.nan)[rows]
+    refN = float(velocityNorth[0])
+    refE = float(velocityEast[0])
+    refMag = (refN**2.0 + refE**2.0)**0.5
+    unitN, unitE = (refN/refMag, refE/refMag) if refMag > 0.0 else (1.0, 0.0)
+    signedHMPS = np.nan_to_num(velocityNorth*unitN + velocityEast*unitE, nan=0.0)
+    vMS = np.nan_to_num(vMetersPerSecond[rows], nan=0.0)
+    speedAngle = np.round(
+        np.where(signedHMPS == 0.0, 90.0, np.degrees(np.arctan(vMS/signedHMPS))),
+        decimals=2,
+    )
+    return PerformanceWindow(windowStart, windowEnd, validationWindowStart), rows, speedAngle
+
+
+def _speedSkydiveDataFrom(data: pd.DataFrame, rows: np.ndarray, speedAngle: np.ndarray) -> pd.DataFrame:
+    # The one copy of the jump data: the rows and columns are taken together.
+    columns = [ n for n, column in enumerate(data.columns) if column not in ('velocityNorth', 'velocityEast', ) ]
+    speedSkydive = data.iloc[rows, columns]
+    if speedAngle is not None:
+        speedSkydive['speedAngle'] = speedAngle
+    return speedSkydive
 
 
 def _verticalAcceleration(vKMh: pd.Series, time: pd.Series, interval=TABLE_INTERVAL) -> pd.Series:
@@ -355,16 +463,39 @@ def _verticalAcceleration(vKMh: pd.Series, time: pd.Series, interval=TABLE_INTER
     return vAcc
 
 
-def jumpAnalysisTable(data: pd.DataFrame) -> pd.DataFrame:
+def _firstRowsAtTicks(ticks: np.ndarray, targetTicks: np.ndarray) -> tuple:
+    # Times are rounded to 2 decimals in SSScoring dataframes, so equality is
+    # resolved on integer centisecond ticks.  The stable sort preserves the
+    # first matching row, like data[data.column == value].iloc[0] did.
+    order = np.argsort(ticks, kind='stable')
+    sortedTicks = ticks[order]
+    positions = np.minimum(np.searchsorted(sortedTicks, targetTicks, side='left'), len(sortedTicks)-1)
+    found = sortedTicks[positions] == targetTicks
+    return order[positions], found
+
+
+def jumpAnalysisTable(data: pd.DataFrame, tranches: list = None) -> pd.DataFrame:
     """
     Generates the HCD jump analysis table, with speed data at 5-second intervals
     after exit.
 
+    Each tranche is resolved against a single sorted index of centisecond time
+    ticks.  If the sample at a tranche time is missing or has `NaN` values, the
+    next 0.1 s sample is used, up to 10 times; if none is usable, the tranche
+    falls back to the last sample in `data`.  The distances from exit are
+    calculated for all tranches at once, so the cost of the table is nearly
+    independent of the number of tranches.
+
     Arguments
     ---------
         data : pd.DataFrame
     Jump data in SSScoring format
 
+        tranches : list
+    Optional list of times from exit, in seconds, at which to report the jump
+    data; e.g. every second for coaching.  Default: 5, 10, 15, 20, and 25
+    seconds (`TABLE_INTERVAL` up to `LAST_TIME_TRANCHE`).
+
     Returns
     -------
     A tuple with a pd.DataFrame and the max speed recorded for the jump:
@@ -372,38 +503,33 @@ def jumpAnalysisTable(data: pd.DataFrame) -> pd.DataFrame:
     - A table dataframe with time and speed
     - a floating point number
     """
-    table = None
-    distanceStart = (data.iloc[0].latitude, data.iloc[0].longitude)
-    for column in pd.Series([ 5.0, 10.0, 15.0, 20.0, 25.0, ]):
-        for interval in range(int(column)*10, 10*(int(column)+1)):
-            # Use the next 0.1 sec interval if the current interval tranche has
-            # NaN values.
-            columnRef = interval/10.0
-            timeOffset = data.iloc[0].timeUnix+columnRef
-            tranche = data.query('timeUnix == %f' % timeOffset).copy()
-            tranche['time'] = [ column, ]
-            currentPosition = (tranche.iloc[0].latitude, tranche.iloc[0].longitude)
-            tranche['distanceFromExit'] = [ round(calculateDistance(distanceStart, currentPosition), 2), ]
-            if not tranche.isnull().any().any():
-                break
-
-        if pd.isna(tranche.iloc[-1].vKMh):
-            tranche = data.tail(1).copy()
-            currentPosition = (tranche.iloc[0].latitude, tranche.iloc[0].longitude)
-            tranche['time'] = tranche.timeUnix-data.iloc[0].timeUnix
-            tranche['distanceFromExit'] = [ round(calculateDistance(distanceStart, currentPosition), 2), ]
-
-        if table is not None:
-            table = pd.concat([ table, tranche, ])
-        else:
-            table = tranche
+    if tranches is None:
+        tranches = np.arange(TABLE_INTERVAL, LAST_TIME_TRANCHE+TABLE_INTERVAL, TABLE_INTERVAL)
+    tranches = np.asarray(tranches, dtype = float)
+    timeUnix = data.timeUnix.to_numpy(dtype = float)
+    exitTime = timeUnix[0]
+    offsets = (np.round(tranches*10.0)[:, np.newaxis]+np.arange(10))/10.0
+    candidateRows, found = _firstRowsAtTicks(np.round(timeUnix*100.0), np.round((exitTime+offsets)*100.0))
+    complete = found & ~data.iloc[candidateRows.ravel()].isnull().any(axis = 1).to_numpy().reshape(candidateRows.shape)
+    hasComplete = complete.any(axis = 1)
+    lastRows = candidateRows[:, -1]
+    lastHasSpeed = found[:, -1] & data.vKMh.notna().to_numpy()[lastRows]
+    rows = np.where(hasComplete,
+                    candidateRows[np.arange(len(tranches)), complete.argmax(axis = 1)],
+                    np.where(lastHasSpeed, lastRows, len(data)-1))
+    isLastSample = ~hasComplete & ~lastHasSpeed
+    table = data.iloc[rows]
+    table = table.assign(
+        time = np.where(isLastSample, timeUnix[-1]-exitTime, tranches),
+        distanceFromExit = np.round(haversineDistance(data.latitude.iloc[0], data.longitude.iloc[0], table.latitude.to_numpy(dtype = float), table.longitude.to_numpy(dtype = float)), decimals = 2),
+    )
     table = pd.DataFrame({
                 'time': table.time,
                 'vKMh': table.vKMh,
                 'deltaV': table.vKMh.diff().fillna(table.vKMh),
-                'vAccel m/s²': _verticalAcceleration(table.vKMh, table.time),
+                'vAccel m/s²': _verticalAcceleration(table.vKMh, table.time, interval = tranches[0]),
                 'speedAngle': table.speedAngle,
-                'angularVel º/s': (table.speedAngle.diff()/table.time.diff()).fillna(table.speedAngle/TABLE_INTERVAL),
+                'angularVel º/s': (table.speedAngle.diff()/table.time.diff()).fillna(table.speedAngle/tranches[0]),
                 'deltaAngle': table.speedAngle.diff().fillna(table.speedAngle),
                 'hKMh': table.hKMh,
                 'distanceFromExit (m)': table.distanceFromExit,
@@ -430,12 +556,7 @@ def dropNonSkydiveDataFrom(data: pd.DataFrame) -> pd.DataFrame:
     -------
     The jump data for the skydive
     """
-    timeMaxAlt = data[data.altitudeAGL == data.altitudeAGL.max()].timeUnix.iloc[0]
-    data = data[data.timeUnix > timeMaxAlt]
-
-    data = data[data.altitudeAGL > 0]
-
-    return data
+    return data.iloc[_skydiveRowsFrom(data)]
 
 
 def calcScoreMeanVelocity(data: pd.DataFrame) -> tuple:
@@ -456,24 +577,82 @@ def calcScoreMeanVelocity(data: pd.DataFrame) -> tuple:
 
     Notes
     -----
-    This implementation uses iteration instead of binning/factorization because
-    some implementers may be unfamiliar with data manipulation in dataframes
-    and this is a critical function that may be under heavy review.  Future
-    versions may revert to dataframe and series/np.array factorization.
-    """
-    scores = dict()
-    for spot in data.plotTime[::1]:
-        subset = data[(data.plotTime <= spot) & (data.plotTime >= (spot-SCORING_INTERVAL))]
-        scores[np.round(subset.vKMh.mean(), decimals = 2)] = spot
+    The trailing window for each sample is `plotTime - SCORING_INTERVAL <= t <= plotTime`.
+    Window bounds are resolved with two binary searches over the sorted
+    `plotTime` axis (the two pointers), and window means come from running
+    sums of `vKMh` and of the sample count, so the whole speed run is scored
+    in O(n) after sorting instead of filtering the dataframe once per sample.
+    Missing `vKMh` samples are ignored, like `pd.Series.mean()` does.
+    """
+    plotTime = data.plotTime.to_numpy(dtype=float)
+    order = np.argsort(plotTime, kind='stable')
+    sortedPlotTime = plotTime[order]
+    sortedSpeeds = data.vKMh.to_numpy(dtype=float)[order]
+    isSample = ~np.isnan(sortedSpeeds)
+    runningSums = np.concatenate(([ 0.0, ], np.cumsum(np.where(isSample, sortedSpeeds, 0.0))))
+    runningCounts = np.concatenate(([ 0, ], np.cumsum(isSample)))
+    windowEnds = np.searchsorted(sortedPlotTime, plotTime, side='right')
+    windowStarts = np.searchsorted(sortedPlotTime, plotTime-SCORING_INTERVAL, side='left')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        counts = runningCounts[windowEnds]-runningCounts[windowStarts]
+        means = (runningSums[windowEnds]-runningSums[windowStarts])/counts
+        # Running sums drift by a few ULPs; re-sum the rare windows whose mean
+        # sits on a rounding tie so they round like pd.Series.mean() does.
+        hundredths = means*100.0
+        for spot in np.flatnonzero(np.abs(np.abs(hundredths-np.trunc(hundredths))-0.5) < 1e-6):
+            means[spot] = np.nansum(sortedSpeeds[windowStarts[spot]:windowEnds[spot]])/counts[spot]
+    means[np.isnan(plotTime)] = np.nan
+    scores = dict(zip(np.round(means, decimals = 2), plotTime))
     return (max(scores), scores)
 
 
+def scoringWindowsISC(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resolves every 3-second ISC scoring window in the speed run in a single
+    pass over the `plotTime` axis.  Windows start at exit and slide by the
+    sampling step until the window end reaches the last sample.
+
+    Arguments
+    ---------
+        data
+    A `pd.dataframe` with speed run data, including `plotTime`.
+
+    Returns
+    -------
+    A dataframe with one row per window and these columns:
+
+    - `plotTime` - window start, in seconds from exit
+    - `score` - the window speed in km/h, or `NaN` if the window was skipped
+    - `valid` - `False` if the FlySight track lacks a sample at the window
+      start or end and the window was skipped
+    """
+    plotTime = data.plotTime.to_numpy(dtype=float)
+    altitudes = data.altitudeAGL.to_numpy(dtype=float)
+    step = data.plotTime.diff().dropna().mode().iloc[0]
+    end = plotTime[-1]-SCORING_INTERVAL
+    intervalStarts = np.round(np.arange(0.0, end, step), decimals = 2)
+    intervalEnds = np.round(intervalStarts+SCORING_INTERVAL, decimals = 2)
+    plotTimeTicks = np.round(plotTime*100.0)
+    startRows, startFound = _firstRowsAtTicks(plotTimeTicks, np.round(intervalStarts*100.0))
+    endRows, endFound = _firstRowsAtTicks(plotTimeTicks, np.round(intervalEnds*100.0))
+    valid = startFound & endFound
+    scores = np.round(MPS_2_KMH*np.abs(altitudes[startRows]-altitudes[endRows])/SCORING_INTERVAL, decimals = 2)
+    return pd.DataFrame({
+        'plotTime': intervalStarts,
+        'score': np.where(valid, scores, np.nan),
+        'valid': valid,
+    })
+
+
 def calcScoreISC(data: pd.DataFrame) -> tuple:
     """
     Calculates the speeds over a 3-second interval as the ds/dt and dt is the
     is a 3-second sliding interval from exit.  The window slider moves along the
     `plotTime` axis in the dataframe.
 
+    Windows with a missing FlySight sample at either end are skipped; use
+    `ssscoring.calc.scoringWindowsISC` to inspect which ones.
+
     Arguments
     ---------
         data
@@ -485,20 +664,9 @@ def calcScoreISC(data: pd.DataFrame) -> tuple:
     of the meanVSpeed:spotInTime used in determining the exact scoring speed
     at every datat point during the speed run.
     """
-    scores = dict()
-    step = data.plotTime.diff().dropna().mode().iloc[0]
-    end = data.plotTime[-1:].iloc[0]-SCORING_INTERVAL
-    for spot in np.arange(0.0, end, step):
-        intervalStart = np.round(spot, decimals = 2)
-        intervalEnd = np.round(intervalStart+SCORING_INTERVAL, decimals = 2)
-        try:
-            h1 = data[data.plotTime == intervalStart].altitudeAGL.iloc[0]
-            h2 = data[data.plotTime == intervalEnd].altitudeAGL.iloc[0]
-        except IndexError:
-            # TODO: Decide whether to log the missing FlySight samples.
-            continue
-        intervalScore = np.round(MPS_2_KMH*abs(h1-h2)/SCORING_INTERVAL, decimals = 2)
-        scores[intervalScore] = intervalStart
+    windows = scoringWindowsISC(data)
+    windows = windows[windows.valid]
+    scores = dict(zip(windows.score, windows.plotTime))
     return (max(scores), scores)
 
 
@@ -523,22 +691,13 @@ def jumpRunBearing(jumpData: pd.DataFrame, nSamples: int = JUMP_RUN_SAMPLES) ->
     samples = jumpData.head(nSamples)
     latitudes = samples.latitude.to_numpy(dtype=float)
     longitudes = samples.longitude.to_numpy(dtype=float)
-    sinSum = 0.0
-    cosSum = 0.0
-    count = 0
-    for i in range(len(latitudes) - 1):
-        startLatitude, startLongitude, endLatitude, endLongitude = map(math.radians, [latitudes[i], longitudes[i], latitudes[i + 1], longitudes[i + 1]])
-        longitudeDelta = endLongitude - startLongitude
-        eastComponent = math.sin(longitudeDelta) * math.cos(endLatitude)
-        northComponent = math.cos(startLatitude) * math.sin(endLatitude) - math.sin(startLatitude) * math.cos(endLatitude) * math.cos(longitudeDelta)
-        if eastComponent != 0.0 or northComponent != 0.0:
-            segmentBearing = math.atan2(eastComponent, northComponent)
-            sinSum += math.sin(segmentBearing)
-            cosSum += math.cos(segmentBearing)
-            count += 1
-    if count == 0:
+    eastComponents, northComponents = bearingComponents(latitudes[:-1], longitudes[:-1], latitudes[1:], longitudes[1:])
+    # Zero-length segments have no bearing:
+    isSegment = (eastComponents != 0.0) | (northComponents != 0.0)
+    if not isSegment.any():
         return 0.0
-    return (math.degrees(math.atan2(sinSum / count, cosSum / count)) + 360.0) % 360.0
+    segmentBearings = np.arctan2(eastComponents[isSegment], northComponents[isSegment])
+    return (math.degrees(math.atan2(np.sin(segmentBearings).mean(), np.cos(segmentBearings).mean())) + 360.0) % 360.0
 
 
 def forwardLateralDisplacement(jumpData: pd.DataFrame,
@@ -566,25 +725,19 @@ def forwardLateralDisplacement(jumpData: pd.DataFrame,
     -------
     Copy of `jumpData` with `forwardM` and `lateralM` columns appended.
     """
+    forwardM, lateralM = _forwardLateralFrom(jumpData, exitLat, exitLon, bearing)
+    return jumpData.assign(forwardM=forwardM, lateralM=lateralM)
+
+
+def _forwardLateralFrom(jumpData: pd.DataFrame, exitLat: float, exitLon: float, bearing: float) -> tuple:
     bearingRad = math.radians(bearing)
     latitudes = jumpData.latitude.to_numpy(dtype=float)
     longitudes = jumpData.longitude.to_numpy(dtype=float)
-    distances = np.array([
-        calculateDistance((exitLat, exitLon), (latitude, longitude))
-        for latitude, longitude in zip(latitudes, longitudes)
-    ])
-    exitLatitudeRad = math.radians(exitLat)
-    exitLongitudeRad = math.radians(exitLon)
-    pointLatitudesRad = np.radians(latitudes)
-    longitudeDeltas = np.radians(longitudes) - exitLongitudeRad
-    eastComponents = np.sin(longitudeDeltas) * np.cos(pointLatitudesRad)
-    northComponents = math.cos(exitLatitudeRad) * np.sin(pointLatitudesRad) - math.sin(exitLatitudeRad) * np.cos(pointLatitudesRad) * np.cos(longitudeDeltas)
+    distances = haversineDistance(exitLat, exitLon, latitudes, longitudes)
+    eastComponents, northComponents = bearingComponents(exitLat, exitLon, latitudes, longitudes)
     pointBearings = np.arctan2(eastComponents, northComponents)
     bearingDeltas = pointBearings - bearingRad
-    jumpCopy = jumpData.copy()
-    jumpCopy['forwardM'] = np.round(distances * np.cos(bearingDeltas), decimals=2)
-    jumpCopy['lateralM'] = np.round(-distances * np.sin(bearingDeltas), decimals=2)
-    return jumpCopy
+    return (np.round(distances * np.cos(bearingDeltas), decimals=2), np.round(-distances * np.sin(bearingDeltas), decimals=2))
 
 
 def detectBackFall(jumpData: pd.DataFrame) -> dict:
@@ -600,7 +753,8 @@ def detectBackFall(jumpData: pd.DataFrame) -> dict:
     ---------
         jumpData : pd.DataFrame
     Performance-window data in SSScoring format, with `plotTime` column set
-    (i.e., called after `processJump` sets `plotTime`).
+    (i.e., called after `processJump` sets `plotTime`).  The `forwardM` and
+    `lateralM` columns are used if present, otherwise they're calculated.
 
     Returns
     -------
@@ -612,10 +766,13 @@ def detectBackFall(jumpData: pd.DataFrame) -> dict:
     - `forwardReversalM` : float — metres reversed along jump run axis (≥ 0)
     - `lateralReversalM` : float — metres reversed on lateral axis (≥ 0)
     """
-    exitLat = float(jumpData.latitude.iloc[0])
-    exitLon = float(jumpData.longitude.iloc[0])
-    bearing = jumpRunBearing(jumpData)
-    jumpDisplacement = forwardLateralDisplacement(jumpData, exitLat, exitLon, bearing)
+    if 'forwardM' in jumpData.columns and 'lateralM' in jumpData.columns:
+        jumpDisplacement = jumpData
+    else:
+        exitLat = float(jumpData.latitude.iloc[0])
+        exitLon = float(jumpData.longitude.iloc[0])
+        bearing = jumpRunBearing(jumpData)
+        jumpDisplacement = forwardLateralDisplacement(jumpData, exitLat, exitLon, bearing)
     forwardMax = float(jumpDisplacement.forwardM.max())
     onsetIdx = jumpDisplacement.forwardM.idxmax()
     onsetTime = float(jumpDisplacement.loc[onsetIdx].plotTime)
@@ -631,6 +788,38 @@ def detectBackFall(jumpData: pd.DataFrame) -> dict:
     }
 
 
+def jumpGeometryFrom(jumpResult: JumpResults) -> tuple:
+    """
+    Resolve the jump run bearing and the ground track displacement of a jump.
+    `processJump` calculates both once and carries them in the `JumpResults`;
+    they're only calculated here for results that lack them.
+
+    Arguments
+    ---------
+        jumpResult
+    A `JumpResults` instance with non-empty `data`.
+
+    Returns
+    -------
+    A tuple with two elements:
+
+    - The jump run bearing in degrees [0, 360)
+    - The jump data with the `forwardM` and `lateralM` columns
+
+    See
+    ---
+    `ssscoring.calc.jumpRunBearing`
+    `ssscoring.calc.forwardLateralDisplacement`
+    """
+    data = jumpResult.data
+    bearing = jumpResult.jumpRunBearing
+    if bearing is None:
+        bearing = jumpRunBearing(data)
+    if 'forwardM' not in data.columns or 'lateralM' not in data.columns:
+        data = forwardLateralDisplacement(data, float(data.latitude.iloc[0]), float(data.longitude.iloc[0]), bearing)
+    return (bearing, data)
+
+
 def processJump(data: pd.DataFrame) -> JumpResults:
     """
     Take a dataframe in SSScoring format and process it for display.  It
@@ -657,14 +846,18 @@ def processJump(data: pd.DataFrame) -> JumpResults:
     - `color` a string that defines the color for the jump result; possible
       values are _green_ for valid jump, _red_ for invalid jump, per ISC rules
     - `result` a string with the legend of _valid_ or _invalid_ jump
+    - `jumpRunBearing` the jump run bearing; `data` includes the `forwardM`
+      and `lateralM` displacement along and across the jump run
     """
-    workData = data.copy()
-    workData = dropNonSkydiveDataFrom(workData)
-    window, workData = getSpeedSkydiveFrom(workData)
+    # The stages narrow row positions over data; the performance window data
+    # is the only copy of the jump data, and it's extended in place.
+    window, rows, speedAngle = _speedSkydiveRowsFrom(data, _skydiveRowsFrom(data))
+    workData = _speedSkydiveDataFrom(data, rows, speedAngle)
     backFall = False
     backFallOnset = None
     forwardReversalM = 0.0
     lateralReversalM = 0.0
+    bearing = None
     if workData.empty and not window:
         workData = None
         maxSpeed = -1.0
@@ -678,8 +871,12 @@ def processJump(data: pd.DataFrame) -> JumpResults:
         score = None
         scores = None
         table = None
-        baseTime = workData.iloc[0].timeUnix
+        baseTime = workData.timeUnix.iat[0]
         workData['plotTime'] = round(workData.timeUnix-baseTime, 2)
+        if len(workData):
+            # Once per jump; plots, maps, and back-fall detection reuse it.
+            bearing = jumpRunBearing(workData)
+            workData['forwardM'], workData['lateralM'] = _forwardLateralFrom(workData, float(workData.latitude.iat[0]), float(workData.longitude.iat[0]), bearing)
         if jumpStatus == JumpStatus.OK:
             table = jumpAnalysisTable(workData)
             maxSpeed = data.vKMh.max()
@@ -693,10 +890,188 @@ def processJump(data: pd.DataFrame) -> JumpResults:
             maxSpeed = -1
             if not len(workData):
                 jumpStatus = JumpStatus.INVALID_SPEED_FILE
-    return JumpResults(workData, maxSpeed, score, scores, table, window, jumpStatus, backFall, backFallOnset, forwardReversalM, lateralReversalM)
+    return JumpResults(workData, maxSpeed, score, scores, table, window, jumpStatus, backFall, backFallOnset, forwardReversalM, lateralReversalM, bearing)
+
+
+def _jumpFileTask(jumpFiles, jumpFile) -> tuple:
+    # Picklable (jumpThing, name) pair for _processJumpFile, or None if the
+    # file must be skipped.
+    if isinstance(jumpFile, BytesIO):
+        fileName = jumpFile.name
+        if not fileName.upper().endswith('.CSV') or any(x in fileName.upper() for x in ('SENSOR', 'EVENT')):
+            return None
+        return (jumpFile, fileName)
+    elif isinstance(jumpFiles, dict) and isinstance(jumpFiles[jumpFile], pd.DataFrame):
+        return (jumpFiles[jumpFile], jumpFile)
+    elif isinstance(jumpFile, BundleMember):
+        return (jumpFile, str(jumpFile))
+    return (jumpFile, None)
+
+
+def _sequentialBundleOf(task: tuple) -> Path:
+    jumpThing = task[0]
+    if isinstance(jumpThing, BundleMember) and bundleKindOf(jumpThing.bundle) != 'zip':
+        return jumpThing.bundle
+    return None
+
+
+def _bundleMemberTasks(tasks):
+    # Tar and gzip members are decompressed here, sequentially.  Zip members
+    # are independent of each other; they're left to _processJumpFile so that
+    # the pool workers decompress them in parallel.  Members that can't be read
+    # here are left to _processJumpFile as well, which reports them as invalid.
+    for bundle, bundleTasks in groupby(tasks, key = _sequentialBundleOf):
+        if bundle is None:
+            yield from bundleTasks
+            continue
+        bundleTasks = list(bundleTasks)
+        buffers = readBundleMembers(bundle, [ jumpThing.member for jumpThing, _ in bundleTasks ])
+        done = 0
+        try:
+            for (jumpThing, name), buffer in zip(bundleTasks, buffers):
+                done += 1
+                yield (jumpThing if buffer is None else buffer, name)
+        except SSScoringError:
+            yield from bundleTasks[done:]
+
+
+def _invalidJumpFile(name: str) -> tuple:
+    return ('%s:INVALID' % name, JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.INVALID_SPEED_FILE))
+
+
+def _scoreJumpFile(jumpThing, name: str, altitudeDZMeters: float, buffer = None) -> tuple:
+    # buffer holds the contents of the jumpThing file, if already read.
+    try:
+        if isinstance(jumpThing, (bytes, bytearray, memoryview)):
+            rawData, tag = getFlySightDataFromCSVBuffer(jumpThing, name, columns = RAW_TRACK_COLUMNS)
+        elif isinstance(jumpThing, pd.DataFrame):
+            rawData = jumpThing
+            tag = name
+        elif isTrackArchive(jumpThing):
+            rawData, tag = loadTrackArchive(jumpThing if buffer is None else buffer, columns = RAW_TRACK_COLUMNS)
+        elif buffer is not None:
+            rawData, tag = getFlySightDataFromFileBuffer(buffer, jumpThing.as_posix() if isinstance(jumpThing, Path) else jumpThing, columns = RAW_TRACK_COLUMNS)
+        else:
+            rawData, tag = getFlySightDataFromCSVFileName(jumpThing, columns = RAW_TRACK_COLUMNS)
+    except (SSScoringError, ValueError):
+        # A corrupt track, e.g. with a cell that isn't a number, only
+        # invalidates its own result.
+        return _invalidJumpFile(Path(jumpThing).as_posix() if name is None else name)
+    if rawData is None:
+        return (tag, JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.UNSUPPORTED_PLD_FORMAT))
+    try:
+        jumpResult = processJump(convertFlySight2SSScoring(rawData, altitudeDZMeters = altitudeDZMeters))
+    except Exception:
+        jumpResult = JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.INVALID_SPEED_FILE)
+    return (tag, jumpResult)
+
+
+def _processJumpFile(jumpThing, name: str, altitudeDZMeters: float, cacheDir = None) -> tuple:
+    if isinstance(jumpThing, BytesIO):
+        # Uploads are parsed in place, not from a copy of their bytes.
+        jumpThing = jumpThing.getbuffer()
+    elif isinstance(jumpThing, BundleMember):
+        try:
+            jumpThing = readBundleMember(jumpThing)
+        except SSScoringError:
+            return _invalidJumpFile(name)
+    if cacheDir is None or isinstance(jumpThing, pd.DataFrame):
+        return _scoreJumpFile(jumpThing, name, altitudeDZMeters)
+    if isinstance(jumpThing, (bytes, bytearray, memoryview)):
+        buffer = jumpThing
+        fileName = name
+    else:
+        buffer = Path(jumpThing).read_bytes()
+        fileName = jumpThing.as_posix() if isinstance(jumpThing, Path) else jumpThing
+    key = jumpCacheKey(buffer, altitudeDZMeters)
+    cached = loadCachedJumpResult(cacheDir, key)
+    if cached:
+        tag, jumpResult = cached
+        # FlySight 1 tags come from the file name, not from its contents, except
+        # in track archives:
+        if tag.endswith(':v1') and not isTrackArchive(fileName):
+            tag = tagVersion1From(fileName)
+        return (tag, jumpResult)
+    tag, jumpResult = _scoreJumpFile(jumpThing, name, altitudeDZMeters, buffer)
+    if jumpResult.status != JumpStatus.UNSUPPORTED_PLD_FORMAT:
+        storeJumpResult(cacheDir, key, tag, jumpResult)
+    return (tag, jumpResult)
+
+
+_WORKERS_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+def _pooledJumpResults(tasks, altitudeDZMeters: float, workers: int, cacheDir = None):
+    # At most 2*workers files in flight, results yielded in submission order.
+    # Workers aren't forked from this process, which may already be running
+    # threads (PyArrow, Streamlit) that a fork() could deadlock.
+    with ProcessPoolExecutor(max_workers = workers, mp_context = multiprocessing.get_context(_WORKERS_START_METHOD)) as executor:
+        pending = deque()
+        for jumpThing, name in tasks:
+            if isinstance(jumpThing, BytesIO):
+                jumpThing = jumpThing.getvalue()
+            pending.append(executor.submit(_processJumpFile, jumpThing, name, altitudeDZMeters, cacheDir))
+            if len(pending) >= 2*workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iterJumpResults(jumpFiles: list, altitudeDZMeters = 0.0, workers = 1, cacheDir = None):
+    """
+    Generator version of `processAllJumpFiles`.  Yields a `(tag, JumpResults)`
+    tuple as soon as each file is processed, so that callers can consume the
+    results of arbitrarily large data lakes without holding every
+    `JumpResults` in memory.
+
+    Arguments
+    ---------
+        jumpFiles
+    A list of file things or a dictionary from `getAllSpeedJumpFilesFrom`.  See
+    `ssscoring.calc.processAllJumpFiles` for details.
+
+        altitudeDZMeters : float
+    Drop zone height above MSL
+
+        workers : int
+    Number of worker processes that parse and score the files.  With
+    `workers > 1` at most `2*workers` files are in flight at any given time.
 
+        cacheDir
+    Optional cache directory for scored tracks.  See `processAllJumpFiles`.
 
-def processAllJumpFiles(jumpFiles: list, altitudeDZMeters = 0.0) -> dict:
+    Returns
+    -------
+    A generator of `(tag, JumpResults)` tuples in `jumpFiles` order.  Tags are
+    the same as the `processAllJumpFiles` dictionary keys.
+
+    Raises
+    ------
+    `SSScoringError` under the same conditions as `processAllJumpFiles`, when
+    the first result is requested.
+    """
+    if not len(jumpFiles):
+        raise SSScoringError('jumpFiles must have at least one element')
+    if not isinstance(jumpFiles, dict) and not isinstance(jumpFiles, list):
+        raise SSScoringError('dict with jump file names and FS versions or list of byte bags expected')
+    if not isinstance(workers, int) or workers < 1:
+        raise SSScoringError('workers must be an int >= 1')
+    if isinstance(jumpFiles, dict):
+        objectsList = sorted(list(jumpFiles.keys()), key=str)
+    elif isinstance(jumpFiles, list):
+        objectsList = jumpFiles
+    obj = objectsList[0]
+    if not isinstance(obj, (Path, str, BytesIO, BundleMember)):
+        raise SSScoringError('jumpFiles must contain file-like things or BytesIO objects')
+    tasks = _bundleMemberTasks(task for task in (_jumpFileTask(jumpFiles, jumpFile) for jumpFile in objectsList) if task)
+    if workers > 1:
+        yield from _pooledJumpResults(tasks, altitudeDZMeters, workers, cacheDir)
+    else:
+        for jumpThing, name in tasks:
+            yield _processJumpFile(jumpThing, name, altitudeDZMeters, cacheDir)
+
+
+def processAllJumpFiles(jumpFiles: list, altitudeDZMeters = 0.0, workers = 1, cacheDir = None) -> dict:
     """
     Process all jump files in a list of valid FlySight files.  Returns a
     dictionary of jump results with a human-readable version of the file name.
@@ -708,7 +1083,13 @@ def processAllJumpFiles(jumpFiles: list, altitudeDZMeters = 0.0) -> dict:
         jumpFiles
     A list of file things that could represent one of these:
     - file things relative or absolute path names to individual FlySight CSV
-      files.
+      files or track archives, e.g. from `ssscoring.trackarchive.getAllTrackArchivesFrom`.
+    - `ssscoring.datatypes.BundleMember` instances for track files in zip,
+      tar, or gzip bundles, e.g. from `getAllSpeedJumpFilesFrom`.  Tar and gzip
+      bundles are decompressed sequentially, see
+      `ssscoring.flysight.readBundleMembers`; zip members are decompressed by
+      the workers, in parallel if `workers > 1`.  Members that can't be read
+      are reported as `JumpStatus.INVALID_SPEED_FILE`.
     - A specialization of BytesIO, such as the bags of bytes that Streamlit.io
       generates after uploading and reading a file into the Streamlit
       environment
@@ -716,54 +1097,208 @@ def processAllJumpFiles(jumpFiles: list, altitudeDZMeters = 0.0) -> dict:
         altitudeDZMeters : float
     Drop zone height above MSL
 
+        workers : int
+    Number of worker processes that parse and score the files.  `1`, the
+    default, processes every file in the calling process, and BytesIO objects
+    are parsed in place from their buffers.  Larger values fan out the per-file
+    work to a process pool; BytesIO objects are passed to the workers as bytes.
+    The results are the same either way.
+
+        cacheDir
+    A string or `pathlib.Path` with an optional cache directory.  If set, the
+    results of converting and scoring each track are looked up in and saved
+    to a content-addressed cache, keyed by the track contents, the DZ
+    elevation, and the scoring rules version.  See `ssscoring.cache`.
+
     Returns
     -------
         dict
     A dictionary of jump results.  The key is a human-readable version of a
     `jumpFile` name with the extension, path, and extraneous spaces eliminated
     or replaced by appropriate characters.  File names use Unicode, so accents
-    and non-ANSI characters are allowed in file names.
+    and non-ANSI characters are allowed in file names.  The dictionary order
+    is the `jumpFiles` order regardless of `workers`.
 
     Raises
     ------
-    `SSScoringError` if the jumpFiles object is empty, or if the individual
+    `SSScoringError` if the jumpFiles object is empty, if the individual
     objects in the list aren't `BytesIO`, file name strings, or `Path`
-    instances.
+    instances, or if `workers` is less than 1.
+
+    See
+    ---
+    `ssscoring.calc.iterJumpResults`
+    """
+    return dict(iterJumpResults(jumpFiles, altitudeDZMeters, workers, cacheDir))
+
+
+def _trackSegmentTag(tag: str, rawFreeFall: pd.DataFrame, segmentIndex: int) -> str:
+    if not segmentIndex:
+        return tag
+    name, suffix = tag.rsplit(':', 1)
+    segmentTag = tagFromFirstTimestampIn(rawFreeFall, suffix)
+    if suffix == 'v1':
+        segmentTag = '%s %s' % (name, segmentTag)
+    return segmentTag
+
+
+def processAllJumpsInTrack(jumpFile, altitudeDZMeters = 0.0) -> dict:
     """
+    Process every speed skydive in a single FlySight track.  FlySight units
+    left powered on across loads produce one track with several free falls;
+    `processJump` only scores the last one.  This function reads and converts
+    the track once, segments it with `freeFallSegmentsFrom`, and scores each
+    free fall segment together with the climb that precedes it.
+
+    Arguments
+    ---------
+        jumpFile
+    A file thing that could represent one of these:
+    - a relative or absolute path name, `str` or `Path`, to a FlySight CSV file
+    - a specialization of BytesIO with a `name` attribute, such as the bags of
+      bytes that Streamlit.io generates after uploading a file
+
+        altitudeDZMeters : float
+    Drop zone height above MSL
+
+    Returns
+    -------
+        dict
+    A dictionary of jump results in track order, one per free fall segment.
+    The first jump uses the same tag as `processAllJumpFiles`; later jumps
+    get tags derived from the timestamp at the start of their free fall:
+
+    - FlySight 1: `<path slug> HH-MM-ss:v1`
+    - FlySight 2: `HH-MM-ss:v2`
+    - Insight: `HH-MM-ss:i`
+
+    Tracks without free fall segments produce a single result, as processed by
+    `processJump`.
+
+    Raises
+    ------
+    `SSScoringError` if `jumpFile` isn't a `BytesIO`, file name string, or
+    `Path` instance.
+
+    See
+    ---
+    `ssscoring.calc.freeFallSegmentsFrom`
+    `ssscoring.calc.processAllJumpFiles`
+    """
+    if isinstance(jumpFile, BytesIO):
+        rawData, tag = getFlySightDataFromCSVBuffer(jumpFile.getbuffer(), jumpFile.name, columns = RAW_TRACK_COLUMNS)
+    elif isinstance(jumpFile, Path) or isinstance(jumpFile, str):
+        rawData, tag = getFlySightDataFromCSVFileName(jumpFile, columns = RAW_TRACK_COLUMNS)
+    else:
+        raise SSScoringError('jumpFile must be a file-like thing or a BytesIO object')
+    if rawData is None:
+        return { tag: JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.UNSUPPORTED_PLD_FORMAT), }
+    try:
+        data = convertFlySight2SSScoring(rawData, altitudeDZMeters = altitudeDZMeters)
+        segments = freeFallSegmentsFrom(data)
+    except Exception:
+        return { tag: JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.INVALID_SPEED_FILE), }
+    freeFalls = segments[segments.freeFall]
+    freeFallStarts = freeFalls.start.to_list() or [ 0, ]
+    # The last jump keeps the trailing canopy data, like processJump() would:
+    freeFallEnds = freeFalls.end.to_list()[:-1]+[ len(data), ]
+
     jumpResults = dict()
-    if not len(jumpFiles):
-        raise SSScoringError('jumpFiles must have at least one element')
-    if not isinstance(jumpFiles, dict) and not isinstance(jumpFiles, list):
-        raise SSScoringError('dict with jump file names and FS versions or list of byte bags expected')
-    if isinstance(jumpFiles, dict):
-        objectsList = sorted(list(jumpFiles.keys()), key=str)
-    elif isinstance(jumpFiles, list):
-        objectsList = jumpFiles
-    obj = objectsList[0]
-    if not isinstance(obj, Path) and not isinstance(obj, str) and not isinstance(obj, BytesIO):
-        raise SSScoringError('jumpFiles must contain file-like things or BytesIO objects')
-    for jumpFile in objectsList:
-        if isinstance(jumpFile, BytesIO):
-            fileName = jumpFile.name
-            if not fileName.upper().endswith('.CSV') or any(x in fileName.upper() for x in ('SENSOR', 'EVENT')):
-                continue
-            rawData, tag = getFlySightDataFromCSVBuffer(jumpFile.getvalue(), jumpFile.name)
-        elif isinstance(jumpFiles, dict) and isinstance(jumpFiles[jumpFile], pd.DataFrame):
-            rawData = jumpFiles[jumpFile]
-            tag = jumpFile
-        else:
-            rawData, tag = getFlySightDataFromCSVFileName(jumpFile)
-        if rawData is None:
-            jumpResults[tag] = JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.UNSUPPORTED_PLD_FORMAT)
-            continue
+    segmentStart = 0
+    for segmentIndex, (freeFallStart, segmentEnd) in enumerate(zip(freeFallStarts, freeFallEnds)):
+        segmentTag = _trackSegmentTag(tag, rawData.iloc[freeFallStart:segmentEnd], segmentIndex)
         try:
-            jumpResult = processJump(convertFlySight2SSScoring(rawData, altitudeDZMeters = altitudeDZMeters))
+            jumpResult = processJump(data.iloc[segmentStart:segmentEnd])
         except Exception:
             jumpResult = JumpResults(None, 0.0, 0.0, None, None, None, JumpStatus.INVALID_SPEED_FILE)
-        jumpResults[tag] = jumpResult
+        jumpResults[segmentTag] = jumpResult
+        segmentStart = segmentEnd
     return jumpResults
 
 
+_COLLATION_TRANCHES = ('5.0', '10.0', '15.0', '20.0', )
+
+
+def _collationRowFrom(jumpResult: JumpResults, column: str) -> dict:
+    # One record per jump: the score, the column value at each time tranche,
+    # and the time and column value of the last table row.  Tranches without
+    # a value are left out and become 0.0 in the collation.
+    times = jumpResult.table.time.to_numpy(dtype = float)
+    values = jumpResult.table[column].to_numpy(dtype = float)
+    row = { 'score': jumpResult.score, }
+    for tranche in _COLLATION_TRANCHES:
+        trancheValues = values[(times == float(tranche)) & ~np.isnan(values)]
+        if len(trancheValues):
+            row[tranche] = trancheValues.mean()
+    row['finalTime'] = times[-1]
+    row['finalValue'] = values[-1]
+    return row
+
+
+def _collationFrom(rows: dict, columns: list) -> pd.DataFrame:
+    # Single construction from the per-jump records, in tag order.
+    if not len(rows):
+        return pd.DataFrame()
+    tags = sorted(rows.keys())
+    collation = pd.DataFrame.from_records([ rows[tag] for tag in tags ], index = tags)
+    collation = collation[[ columnName for columnName in columns if columnName in collation.columns ]]
+    return collation.fillna(0.0)
+
+
+def aggregateRowFrom(jumpResult: JumpResults) -> dict:
+    """
+    Summarize a jump as one row of the `aggregateResults` table.  The rows are
+    small and JSON serializable, so they can be stored instead of the
+    `JumpResults`, e.g. in a data lake manifest, and aggregated later with
+    `aggregateResultsFromRows`.
+
+    Arguments
+    ---------
+        jumpResult
+    A `JumpResults` instance, as returned by `processJump`.
+
+    Returns
+    -------
+    A dictionary with the score, the speeds at every time tranche, the final
+    speed and time, and the max speed, or `None` if the jump status isn't
+    `JumpStatus.OK`.
+
+    See
+    ---
+    `ssscoring.calc.aggregateResultsFromRows`
+    """
+    if jumpResult.status != JumpStatus.OK:
+        return None
+    scoreRow = _collationRowFrom(jumpResult, 'vKMh')
+    finalSpeed = scoreRow.pop('finalValue')
+    scoreRow['finalSpeed'] = finalSpeed if scoreRow['finalTime'] > 20.1 else 0.0
+    scoreRow['maxSpeed'] = jumpResult.maxSpeed
+    return scoreRow
+
+
+def aggregateResultsFromRows(scoreRows: dict) -> pd.DataFrame:
+    """
+    Aggregate jump summaries from `aggregateRowFrom` into the `aggregateResults`
+    table, without the `JumpResults` they came from.
+
+    Arguments
+    ---------
+        scoreRows
+    A dictionary of `aggregateRowFrom` rows, keyed by jump tag.  `None` rows
+    aren't allowed; leave those jumps out.
+
+    Returns
+    -------
+    The same dataframe that `aggregateResults` returns for the jumps.
+
+    See
+    ---
+    `ssscoring.calc.aggregateResults`
+    `ssscoring.calc.aggregateRowFrom`
+    """
+    return _collationFrom(scoreRows, [ 'score', *_COLLATION_TRANCHES, 'finalSpeed', 'finalTime', 'maxSpeed', ])
+
+
 def aggregateResults(jumpResults: dict) -> pd.DataFrame:
     """
     Aggregate all the results in a table fashioned after Marco Hepp's and Nklas
@@ -793,43 +1328,44 @@ def aggregateResults(jumpResults: dict) -> pd.DataFrame:
     if not len(jumpResults):
         raise SSScoringError('jumpResults is empty - impossible to collate angles')
 
-    speeds = pd.DataFrame()
-    for jumpResultIndex in sorted(list(jumpResults.keys())):
-        jumpResult = jumpResults[jumpResultIndex]
-        if jumpResult.status == JumpStatus.OK:
-            jumpTable = jumpResult.table.copy()
-            finalTime = jumpTable.iloc[-1].time
+    scoreRows = { tag: aggregateRowFrom(jumpResult) for tag, jumpResult in jumpResults.items() }
+    return aggregateResultsFromRows({ tag: scoreRow for tag, scoreRow in scoreRows.items() if scoreRow is not None })
 
-            if finalTime > 20.1:
-                finalSpeed = jumpTable.iloc[-1].vKMh
-                jumpTable.iloc[-1].time = LAST_TIME_TRANCHE   # keep LAST_TIME_TRANCHE for pivoting
-            else:
-                finalSpeed = None
 
-            jumpTable = pd.pivot_table(jumpTable, columns=jumpTable.time)
-            jumpTable.columns = [str(columnName) for columnName in jumpTable.columns]
-            scoreRow = pd.DataFrame([jumpResult.score], index=[jumpResultIndex], columns=['score'])
+def aggregateResultsFrom(jumpResults) -> pd.DataFrame:
+    """
+    Streaming version of `aggregateResults`.  Consumes `(tag, JumpResults)`
+    tuples one at a time, e.g. from `iterJumpResults`, and keeps only the
+    one-row summary of each jump; the `JumpResults` themselves can be garbage
+    collected as soon as they're aggregated.
 
-            for column in jumpTable.columns:
-                scoreRow[column] = jumpTable[column].vKMh
+    Arguments
+    ---------
+        jumpResults
+    An iterable of `(tag, JumpResults)` tuples.  A repeated tag replaces the
+    earlier result, like it would in a `dict`.
 
-            scoreRow['finalTime'] = [finalTime]
-            scoreRow['maxSpeed'] = jumpResult.maxSpeed
+    Returns
+    -------
+    The same dataframe that `aggregateResults` returns for the equivalent
+    dictionary.
 
-            if finalSpeed is not None:
-                scoreRow['finalSpeed'] = [finalSpeed]
-            else:
-                scoreRow['finalSpeed'] = [scoreRow.get('25.0', [0.0])[0]]
+    Raises
+    ------
+    `SSScoringError` if `jumpResults` yields no results.
 
-            if speeds.empty:
-                speeds = scoreRow.copy()
-            else:
-                speeds = pd.concat([speeds, scoreRow])
+    See
+    ---
+    `ssscoring.calc.aggregateResults`
+    `ssscoring.calc.iterJumpResults`
+    """
+    scoreRows = dict()
+    for tag, jumpResult in jumpResults:
+        scoreRows[tag] = aggregateRowFrom(jumpResult)
+    if not len(scoreRows):
+        raise SSScoringError('jumpResults is empty - impossible to collate angles')
 
-    cols = ['score', '5.0', '10.0', '15.0', '20.0', 'finalSpeed', 'finalTime', 'maxSpeed']
-    speeds = speeds[[columnName for columnName in cols if columnName in speeds.columns]]
-    speeds = speeds.replace(np.nan, 0.0)
-    return speeds.sort_index()
+    return aggregateResultsFromRows({ tag: scoreRow for tag, scoreRow in scoreRows.items() if scoreRow is not None })
 
 
 def roundedAggregateResults(aggregate: pd.DataFrame) -> pd.DataFrame:
@@ -896,37 +1432,14 @@ def collateAnglesByTimeFromExit(jumpResults: dict) -> pd.DataFrame:
     if not len(jumpResults):
         raise SSScoringError('jumpResults is empty - impossible to collate angles')
 
-    angles = pd.DataFrame()
-    for jumpResultIndex in sorted(list(jumpResults.keys())):
-        jumpResult = jumpResults[jumpResultIndex]
+    angleRows = dict()
+    for tag, jumpResult in jumpResults.items():
         if jumpResult.status == JumpStatus.OK:
-            jumpTable = jumpResult.table.copy()                    # ← critical: avoid mutation
-
-            finalTime = jumpTable.iloc[-1].time
-            finalAngle = jumpTable.iloc[-1].speedAngle
-
-            jumpTable.iloc[-1].time = LAST_TIME_TRANCHE
-
-            jumpTable = pd.pivot_table(jumpTable, columns=jumpTable.time)
-            jumpTable.columns = [str(columnName) for columnName in jumpTable.columns]
-            scoreRow = pd.DataFrame([jumpResult.score], index=[jumpResultIndex], columns=['score'])
-
-            for column in jumpTable.columns:
-                scoreRow[column] = jumpTable[column].speedAngle
-
-            scoreRow['finalTime'] = [finalTime]
-            scoreRow['finalAngle'] = [finalAngle]                 # ← new clean column
-
-            if angles.empty:
-                angles = scoreRow.copy()
-            else:
-                angles = pd.concat([angles, scoreRow])
-
-    cols = ['score', '5.0', '10.0', '15.0', '20.0', 'finalAngle', 'finalTime']
-    angles = angles[[columnName for columnName in cols if columnName in angles.columns]]
-    angles = angles.replace(np.nan, 0.0)
+            angleRow = _collationRowFrom(jumpResult, 'speedAngle')
+            angleRow['finalAngle'] = angleRow.pop('finalValue')
+            angleRows[tag] = angleRow
 
-    return angles.sort_index()
+    return _collationFrom(angleRows, [ 'score', *_COLLATION_TRANCHES, 'finalAngle', 'finalTime', ])
 
 
 def totalResultsFrom(aggregate: pd.DataFrame) -> pd.DataFrame:
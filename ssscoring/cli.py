@@ -6,11 +6,13 @@ Command line tools package.
 
 
 from ssscoring import __VERSION__
-from ssscoring.calc import aggregateResults
-from ssscoring.calc import processAllJumpFiles
+from ssscoring.calc import aggregateResultsFrom
+from ssscoring.calc import iterJumpResults
 from ssscoring.calc import roundedAggregateResults
 from ssscoring.constants import FT_IN_M
 from ssscoring.flysight import getAllSpeedJumpFilesFrom
+from ssscoring.manifest import aggregateResultsFromManifest
+from ssscoring.manifest import updateManifest
 
 import os
 import pathlib
@@ -82,7 +84,13 @@ def _assertDataLake(dataLake: str, isUnitTest = False) -> bool:
     return retVal
 
 
-def ssscore(elevation: float, trainingOutput: bool, dataLake: str) -> int:
+def _collectTags(jumpResults, tags: set):
+    for tag, jumpResult in jumpResults:
+        tags.add(tag)
+        yield tag, jumpResult
+
+
+def ssscore(elevation: float, trainingOutput: bool, dataLake: str, workers: int = 1, useManifest: bool = False, cacheDir: str = None) -> int:
     """
     Process all the speed skydiving files contained in `dataLakeSpec`.  This
     function implements the business logic for the `/usr/local/bin/ssscore`
@@ -99,27 +107,46 @@ def ssscore(elevation: float, trainingOutput: bool, dataLake: str) -> int:
         dataLake
     Command line argument with the path to the data lake.
 
+        workers
+    Number of worker processes used for scoring the track files.
+
+        useManifest
+    If `True`, keep a manifest in the data lake and only process the track
+    files that are new or changed since the previous run.  See
+    `ssscoring.manifest`.
+
+        cacheDir
+    Optional cache directory for the scored tracks.  Tracks already scored with
+    the same contents and elevation are read from the cache instead of being
+    processed again.  See `ssscoring.cache`.
+
     Returns
     -------
     The number of jump results from processing all the FlySight files in the
-    data lake.
+    data lake.  Files with the same tag count once, like in the dictionary that
+    `ssscoring.calc.processAllJumpFiles` returns.
     """
     _assertDataLake(dataLake)
 
     elevationMeters = elevation/FT_IN_M
     click.secho("elevation = %.2f m (%.2f')" % (elevationMeters, elevation))
     click.secho('Processing speed tracks in %s...\n' % dataLake)
-    jumpResults = processAllJumpFiles(getAllSpeedJumpFilesFrom(dataLake), altitudeDZMeters=elevationMeters)
-    if jumpResults:
-        if trainingOutput:
-            resultsSummary = roundedAggregateResults(aggregateResults(jumpResults))
-        else:
-            resultsSummary = aggregateResults(jumpResults)
-        click.secho(resultsSummary, fg = 'bright_green')
-        click.secho('\nTotal score = %5.2f, mean speed = %5.2f\n' % (resultsSummary.score.sum(), resultsSummary.score.mean()), fg = 'bright_white')
+    # Results are aggregated as they stream in; memory use doesn't grow with
+    # the number of track files in the data lake.
+    if useManifest:
+        manifest, updated = updateManifest(dataLake, altitudeDZMeters=elevationMeters, workers=workers, cacheDir=cacheDir)
+        click.secho('%d new or changed track files\n' % len(updated))
+        jumpTags = { entry.get('tag') for entry in manifest.values() }
+        resultsSummary = aggregateResultsFromManifest(manifest)
     else:
-        click.secho('There were no speed track files to score in %s', fg = 'bright_red')
-    return len(jumpResults)
+        jumpTags = set()
+        jumpResults = iterJumpResults(getAllSpeedJumpFilesFrom(dataLake), altitudeDZMeters=elevationMeters, workers=workers, cacheDir=cacheDir)
+        resultsSummary = aggregateResultsFrom(_collectTags(jumpResults, jumpTags))
+    if trainingOutput:
+        resultsSummary = roundedAggregateResults(resultsSummary)
+    click.secho(resultsSummary, fg = 'bright_green')
+    click.secho('\nTotal score = %5.2f, mean speed = %5.2f\n' % (resultsSummary.score.sum(), resultsSummary.score.mean()), fg = 'bright_white')
+    return len(jumpTags)
 
 
 @click.command('ssscore')
@@ -127,8 +154,11 @@ def ssscore(elevation: float, trainingOutput: bool, dataLake: str) -> int:
 @click.version_option(__VERSION__, prog_name = 'ssscore')
 @click.option('-e', '--elevation', default=0.0, show_default=True, help='DZ elevation in ft')
 @click.option('-t', '--training', is_flag=True, show_default=True, default=False, help='Show training output values')
-def _ssscoreCommand(elevation: float, training: bool, datalake: str) -> int:
-    return ssscore(elevation, training, datalake)
+@click.option('-w', '--workers', default=1, show_default=True, type=click.IntRange(min=1), help='Worker processes for scoring track files')
+@click.option('-m', '--manifest', is_flag=True, show_default=True, default=False, help='Only process new or changed track files')
+@click.option('-c', '--cache', default=None, type=click.STRING, help='Cache directory for scored track files')
+def _ssscoreCommand(elevation: float, training: bool, datalake: str, workers: int, manifest: bool, cache: str) -> int:
+    return ssscore(elevation, training, datalake, workers, manifest, cache)
 
 
 # +++ main +++
@@ -16,6 +16,21 @@ BREAKOFF_ALTITUDE = 1707.0
 Breakoff altitude or hard deck.
 """
 
+BUNDLE_PENDING_MAX_BYTES = 1024*1024*64
+"""
+Memory bound for the tar bundle members read ahead of their turn, when members
+aren't stored in the order in which they're requested.  Members beyond it are
+read on a later pass over the bundle.  See `ssscoring.flysight.readBundleMembers`.
+"""
+
+CACHE_MAX_BYTES = 1024*1024*256
+"""
+Size bound for the scored tracks cache directory.  The least recently used
+entries are evicted when the cache grows beyond this size.  See
+`ssscoring.cache`.
+"""
+
+
 DEFAULT_PLOT_INCREMENT = 75.0
 """
 Used to adjust the plot's max scale to `score` + `DEFAULT_PLOT_INCREMENT` so
@@ -42,6 +57,13 @@ See
     ssscoring.appcommon
 """
 
+CR_REPAIR_CHUNK_SIZE = 1024*1024
+"""
+Size of the chunks in which CR mangled track files are read and repaired.  See
+`ssscoring.flysight.fixCRMangledCSV` and `ssscoring.flysight.CRNormalizingReader`.
+"""
+
+
 DEG_IN_RADIANS = math.pi/180.0
 """
 π/180º
@@ -54,6 +76,13 @@ The CSV file database dump of the drop zones directory.
 """
 
 
+EARTH_RADIUS = 6371008.8
+"""
+Mean Earth radius in meters (IUGG), used for the spherical Earth calculations
+in `ssscoring.geodesy`.
+"""
+
+
 EXIT_SPEED = 10.0
 """
 Guesstimate of the exit speed; ~g
@@ -92,6 +121,14 @@ Number of feet in a meter.
 """
 
 
+HEADER_PREFIX_SIZE = 512
+"""
+Number of bytes read from the beginning of a track file to classify it during
+data lake discovery.  Large enough for the FlySight 1, FlySight 2, and Insight
+header lines.
+"""
+
+
 IGNORE_LIST = [ '.ipynb_checkpoints', ]
 """
 Internal use - list of files to be ignored during bulk file processing in the
@@ -112,6 +149,13 @@ vSpeed < 400 km/h.
 """
 
 
+MANIFEST_FILE_NAME = '.ssscoring-manifest.jsonl'
+"""
+Name of the JSON lines data lake manifest, stored in the data lake root
+directory.  See `ssscoring.manifest`.
+"""
+
+
 MAX_VALID_ELEVATION = 4602.0
 """
 Max valid elevation allowed in the FlySight or FlySsight 2 time series.  Speed
@@ -169,6 +213,12 @@ to UNSAFE_HORIZONTAL_COLOR.
 """
 
 
+TRACK_ARCHIVE_SUFFIX = '.sstrack'
+"""
+File name suffix of the columnar track archives.  See `ssscoring.trackarchive`.
+"""
+
+
 UNSAFE_HORIZONTAL_COLOR = '#D55E00'
 """
 Okabe-Ito vermillion — colorblind-safe indicator used for forward
@@ -183,6 +233,20 @@ Meters to feet conversion factor.
 """
 
 
+MIN_FREE_FALL_MAX_SPEED = 200.0
+"""
+Minimum max vertical speed, in km/h, for a run of descending data points to
+qualify as free fall.  Heuristic; slower runs are canopy flight, climbs, etc.
+"""
+
+
+MIN_FREE_FALL_SAMPLES = 100
+"""
+Minimum number of consecutive descending data points for a run to qualify as
+free fall.  Heuristic.
+"""
+
+
 MIN_JUMP_FILE_SIZE = 1024*512
 MIN_JUMP_FILE_SIZE = 1024*64
 """
@@ -209,6 +273,15 @@ Performance window length as defined by ISSA/IPC/USPA.
 """
 
 
+RAW_TRACK_COLUMNS = ('time', 'lat', 'lon', 'hMSL', 'velN', 'velE', 'velD', 'vAcc', 'sAcc', )
+"""
+The raw FlySight 1, FlySight 2, and Insight track columns consumed by the
+scoring pipeline in `ssscoring.calc.convertFlySight2SSScoring`.  The readers in
+`ssscoring.flysight` can project the track files onto these columns so that the
+rest aren't parsed.
+"""
+
+
 RESOURCES = 'ssscoring.resources'
 """
 The package resources in the manifest or package wheel resources.
@@ -8,6 +8,9 @@ SSScoring custom type definitions for easier symbolic manipuation.
 from collections import namedtuple
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
 
 # +++ implementation +++
 
@@ -32,8 +35,8 @@ class JumpStatus(Enum):
 
 JumpResults = namedtuple(
     'JumpResults',
-    'data maxSpeed score scores table window status backFall backFallOnset forwardReversalM lateralReversalM',
-    defaults=(False, None, 0.0, 0.0),
+    'data maxSpeed score scores table window status backFall backFallOnset forwardReversalM lateralReversalM jumpRunBearing',
+    defaults=(False, None, 0.0, 0.0, None),
 )
 """
 A named tuple containing the score, maximum speed, scores throught the
@@ -43,7 +46,8 @@ result, and the result information string.
 Attributes
 ----------
 - `data` - dataframe containing all the data points for plotting and
-           calculations
+           calculations, including the `forwardM` and `lateralM` ground track
+           displacement from exit
 - `maxSpeed` - maximum absolute speed registered during a skydive
 - `score` - maximum mean speed during a 3-second window during the skydive
 - `scores` - a dictionary with all the scored ruding the sliding 3-sec window
@@ -55,6 +59,7 @@ Attributes
 - `backFallOnset` - `plotTime` (seconds from exit) at back-fall onset, or `None`
 - `forwardReversalM` - metres of reversed ground travel along the jump run axis
 - `lateralReversalM` - metres of reversed ground travel on the lateral axis
+- `jumpRunBearing` - jump run bearing in degrees [0, 360), or `None`
 """
 
 
@@ -77,3 +82,252 @@ See
     ssscoring.constants.VALIDATION_WINDOW_END
 """
 
+
+class BundleMember(namedtuple('BundleMember', 'bundle member')):
+    """
+    A track file inside a zip, tar, or gzip bundle, e.g. a season's worth of
+    FlySight 2 directories sent as a single `.zip` or `.tar.gz` file.  Bundle
+    members are read without extracting them to the file system.
+
+    Attributes
+    ----------
+    - `bundle` - `pathlib.Path` of the bundle file
+    - `member` - `str` with the POSIX path of the track file inside the bundle
+
+    Its string representation is `bundle/member`, e.g.
+    `lake/season.zip/06-12-01/TRACK.CSV`.
+
+    See
+    ---
+        ssscoring.flysight.getAllSpeedJumpFilesFrom
+        ssscoring.flysight.readBundleMember
+    """
+    __slots__ = ()
+
+
+    def __str__(self) -> str:
+        return '%s/%s' % (self.bundle.as_posix(), self.member)
+
+
+    def as_posix(self) -> str:
+        return str(self)
+
+
+TrackFormat = namedtuple('TrackFormat', 'version signature columns excluded reader tag')
+"""
+A track file format declaration for the `ssscoring.flysight` format registry.
+A file is in the format if it starts with the `signature` bytes and its column
+header has all the `columns` and none of the `excluded` columns.  The column
+header is the first line of plain CSV files, or the fields of all the `$COL`
+lines in FlySight 2 files.
+
+Attributes
+----------
+- `version` - an instance of `FlySightVersion`
+- `signature` - `bytes` prefix of the files in this format, e.g. `b'$FLYS'`;
+                `b''` for plain CSV files
+- `columns` - `frozenset` of required column header names
+- `excluded` - `frozenset` of column header names that rule the format out
+- `reader` - `reader(fileThing, columns = None, engine = None)` function that
+             returns the raw track dataframe
+- `tag` - `tag(rawData, name)` function that returns the track tag
+
+See
+---
+    ssscoring.flysight.registerTrackFormat
+    ssscoring.flysight.trackFormatOf
+"""
+
+
+_DOUBLE_PRECISION_COLUMNS = frozenset(( 'timeUnix', 'latitude', 'longitude', ))
+
+
+def _framePartsFrom(data: pd.DataFrame, columns: list, dtype) -> tuple:
+    if not columns:
+        return (tuple(), np.empty((0, len(data)), dtype = dtype))
+    return (tuple(columns), np.ascontiguousarray(data[columns].to_numpy(dtype = dtype).T))
+
+
+class CompactJumpResults:
+    """
+    Compact, array-backed equivalent of `JumpResults`, for holding the results
+    of many jumps in memory (e.g. a whole season of tracks).  The jump data and
+    the results table are stored as contiguous 2D NumPy arrays with one row per
+    column, and the scores as parallel `scoreValues` and `scoreTimes` arrays
+    instead of a dictionary.
+
+    Build instances with `CompactJumpResults.fromJumpResults()` and convert them
+    back with `toJumpResults()` for use with the plotting, reporting, and
+    aggregation functions, all of which take `JumpResults`.
+
+    Attributes
+    ----------
+    - `dataColumns` - tuple of the `data` column names, in their original order
+    - `doubles` - float64 array with the `timeUnix`, `latitude`, and `longitude`
+                  samples, one row per column
+    - `samples` - array with the rest of the samples, one row per column, in
+                  the precision chosen at construction
+    - `dataIndex` - the `data` index labels
+    - `maxSpeed`, `score`, `window`, `status`, `backFall`, `backFallOnset`,
+      `forwardReversalM`, `lateralReversalM`, `jumpRunBearing` - same as in
+      `JumpResults`
+    - `scoreValues`, `scoreTimes` - float64 arrays with the `scores` entries,
+                                    score and `plotTime`, or with every valid
+                                    scoring window if built with `scoreWindows`
+    - `tableColumns`, `tableValues`, `tableIndex` - the results table
+
+    `doubles`, `samples`, and `dataIndex` are `None` if the jump had no data or
+    if the raw samples were dropped.
+
+    See
+    ---
+        ssscoring.datatypes.JumpResults
+    """
+    __slots__ = (
+        'dataColumns',
+        'doubles',
+        'samples',
+        'dataIndex',
+        'maxSpeed',
+        'score',
+        'scoreValues',
+        'scoreTimes',
+        'tableColumns',
+        'tableValues',
+        'tableIndex',
+        'window',
+        'status',
+        'backFall',
+        'backFallOnset',
+        'forwardReversalM',
+        'lateralReversalM',
+        'jumpRunBearing',
+    )
+
+
+    @classmethod
+    def fromJumpResults(cls, jumpResult: JumpResults, keepSamples = True, dtype = np.float64, scoreWindows: pd.DataFrame = None):
+        """
+        Build a compact representation of a jump's results.
+
+        Arguments
+        ---------
+            jumpResult
+        A `JumpResults` instance, as returned by `ssscoring.calc.processJump`.
+
+            keepSamples
+        If `False`, drop the raw samples (`data`) and keep only the scores,
+        results table, and jump metrics.  Default: `True`.
+
+            dtype
+        NumPy float type for the samples other than time and coordinates, which
+        are always float64.  `np.float32` halves the memory footprint of the
+        samples at the cost of a lossy round trip.  Default: `np.float64`.
+
+            scoreWindows
+        Optional scoring windows of the jump, as returned by
+        `ssscoring.calc.scoringWindowsISC`, to store instead of
+        `jumpResult.scores`.  The `scores` dictionary is keyed by speed, so it
+        merges windows with tied scores; the windows keep them.  Default: `None`.
+
+        Returns
+        -------
+        A `CompactJumpResults` instance.
+        """
+        result = cls()
+        data = jumpResult.data
+        if data is None:
+            result.dataColumns = None
+        else:
+            result.dataColumns = tuple(data.columns)
+        if data is None or not keepSamples:
+            result.doubles = None
+            result.samples = None
+            result.dataIndex = None
+        else:
+            _, result.doubles = _framePartsFrom(data, [ column for column in data.columns if column in _DOUBLE_PRECISION_COLUMNS ], np.float64)
+            _, result.samples = _framePartsFrom(data, [ column for column in data.columns if column not in _DOUBLE_PRECISION_COLUMNS ], dtype)
+            result.dataIndex = data.index.to_numpy()
+        if jumpResult.scores is None:
+            result.scoreValues = None
+            result.scoreTimes = None
+        elif scoreWindows is not None:
+            scoreWindows = scoreWindows[scoreWindows.valid]
+            result.scoreValues = scoreWindows.score.to_numpy(dtype = np.float64)
+            result.scoreTimes = scoreWindows.plotTime.to_numpy(dtype = np.float64)
+        else:
+            result.scoreValues = np.fromiter(jumpResult.scores.keys(), dtype = np.float64, count = len(jumpResult.scores))
+            result.scoreTimes = np.fromiter(jumpResult.scores.values(), dtype = np.float64, count = len(jumpResult.scores))
+        if jumpResult.table is None:
+            result.tableColumns = None
+            result.tableValues = None
+            result.tableIndex = None
+        else:
+            result.tableColumns, result.tableValues = _framePartsFrom(jumpResult.table, list(jumpResult.table.columns), np.float64)
+            result.tableIndex = jumpResult.table.index.to_numpy()
+        result.maxSpeed = jumpResult.maxSpeed
+        result.score = jumpResult.score
+        result.window = jumpResult.window
+        result.status = jumpResult.status
+        result.backFall = jumpResult.backFall
+        result.backFallOnset = jumpResult.backFallOnset
+        result.forwardReversalM = jumpResult.forwardReversalM
+        result.lateralReversalM = jumpResult.lateralReversalM
+        result.jumpRunBearing = jumpResult.jumpRunBearing
+        return result
+
+
+    @property
+    def hasSamples(self) -> bool:
+        """
+        `True` if the raw samples are available.
+        """
+        return self.samples is not None
+
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Number of bytes held by the arrays in this instance.
+        """
+        arrays = (self.doubles, self.samples, self.dataIndex, self.scoreValues, self.scoreTimes, self.tableValues, self.tableIndex, )
+        return sum(array.nbytes for array in arrays if array is not None)
+
+
+    def toJumpResults(self) -> JumpResults:
+        """
+        Convert to a `JumpResults` named tuple.  The `data` dataframe is `None`
+        if the raw samples were dropped.  Samples stored in float32 are widened
+        back to float64.
+
+        Returns
+        -------
+        A `JumpResults` instance.
+        """
+        data = None
+        if self.hasSamples:
+            columns = dict()
+            doubles = iter(self.doubles)
+            samples = iter(self.samples)
+            for column in self.dataColumns:
+                values = next(doubles) if column in _DOUBLE_PRECISION_COLUMNS else next(samples)
+                columns[column] = values.astype(np.float64)
+            data = pd.DataFrame(columns, index = pd.Index(self.dataIndex), columns = list(self.dataColumns))
+        scores = None if self.scoreValues is None else dict(zip(self.scoreValues, self.scoreTimes))
+        table = None
+        if self.tableValues is not None:
+            table = pd.DataFrame(self.tableValues.T.copy(), index = pd.Index(self.tableIndex), columns = list(self.tableColumns))
+        return JumpResults(
+            data,
+            self.maxSpeed,
+            self.score,
+            scores,
+            table,
+            self.window,
+            self.status,
+            self.backFall,
+            self.backFallOnset,
+            self.forwardReversalM,
+            self.lateralReversalM,
+            self.jumpRunBearing,
+        )
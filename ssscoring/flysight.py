@@ -9,32 +9,55 @@ local or cloud-based).
 
 
 from collections import OrderedDict
-from io import StringIO
+from io import BufferedReader
+from io import RawIOBase
+from io import TextIOBase
 from pathlib import Path
 
+from ssscoring.constants import BUNDLE_PENDING_MAX_BYTES
+from ssscoring.constants import CR_REPAIR_CHUNK_SIZE
 from ssscoring.constants import FLYSIGHT_1_HEADER
 from ssscoring.constants import FLYSIGHT_2_HEADER
 from ssscoring.constants import FLYSIGHT_FILE_ENCODING
+from ssscoring.constants import HEADER_PREFIX_SIZE
 from ssscoring.constants import INSIGHT_1_HEADER
 from ssscoring.constants import IGNORE_LIST
 from ssscoring.constants import MIN_JUMP_FILE_SIZE
+from ssscoring.datatypes import BundleMember
 from ssscoring.datatypes import FlySightVersion
+from ssscoring.datatypes import TrackFormat
 from ssscoring.errors import SSScoringError
 
-import csv
+import gzip
 import os
 import shutil
+import tarfile
 import tempfile
+import zipfile
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
 
-# +++ functions +++
 
-def _isInsightHeader(header: list) -> bool:
-    return INSIGHT_1_HEADER.issubset(set(header)) and 'cAcc' not in header
+# +++ constants +++
+
+_TRACK_COLUMN_NAMES = FLYSIGHT_1_HEADER | set(FLYSIGHT_2_HEADER) | INSIGHT_1_HEADER
+_TRACK_TEXT_COLUMNS = ('GNSS', 'time', )
+_FLYSIGHT_2_SIGNATURE = b'$FLYS'
+_FLYSIGHT_2_DATA_MARKER = b'\n$DATA'
+_FLYSIGHT_2_HEADER_ROWS = 6
+_CR_MANGLED_EOL = b'\r\r\n'
+_TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz', )
 
 
+# +++ functions +++
+
 def isCRMangledCSV(fileThing) -> bool:
     """
     Tests if `fileThing` is an Excel or Dropbox DOS file with lines terminated
@@ -51,17 +74,77 @@ def isCRMangledCSV(fileThing) -> bool:
     Returns
     -------
     `True` if the file has one or more lines ending in CRCRLF within the first
-    512 bytes of data.
+    `HEADER_PREFIX_SIZE` bytes of data.
+    """
+    with open(fileThing, 'rb') as inputFile:
+        return _CR_MANGLED_EOL in inputFile.read(HEADER_PREFIX_SIZE)
+
+
+def _normalizedChunksFrom(inputFile, chunkSize: int):
+    # Trailing CRs are carried over to the next chunk in case a CRCRLF is split
+    # across the chunk boundary.
+    carry = b''
+    while True:
+        chunk = inputFile.read(chunkSize)
+        if not chunk:
+            break
+        chunk = (carry+chunk).replace(_CR_MANGLED_EOL, b'\r\n')
+        end = max(len(chunk.rstrip(b'\r')), len(chunk)-2)
+        carry = chunk[end:]
+        if end:
+            yield chunk[:end]
+    if carry:
+        yield carry
+
+
+class CRNormalizingReader(RawIOBase):
+    """
+    Read-only binary stream that replaces all the `\r\r\n` EOL markers with
+    `\r\n` on the fly, so that CR mangled files can be parsed without fixing
+    them on disk first.  Wrap it in an `io.BufferedReader` for line-oriented
+    reading.
+
+    Arguments
+    ---------
+        inputFile
+    A binary file-like object with the CR mangled file contents.
+
+        chunkSize
+    Size of the chunks read from `inputFile`.  Default: `CR_REPAIR_CHUNK_SIZE`.
+
+    See
+    ---
+    `ssscoring.flysight.isCRMangledCSV`
     """
-    with open (fileThing, 'rb') as file:
-        rawData = file.read()
-        return b'\r\r\n' in rawData
+    def __init__(self, inputFile, chunkSize = CR_REPAIR_CHUNK_SIZE):
+        self._chunks = _normalizedChunksFrom(inputFile, chunkSize)
+        self._pending = b''
+        self._position = 0
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def readinto(self, target) -> int:
+        while self._position >= len(self._pending):
+            self._pending = next(self._chunks, None)
+            self._position = 0
+            if self._pending is None:
+                self._pending = b''
+                return 0
+        size = min(len(target), len(self._pending)-self._position)
+        target[:size] = self._pending[self._position:self._position+size]
+        self._position += size
+        return size
 
 
-def fixCRMangledCSV(fileThing):
+def fixCRMangledCSV(fileThing, chunkSize = CR_REPAIR_CHUNK_SIZE):
     """
-    Open the file associated with `fileThing` and repleace all`\r\r\b` with
-    `\r\n` EOL markers.
+    Open the file associated with `fileThing` and repleace all`\r\r\n` with
+    `\r\n` EOL markers.  The file is rewritten in chunks of `chunkSize` bytes
+    to a temporary file in the same directory, which then replaces the original
+    atomically.
 
     Arguments
     ---------
@@ -69,18 +152,27 @@ def fixCRMangledCSV(fileThing):
     A string or `pathlib.Path` object associated with what looks like a FlySight
     CR mangled file.
 
+        chunkSize
+    Size of the chunks read and written.  Default: `CR_REPAIR_CHUNK_SIZE`.
+
     See
     ---
     `ssscoring.flysight.isCRMangledCSV`
+    `ssscoring.flysight.CRNormalizingReader`
     """
-    with open(fileThing, 'rb') as inputFile:
-        fileContents = inputFile.read()
-    fileContents = fileContents.replace(b'\r\r\n', b'\r\n')
-    with tempfile.NamedTemporaryFile(delete = False) as outputFile:
-        outputFile.write(fileContents)
+    fileThing = Path(fileThing)
+    with open(fileThing, 'rb') as inputFile, \
+         tempfile.NamedTemporaryFile(dir = fileThing.parent, prefix = '.%s.' % fileThing.stem, suffix = '.tmp', delete = False) as outputFile:
         tempFileName = outputFile.name
-    shutil.copy(tempFileName, fileThing)
-    os.unlink(tempFileName)
+        try:
+            for chunk in _normalizedChunksFrom(inputFile, chunkSize):
+                outputFile.write(chunk)
+        except BaseException:
+            outputFile.close()
+            os.unlink(tempFileName)
+            raise
+    shutil.copymode(fileThing, tempFileName)
+    os.replace(tempFileName, fileThing)
 
 
 def skipOverFS2MetadataRowsIn(data: pd.DataFrame) -> pd.DataFrame:
@@ -106,12 +198,13 @@ def skipOverFS2MetadataRowsIn(data: pd.DataFrame) -> pd.DataFrame:
 
 def validFlySightHeaderIn(fileThingCSV) -> bool:
     """
-    Checks if a file is a CSV in FlySight 1 or FlySight 2 formats.  The checks
-    include:
+    Checks if a file is a CSV in FlySight 1, FlySight 2, Insight, or any other
+    registered track format.  Only the first `HEADER_PREFIX_SIZE` bytes of the
+    file are read.  The checks include:
 
-    - Whether the file is a CSV, using a comma delimiter
-    - Checks for the presence of all the documented FlySight 1 headers
     - Checks for the presence of the FlySight 2 line 1 identifier
+    - Checks for the presence of all the documented FlySight 1 or Insight
+      headers in the comma delimited header line
 
     Arguments
     ---------
@@ -123,30 +216,249 @@ def validFlySightHeaderIn(fileThingCSV) -> bool:
     -------
     `True` if `fileThingCSV` is a FlySight CSV file, otherwise `False`.
     """
-    delimiters = [',']
-
-    if isinstance(fileThingCSV, bytes):
-        stream = StringIO(fileThingCSV.decode(FLYSIGHT_FILE_ENCODING))
+    if isinstance(fileThingCSV, (bytes, bytearray, memoryview)):
+        prefix = headerPrefixIn(fileThingCSV)
     else:
-        stream = open(fileThingCSV, 'r')
+        prefix = _headerPrefixOf(fileThingCSV)
+    return trackFormatOf(prefix) is not None
+
+
+def _headerColumnsIn(prefix: bytes) -> frozenset:
+    # Column header names:  the first line of plain CSV files, or the fields of
+    # every $COL line in FlySight 2 files.
+    lines = prefix.splitlines()
+    if not lines:
+        return frozenset()
+    if lines[0].startswith(b'$'):
+        fields = [ field for line in lines if line.startswith(b'$COL,') for field in line.split(b',')[1:] ]
+    else:
+        fields = lines[0].split(b',')
+    return frozenset(field.strip().decode(FLYSIGHT_FILE_ENCODING, errors = 'replace') for field in fields)
 
-    with stream:
-        try:
-            dialect = csv.Sniffer().sniff(stream.readline(), delimiters=delimiters)
-        except csv.Error:
-            return False
 
-        if dialect.delimiter not in delimiters:
-            return False
-        stream.seek(0)
-        try:
-            header = next(csv.reader(stream))
-        except StopIteration:
-            return False
-    return header[0] == '$FLYS' or FLYSIGHT_1_HEADER.issubset(header) or _isInsightHeader(header)
+def trackFormatOf(prefix: bytes) -> TrackFormat:
+    """
+    Look up the track format of a file in the format registry, from the file's
+    first bytes.
+
+    Arguments
+    ---------
+        prefix
+    The first bytes of a track file, up to `HEADER_PREFIX_SIZE`.  It must
+    include the column header lines.
+
+    Returns
+    -------
+    The first registered `TrackFormat` that matches the file, or `None`.
+
+    See
+    ---
+    `ssscoring.flysight.registerTrackFormat`
+    """
+    columns = _headerColumnsIn(prefix)
+    for trackFormat in _TRACK_FORMATS:
+        if prefix.startswith(trackFormat.signature) and trackFormat.columns <= columns and not (trackFormat.excluded & columns):
+            return trackFormat
+    return None
 
 
-def getAllSpeedJumpFilesFrom(dataLake: Path) -> dict:
+def registerTrackFormat(trackFormat: TrackFormat):
+    """
+    Add a track format, e.g. the reader for a new device, to the format
+    registry.  Formats registered later are matched after the built-in
+    FlySight 2, FlySight 1, and Insight formats.
+
+    Arguments
+    ---------
+        trackFormat
+    A `TrackFormat` instance.
+
+    Raises
+    ------
+    `SSScoringError` if `trackFormat` isn't a `TrackFormat`.
+    """
+    if not isinstance(trackFormat, TrackFormat):
+        raise SSScoringError('trackFormat must be an instance of TrackFormat')
+    _TRACK_FORMATS.append(trackFormat)
+
+
+def _cutAtLastEOL(prefix: bytes) -> bytes:
+    # Cut at the last EOL so that a multibyte character or a partial line never
+    # reaches the header detection.
+    eol = prefix.rfind(b'\n')
+    return prefix[:eol+1] if eol >= 0 else prefix
+
+
+def _headerPrefixOf(fileName: Path) -> bytes:
+    with open(fileName, 'rb') as inputFile:
+        return _cutAtLastEOL(inputFile.read(HEADER_PREFIX_SIZE))
+
+
+def headerPrefixIn(buffer) -> bytes:
+    """
+    Get the header prefix of a track file buffer, as expected by
+    `trackFormatOf`:  the first `HEADER_PREFIX_SIZE` bytes, cut at the last
+    end of line.
+
+    Arguments
+    ---------
+        buffer
+    A bytes-like object with the contents of a track file.
+
+    Returns
+    -------
+    A `bytes` object with the complete lines in the header prefix.
+    """
+    with memoryview(buffer) as view:
+        return _cutAtLastEOL(bytes(view[:HEADER_PREFIX_SIZE]))
+
+
+class _MemoryViewReader(RawIOBase):
+    """
+    Read-only binary stream over a memory view, so that the CSV parsers read a
+    bytes-like buffer in place instead of from a copy.
+    """
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._position = 0
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def readinto(self, target) -> int:
+        size = min(len(target), len(self._view)-self._position)
+        target[:size] = self._view[self._position:self._position+size]
+        self._position += size
+        return size
+
+
+def bundleKindOf(fileName) -> str:
+    """
+    Get the kind of bundle from its file name suffix.
+
+    Arguments
+    ---------
+        fileName
+    A string or `pathlib.Path` with the file name.
+
+    Returns
+    -------
+    `'zip'`, `'tar'` (optionally compressed), `'gzip'`, or `None` if the file
+    isn't a bundle.
+    """
+    fileName = str(fileName).lower()
+    if fileName.endswith('.zip'):
+        return 'zip'
+    elif fileName.endswith(_TAR_SUFFIXES):
+        return 'tar'
+    elif fileName.endswith('.gz'):
+        return 'gzip'
+    return None
+
+
+def _gzipMemberNameOf(bundle: Path) -> str:
+    return bundle.name[:-len('.gz')]
+
+
+def _gzipSizeOf(bundle: Path) -> int:
+    # The gzip trailer holds the uncompressed size, modulo 2^32.
+    with open(bundle, 'rb') as inputFile:
+        inputFile.seek(-4, os.SEEK_END)
+        return int.from_bytes(inputFile.read(4), 'little')
+
+
+def _bundleEntriesOf(bundle: Path):
+    # (member name, member size, open member function) for every file in the
+    # bundle, in storage order.  Tar bundles are read as a stream, so each
+    # member can only be opened before moving on to the next one.
+    match bundleKindOf(bundle):
+        case 'zip':
+            with zipfile.ZipFile(bundle) as bundleFile:
+                for info in bundleFile.infolist():
+                    if not info.is_dir():
+                        yield (info.filename, info.file_size, lambda info = info: bundleFile.open(info))
+        case 'tar':
+            with tarfile.open(bundle, 'r|*') as bundleFile:
+                for info in bundleFile:
+                    if info.isfile():
+                        yield (info.name, info.size, lambda info = info: bundleFile.extractfile(info))
+        case 'gzip':
+            yield (_gzipMemberNameOf(bundle), _gzipSizeOf(bundle), lambda: gzip.open(bundle, 'rb'))
+
+
+def _isTrackFileName(fileName: str) -> bool:
+    if '.swp' in fileName: # Ignore Vim, other editors swap file
+        return False
+    if fileName.endswith('.tmp'): # Ignore partial files from interrupted writes
+        return False
+    return '.CSV' in fileName.upper() and not any(x in fileName for x in ('EVENT', 'SENSOR'))
+
+
+def _dataLakeVersionIn(prefix: bytes) -> str:
+    trackFormat = trackFormatOf(prefix)
+    if trackFormat is None:
+        return None
+    return dataLakeVersionOf(trackFormat.version)
+
+
+def dataLakeVersionOf(version: FlySightVersion) -> str:
+    """
+    Get the FlySight version string tag used in the `getAllSpeedJumpFilesFrom`
+    dictionaries.
+
+    Arguments
+    ---------
+        version
+    A `FlySightVersion` value.
+
+    Returns
+    -------
+    `'1'`, `'2'`, `'i'`, or `None` for versions without a data lake tag.
+    """
+    return _DATA_LAKE_VERSIONS.get(version)
+
+
+def headerLinesIn(prefix: bytes) -> list:
+    """
+    Get the header lines of a track file, before the track data:  through
+    `$DATA` in FlySight 2 files, or the column names and units in FlySight 1
+    and Insight files.
+
+    Arguments
+    ---------
+        prefix
+    A header prefix, as returned by `headerPrefixIn`.
+
+    Returns
+    -------
+    A list of strings with the non-empty header lines.
+    """
+    lines = [ line.decode(FLYSIGHT_FILE_ENCODING, errors = 'replace') for line in prefix.splitlines() if line ]
+    if prefix.startswith(_FLYSIGHT_2_SIGNATURE):
+        return lines[:lines.index('$DATA')+1] if '$DATA' in lines else lines
+    return lines[:2]
+
+
+def _speedJumpMembersOf(bundle: Path) -> dict:
+    jumpFiles = dict()
+    try:
+        for memberName, size, openMember in _bundleEntriesOf(bundle):
+            if any(name in memberName for name in IGNORE_LIST) or not _isTrackFileName(Path(memberName).name) or size < MIN_JUMP_FILE_SIZE:
+                continue
+            with openMember() as memberFile:
+                version = _dataLakeVersionIn(_cutAtLastEOL(memberFile.read(HEADER_PREFIX_SIZE)))
+            if version:
+                jumpFiles[BundleMember(bundle, memberName)] = version
+    except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError):
+        # Corrupt or truncated bundles are ignored, like any other non-track
+        # file in the data lake.
+        pass
+    return jumpFiles
+
+
+def getAllSpeedJumpFilesFrom(dataLake: Path, bundles = True) -> dict:
     """
     Get a list of all the speed jump files from a data lake, where data lake is
     defined as a reachable path that contains one or more FlySight CSV files.
@@ -154,16 +466,26 @@ def getAllSpeedJumpFilesFrom(dataLake: Path) -> dict:
     file in a valid format and length.  It doesn't validate data like versions
     prior to 1.9.0.
 
+    Files are classified from their size and the first `HEADER_PREFIX_SIZE`
+    bytes only; the track data isn't parsed until the files are processed.
+
+    The track files inside zip, tar (optionally compressed), and gzip bundles
+    are listed as well, without extracting them.
+
     Arguments
     ---------
         dataLake: str
     A valid (absolute or relative) path name to the top level directory where
     the data lake starts.
 
+        bundles
+    If `True`, the default, include the track files in bundles.
+
     Returns
     -------
     A dictionary of speed jump file names for later SSScoring processing:
-        - keys are the file names
+        - keys are the file names, or `BundleMember` instances for the track
+          files in bundles
         - values are a FlySight version string tag
     """
     jumpFiles = OrderedDict()
@@ -171,31 +493,127 @@ def getAllSpeedJumpFilesFrom(dataLake: Path) -> dict:
         if any(name in root for name in IGNORE_LIST):
             continue
         for fileName in files:
-            data = None
-            if '.swp' in fileName: # Ignore Vim, other editors swap file
+            jumpFileName = Path(root) / fileName
+            if bundleKindOf(fileName):
+                if bundles:
+                    jumpFiles.update(_speedJumpMembersOf(jumpFileName))
+                continue
+            if not _isTrackFileName(fileName):
+                continue
+            if os.stat(jumpFileName).st_size < MIN_JUMP_FILE_SIZE:
                 continue
-            if '.CSV' in fileName.upper():
-                version = '1'
-                jumpFileName = Path(root) / fileName
-                stat = os.stat(jumpFileName)
-                if all(x not in fileName for x in ('EVENT', 'SENSOR', 'TRACK')):
-                    # FlySight 1 or Insight track format
-                    data = pd.read_csv(jumpFileName, skiprows = (1, 1), index_col = False)
-                    if data is not None and 'headAcc' in data.columns:
-                        version = 'i'
-                elif 'TRACK' in fileName:
-                    # FlySight 2 track custom format
-                    data = pd.read_csv(jumpFileName, names = FLYSIGHT_2_HEADER, skiprows = 6, index_col = False, na_values = ['NA', ])
-                    data = skipOverFS2MetadataRowsIn(data)
-                    data.drop('GNSS', inplace = True, axis = 1)
-                    version = '2'
-                if data is not None and stat.st_size >= MIN_JUMP_FILE_SIZE and validFlySightHeaderIn(jumpFileName):
-                    # explicit because `not data` is ambiguous for dataframes
-                    jumpFiles[jumpFileName] = version
-    jumpFiles = OrderedDict(sorted(jumpFiles.items()))
+            version = _dataLakeVersionIn(_headerPrefixOf(jumpFileName))
+            if version:
+                jumpFiles[jumpFileName] = version
+    jumpFiles = OrderedDict(sorted(jumpFiles.items(), key = lambda item: Path(str(item[0]))))
     return jumpFiles
 
 
+def readBundleMember(bundleMember: BundleMember) -> bytes:
+    """
+    Read a track file from a zip, tar, or gzip bundle without extracting it.
+    Zip members are read directly; tar bundles are scanned up to the member.
+
+    Arguments
+    ---------
+        bundleMember
+    A `BundleMember`, e.g. from `getAllSpeedJumpFilesFrom`.
+
+    Returns
+    -------
+    The uncompressed contents of the track file.
+
+    Raises
+    ------
+    `SSScoringError` if the bundle can't be read or doesn't have the member.
+
+    See
+    ---
+    `ssscoring.flysight.readBundleMembers`
+    """
+    contents = next(readBundleMembers(bundleMember.bundle, [ bundleMember.member, ]))
+    if contents is None:
+        raise SSScoringError('%s - member not found in %s' % (bundleMember.member, bundleMember.bundle))
+    return contents
+
+
+def _scanForMember(entries, memberName: str, pending: dict, ahead: set, maxPendingBytes: int):
+    # Reads entries up to memberName, holding the ahead members found on the
+    # way while they fit in maxPendingBytes.  None if the entries run out.
+    for entryName, size, openMember in entries:
+        if entryName == memberName:
+            with openMember() as memberFile:
+                return memberFile.read()
+        if entryName in ahead and entryName not in pending and sum(map(len, pending.values()))+size <= maxPendingBytes:
+            with openMember() as memberFile:
+                pending[entryName] = memberFile.read()
+    return None
+
+
+def readBundleMembers(bundle: Path, memberNames: list, maxPendingBytes = BUNDLE_PENDING_MAX_BYTES):
+    """
+    Read track files from a zip, tar, or gzip bundle.  Use it instead of
+    repeated `readBundleMember` calls for tar bundles, which can only be read
+    sequentially:  members stored in the requested order are read in a single
+    pass over the bundle.  Members stored ahead of their turn are held in memory
+    up to `maxPendingBytes`; the rest are read on another pass.
+
+    Arguments
+    ---------
+        bundle
+    A string or `pathlib.Path` with the bundle file name.
+
+        memberNames
+    A list of member names, e.g. `BundleMember.member` values.
+
+        maxPendingBytes
+    Memory bound for the members read ahead of their turn.  Default:
+    `BUNDLE_PENDING_MAX_BYTES`.
+
+    Returns
+    -------
+    A generator of the uncompressed contents of each member, in `memberNames`
+    order, or `None` for members that aren't in the bundle.
+
+    Raises
+    ------
+    `SSScoringError` if the bundle can't be read.
+    """
+    bundle = Path(bundle)
+    memberNames = list(memberNames)
+    entries = None
+    try:
+        if bundleKindOf(bundle) == 'zip':
+            with zipfile.ZipFile(bundle) as bundleFile:
+                names = set(bundleFile.namelist())
+                for memberName in memberNames:
+                    yield bundleFile.read(memberName) if memberName in names else None
+            return
+        pending = dict()
+        ahead = set(memberNames)
+        for memberName in memberNames:
+            ahead.discard(memberName)
+            if memberName in pending:
+                yield pending.pop(memberName)
+                continue
+            # Scan the rest of the bundle, then all of it if the member wasn't
+            # there:
+            contents = None
+            for _ in range(1 if entries is None else 2):
+                if entries is None:
+                    entries = _bundleEntriesOf(bundle)
+                contents = _scanForMember(entries, memberName, pending, ahead, maxPendingBytes)
+                if contents is not None:
+                    break
+                entries = None
+            yield contents
+    except (OSError, EOFError, zipfile.BadZipFile, tarfile.TarError) as e:
+        raise SSScoringError('%s - invalid bundle: %s' % (bundle, str(e)))
+    finally:
+        if entries is not None:
+            entries.close()
+
+
 def detectFlySightFileVersionOf(fileThing) -> FlySightVersion:
     """
     Detects the FlySight file version based on its file name and format.
@@ -222,126 +640,329 @@ def detectFlySightFileVersionOf(fileThing) -> FlySightVersion:
         case str():
             fileName = fileThing
             fileThing = Path(fileThing)
-        case bytes():
+        case bytes() | bytearray() | memoryview():
             fileName = '00-00-00.CSV'
         case _:
-            raise SSScoringError('fileThing must be a Path, str, or bytes')
+            raise SSScoringError('fileThing must be a Path, str, or bytes-like object')
 
-    delimiters =  [',', ]
-    stream = None
     if not '.CSV' in fileName.upper():
         raise SSScoringError('Invalid file extension type')
     if any(x in fileName for x in ('EVENT.CSV', 'SENSOR.CSV')):
         raise SSScoringError('Only TRACK.CSV v2 files can be processed at this time')
-    if isinstance(fileThing, Path) or isinstance(fileThing, str):
+    if isinstance(fileThing, Path):
         if not fileThing.is_file():
             raise SSScoringError('%s - file not found in data lake' % fileName)
-        if not validFlySightHeaderIn(fileName):
-            raise SSScoringError('CSV is not a valid FlySight file')
-        stream = open(fileName, 'r')
-    elif isinstance(fileThing, bytes):
-        stream = StringIO(fileThing.decode(FLYSIGHT_FILE_ENCODING))
-
-    try:
-        dialect = csv.Sniffer().sniff(stream.readline(), delimiters = delimiters)
-    except:
-        raise SSScoringError('Error while trying to validate %s file format' % fileName)
-    if dialect.delimiter in delimiters:
-        stream.seek(0)
-        header = next(csv.reader(stream))
+        prefix = _headerPrefixOf(fileThing)
     else:
-        raise SSScoringError('CSV uses a different delimiter from FlySigh')
-    if header[0] == '$FLYS':
-        return FlySightVersion.V2
-    elif FLYSIGHT_1_HEADER.issubset(header):
-        return FlySightVersion.V1
-    elif _isInsightHeader(header):
-        return FlySightVersion.INSIGHT
+        # Only the header is needed; the rest of the buffer isn't decoded.
+        prefix = headerPrefixIn(fileThing)
+    return _versionFromHeaderIn(prefix, fileName)
+
+
+def _versionFromHeaderIn(prefix: bytes, fileName: str) -> FlySightVersion:
+    trackFormat = trackFormatOf(prefix)
+    if trackFormat is None:
+        raise SSScoringError('%s file is not a FlySight v1 or v2 file' % fileName)
+    return trackFormat.version
+
+
+def _csvEngineFor(fileThing, engine: str) -> str:
+    if engine is None:
+        engine = 'c'
+    if engine == 'pyarrow':
+        if pacsv is None:
+            raise SSScoringError('the pyarrow CSV engine requires the pyarrow package')
+        if isinstance(fileThing, TextIOBase):
+            # PyArrow only parses bytes; decoded buffers go to the C parser.
+            engine = 'c'
+    elif engine != 'c':
+        raise SSScoringError('unsupported CSV engine %s' % engine)
+    return engine
+
+
+def _trackDTypes() -> dict:
+    return { column: (str if column in _TRACK_TEXT_COLUMNS else 'float64') for column in _TRACK_COLUMN_NAMES }
+
+
+def _skipInvalidRow(row) -> str:
+    return 'skip'
+
+
+def _readTrackWithArrow(fileThing, columns: list, readOptions) -> pd.DataFrame:
+    columnTypes = { column: (pa.string() if column in _TRACK_TEXT_COLUMNS else pa.float64()) for column in _TRACK_COLUMN_NAMES }
+    table = pacsv.read_csv(fileThing,
+                           read_options = readOptions,
+                           parse_options = pacsv.ParseOptions(invalid_row_handler = _skipInvalidRow),
+                           convert_options = pacsv.ConvertOptions(include_columns = columns, column_types = columnTypes))
+    return table.to_pandas()
+
+
+def _projectionOf(rawData: pd.DataFrame, columns) -> pd.DataFrame:
+    if columns is None or list(rawData.columns) == list(columns):
+        return rawData
+    return rawData[list(columns)]
+
+
+def _isCRMangledFileName(fileThing) -> bool:
+    return isinstance(fileThing, (str, Path)) and isCRMangledCSV(fileThing)
+
+
+def _readVersion1LikeCSV(fileThing, columns, engine: str) -> pd.DataFrame:
+    # FlySight 1 and Insight share the layout:  header row, units row, data.
+    if _isCRMangledFileName(fileThing):
+        with open(fileThing, 'rb') as inputFile:
+            return _readVersion1LikeCSV(BufferedReader(CRNormalizingReader(inputFile)), columns, engine)
+    if _csvEngineFor(fileThing, engine) == 'pyarrow':
+        rawData = _readTrackWithArrow(fileThing, None if columns is None else list(columns), pacsv.ReadOptions(skip_rows_after_names = 1))
     else:
-        raise SSScoringError('%s file is not a FlySight v1 or v2 file')
+        rawData = pd.read_csv(fileThing, skiprows = (1, 1), index_col = False, usecols = columns, dtype = _trackDTypes())
+    return _projectionOf(rawData, columns)
 
 
-def readVersion1CSV(fileThing: object) -> pd.DataFrame:
+def readVersion1CSV(fileThing: object, columns = None, engine = None) -> pd.DataFrame:
     """
     Read a FlySight file version 1 into a dataframe.  It scrubes blank rows that
-    get in the way of correct parsing.
+    get in the way of correct parsing.  The `time` column is parsed as strings,
+    and all other columns as floating point numbers.  CR mangled files are
+    normalized as they're read, without rewriting them.
 
     Arguments
     ---------
         fileThing
     A string or a `pathlib.Path` object.  It can be a relative or an absolute
-    path.
+    path.  It can also be a binary or text file-like object.
+
+        columns
+    An optional sequence of column names to read, e.g. `RAW_TRACK_COLUMNS`;
+    the other columns are skipped without being parsed.  Default: all columns.
+
+        engine
+    The CSV parser, `'c'` (the pandas parser) or `'pyarrow'`.  Default: `'c'`.
+    Text file-like objects are always parsed with `'c'`.  The PyArrow parser
+    skips malformed rows instead of filling them with NaN.
 
     Returns
     -------
     A FlySight dataframe with the original column names, normalized for
     manipulation as a dataframe instead of a file or CSV object.
+
+    Raises
+    ------
+    `SSScoringError` if the engine isn't supported or available.  Cells that
+    aren't numbers raise `ValueError`.
+
+    See
+    ---
+    `ssscoring.constants.RAW_TRACK_COLUMNS`
     """
-    return pd.read_csv(fileThing, skiprows = (1, 1), index_col = False)
+    return _readVersion1LikeCSV(fileThing, columns, engine)
 
 
-def _tagVersion1From(fileThing: str) -> str:
+def tagVersion1From(fileThing: str) -> str:
+    """
+    Get the tag of a FlySight 1 track, which is derived from its file name
+    because the track has no date.
+
+    Arguments
+    ---------
+        fileThing
+    A string with the track file name.
+
+    Returns
+    -------
+    A `<path slug>:v1` tag string.
+    """
     return fileThing.replace('.CSV', '').replace('.csv', '').replace('/data', '').replace('/', ' ').strip()+':v1'
 
 
-def _tagFromFirstTimestampIn(rawData: pd.DataFrame, suffix: str) -> str:
+def tagFromFirstTimestampIn(rawData: pd.DataFrame, suffix: str) -> str:
+    """
+    Get the tag of a track from the time of its first sample.
+
+    Arguments
+    ---------
+        rawData
+    A raw track dataframe with an ISO 8601 `time` column.
+
+        suffix
+    The device suffix, e.g. `'v2'` or `'i'`.
+
+    Returns
+    -------
+    A `HH-MM-ss:<suffix>` tag string.
+    """
     firstTimestamp = str(rawData.iloc[0]['time'])
     return firstTimestamp.split('T')[1].split('.')[0].replace(':', '-')+':'+suffix
 
 
 def _tagVersion2From(rawData: pd.DataFrame) -> str:
-    return _tagFromFirstTimestampIn(rawData, 'v2')
+    return tagFromFirstTimestampIn(rawData, 'v2')
 
 
 def _tagInsightFrom(rawData: pd.DataFrame) -> str:
-    return _tagFromFirstTimestampIn(rawData, 'i')
+    return tagFromFirstTimestampIn(rawData, 'i')
+
+
+def readInsightCSV(fileThing: object, columns = None, engine = None) -> pd.DataFrame:
+    """
+    Read an Insight track file into a dataframe, without the `headAcc` column.
+
+    Arguments
+    ---------
+    Same as `readVersion1CSV`.
 
+    Returns
+    -------
+    An Insight dataframe with the original column names, normalized for
+    manipulation as a dataframe instead of a file or CSV object.
 
-def readInsightCSV(fileThing: object) -> pd.DataFrame:
-    rawData = pd.read_csv(fileThing, skiprows=(1, 1), index_col=False)
-    rawData.drop('headAcc', inplace=True, axis=1)
+    See
+    ---
+    `ssscoring.flysight.readVersion1CSV`
+    """
+    rawData = _readVersion1LikeCSV(fileThing, columns, engine)
+    if 'headAcc' in rawData.columns:
+        rawData = rawData.drop('headAcc', axis = 1)
     return rawData
 
 
-def readVersion2CSV(jumpFile: str) -> pd.DataFrame:
+def readVersion2CSV(jumpFile: str, columns = None, engine = None) -> pd.DataFrame:
     """
     Read a FlySight file version 2 into a dataframe.  It scrubes blank rows that
     get in the way of correct parsing and drops the `GNSS` column because it
-    just makes dataframe management murkier.
+    just makes dataframe management murkier.  The `time` column is parsed as
+    strings, and all other columns as floating point numbers.
 
     Arguments
     ---------
         fileThing
     A string or a `pathlib.Path` object.  It can be a relative or an absolute
-    path.
+    path.  It can also be a binary or text file-like object.
+
+        columns
+    An optional sequence of column names to read, e.g. `RAW_TRACK_COLUMNS`;
+    the other columns are skipped without being parsed.  Default: all columns
+    except `GNSS`.
+
+        engine
+    Same as in `readVersion1CSV`.  Non-seekable file-like objects are always
+    parsed with `'c'`, and are expected to have the standard 6 header lines
+    before the `$DATA` marker.
 
     Returns
     -------
     A FlySight dataframe with the original column names, normalized for
     manipulation as a dataframe instead of a file or CSV object.
+
+    Raises
+    ------
+    `SSScoringError` if the engine isn't supported or available.
+
+    See
+    ---
+    `ssscoring.flysight.readVersion1CSV`
     """
+    if _isCRMangledFileName(jumpFile):
+        with open(jumpFile, 'rb') as inputFile:
+            return readVersion2CSV(BufferedReader(CRNormalizingReader(inputFile)), columns, engine)
+    if columns is None:
+        columns = FLYSIGHT_2_HEADER[1:]
+    if _isSeekable(jumpFile):
+        skipRows = _dataRowOf(jumpFile)
+    else:
+        skipRows = _FLYSIGHT_2_HEADER_ROWS
+        engine = 'c'
+    if _csvEngineFor(jumpFile, engine) == 'pyarrow':
+        rawData = _readTrackWithArrow(jumpFile, list(columns), pacsv.ReadOptions(skip_rows = skipRows, column_names = FLYSIGHT_2_HEADER))
+    else:
+        rawData = pd.read_csv(jumpFile, names = FLYSIGHT_2_HEADER, skiprows = skipRows, index_col = False, na_values=['NA',], usecols = columns, dtype = _trackDTypes())
+        rawData = skipOverFS2MetadataRowsIn(rawData).reset_index(drop = True)
+    return _projectionOf(rawData, columns)
+
+
+def _isSeekable(fileThing) -> bool:
+    return isinstance(fileThing, (str, Path)) or fileThing.seekable()
+
+
+def _dataRowOf(fileThing) -> int:
+    # Number of FlySight 2 header lines, through the $DATA marker.  Streams are
+    # rewound to where they were.  Lines are counted by LF so that CR mangled
+    # files give the same count as their normalized stream.
+    if isinstance(fileThing, (str, Path)):
+        with open(fileThing, 'rb') as inputFile:
+            return _dataRowOf(inputFile)
+    marker = _FLYSIGHT_2_DATA_MARKER
+    if isinstance(fileThing, TextIOBase):
+        marker = marker.decode()
+    position = fileThing.tell()
+    header = marker[:0]
+    try:
+        while marker not in header:
+            chunk = fileThing.read(HEADER_PREFIX_SIZE)
+            if not chunk:
+                raise SSScoringError('FlySight 2 $DATA marker not found')
+            header += chunk
+    finally:
+        fileThing.seek(position)
+    return header.count(marker[:1], 0, header.index(marker)+1)+1
 
-    rawData = pd.read_csv(jumpFile, names = FLYSIGHT_2_HEADER, skiprows = 6, index_col = False, na_values=['NA',])
-    rawData = skipOverFS2MetadataRowsIn(rawData)
-    rawData.drop('GNSS', inplace = True, axis = 1)
-    return rawData
+
+def _tagVersion1Of(rawData: pd.DataFrame, name: str) -> str:
+    return tagVersion1From(name)
+
+
+def _tagVersion2Of(rawData: pd.DataFrame, name: str) -> str:
+    return _tagVersion2From(rawData)
+
+
+def _tagInsightOf(rawData: pd.DataFrame, name: str) -> str:
+    return _tagInsightFrom(rawData)
 
 
-def getFlySightDataFromCSVBuffer(buffer:bytes, bufferName:str) -> tuple:
+# Matched in order; the first match wins.  See registerTrackFormat().
+_TRACK_FORMATS = [
+    TrackFormat(FlySightVersion.V2, _FLYSIGHT_2_SIGNATURE, frozenset(), frozenset(), readVersion2CSV, _tagVersion2Of),
+    TrackFormat(FlySightVersion.V1, b'', frozenset(FLYSIGHT_1_HEADER), frozenset(), readVersion1CSV, _tagVersion1Of),
+    TrackFormat(FlySightVersion.INSIGHT, b'', frozenset(INSIGHT_1_HEADER), frozenset(( 'cAcc', )), readInsightCSV, _tagInsightOf),
+]
+_DATA_LAKE_VERSIONS = {
+    FlySightVersion.V1: '1',
+    FlySightVersion.V2: '2',
+    FlySightVersion.INSIGHT: 'i',
+}
+
+
+def _trackSourceOf(view: memoryview, engine: str):
+    if _CR_MANGLED_EOL in headerPrefixIn(view):
+        return BufferedReader(CRNormalizingReader(_MemoryViewReader(view)))
+    if _csvEngineFor(None, engine) == 'pyarrow':
+        return pa.BufferReader(pa.py_buffer(view))
+    return _MemoryViewReader(view)
+
+
+def getFlySightDataFromCSVBuffer(buffer:bytes, bufferName:str, columns = None) -> tuple:
     """
     Ingress a buffer with known FlySight or SkyTrax file data for SSScoring
-    processing.
+    processing.  The buffer is parsed in place:  only its header is copied and
+    decoded to detect the file version, so that large uploads aren't held in
+    memory more than once.
 
     Arguments
     ---------
         buffer
     A binary data buffer, bag of bytes, containing a known FlySight track file.
+    Any bytes-like object works, e.g. a `memoryview` of an uploaded file from
+    `BytesIO.getbuffer()`.
 
         bufferName
     An arbitrary name for the buffer of type `str`.  Used to construct the tag
     for FlySight 1 buffers; ignored for FlySight 2 and Insight buffers, whose
     tags are derived from the first row's timestamp.
 
+        columns
+    An optional sequence of column names to read, e.g. `RAW_TRACK_COLUMNS`.
+    Default: all columns.
+
     Returns
     -------
     A `tuple` with two items:
@@ -359,31 +980,23 @@ def getFlySightDataFromCSVBuffer(buffer:bytes, bufferName:str) -> tuple:
     ------
     `SSScoringError` if the CSV file is invalid in any way.
     """
-    if not isinstance(buffer, bytes):
-        raise SSScoringError('buffer must be an instance of bytes, a bytes buffer')
-    try:
-        stringIO = StringIO(buffer.decode(FLYSIGHT_FILE_ENCODING))
-    except Exception as e:
-        raise SSScoringError('invalid buffer endcoding - %s' % str(e))
+    if not isinstance(buffer, (bytes, bytearray, memoryview)):
+        raise SSScoringError('buffer must be a bytes-like object, a bytes buffer')
+    trackFormat = trackFormatOf(headerPrefixIn(buffer))
+    if trackFormat is None:
+        return (None, '%s:INVALID' % bufferName)
+    rawData = _readTrackIn(buffer, trackFormat, columns)
+    return (rawData, trackFormat.tag(rawData, bufferName))
+
+
+def _readTrackIn(buffer, trackFormat: TrackFormat, columns) -> pd.DataFrame:
     try:
-        version = detectFlySightFileVersionOf(buffer)
-    except Exception:
-        tag = '%s:INVALID' % bufferName
-        rawData = None
-    else:
-        if version == FlySightVersion.V1:
-            rawData = readVersion1CSV(stringIO)
-            tag = _tagVersion1From(bufferName)
-        elif version == FlySightVersion.V2:
-            rawData = readVersion2CSV(stringIO)
-            tag = _tagVersion2From(rawData)
-        elif version == FlySightVersion.INSIGHT:
-            rawData = readInsightCSV(stringIO)
-            tag = _tagInsightFrom(rawData)
-    return (rawData, tag)
+        return trackFormat.reader(_trackSourceOf(memoryview(buffer), None), columns = columns)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise SSScoringError('invalid buffer contents - %s' % str(e))
 
 
-def getFlySightDataFromCSVFileName(jumpFile) -> tuple:
+def getFlySightDataFromCSVFileName(jumpFile, columns = None) -> tuple:
     """
     Ingress a known FlySight or SkyTrax file into memory for SSScoring
     processing.
@@ -392,6 +1005,12 @@ def getFlySightDataFromCSVFileName(jumpFile) -> tuple:
     ---------
         jumpFile
     A string or `pathlib.Path` object; can be a relative or an asbolute path.
+    It can also be a `BundleMember` for a track file in a zip, tar, or gzip
+    bundle.
+
+        columns
+    An optional sequence of column names to read, e.g. `RAW_TRACK_COLUMNS`.
+    Default: all columns.
 
     Returns
     -------
@@ -410,28 +1029,51 @@ def getFlySightDataFromCSVFileName(jumpFile) -> tuple:
     ------
     `SSScoringError` if the CSV file is invalid in any way.
     """
+    if isinstance(jumpFile, BundleMember):
+        return getFlySightDataFromFileBuffer(readBundleMember(jumpFile), str(jumpFile), columns)
     if isinstance(jumpFile, Path):
         jumpFile = jumpFile.as_posix()
     elif isinstance(jumpFile, str):
         pass
     else:
-        raise SSScoringError('jumpFile must be a string or a Path object')
-    if not validFlySightHeaderIn(jumpFile):
-        raise SSScoringError('%s is an invalid speed skydiving file')
-    try:
-        version = detectFlySightFileVersionOf(jumpFile)
-    except Exception:
-        tag = 'NA'
-        rawData = None
-    else:
-        if version == FlySightVersion.V1:
-            rawData = readVersion1CSV(jumpFile)
-            tag = _tagVersion1From(jumpFile)
-        elif version == FlySightVersion.V2:
-            rawData = readVersion2CSV(jumpFile)
-            tag = _tagVersion2From(rawData)
-        elif version == FlySightVersion.INSIGHT:
-            rawData = readInsightCSV(jumpFile)
-            tag = _tagInsightFrom(rawData)
-    return (rawData, tag)
+        raise SSScoringError('jumpFile must be a string, a Path, or a BundleMember object')
+    with open(jumpFile, 'rb') as inputFile:
+        buffer = inputFile.read()
+    return getFlySightDataFromFileBuffer(buffer, jumpFile, columns)
 
+
+def getFlySightDataFromFileBuffer(buffer, jumpFile: str, columns = None) -> tuple:
+    """
+    Same as `getFlySightDataFromCSVFileName` for a track file that's already
+    been read, so that validation, version detection, and parsing share the
+    same buffer.
+
+    Arguments
+    ---------
+        buffer
+    A bytes-like object with the contents of the track file.
+
+        jumpFile
+    A string with the track file name, for the FlySight 1 tag and for skipping
+    non-track files.
+
+        columns
+    An optional sequence of column names to read, e.g. `RAW_TRACK_COLUMNS`.
+    Default: all columns.
+
+    Returns
+    -------
+    A `(rawData, tag)` tuple, like `getFlySightDataFromCSVFileName`.  `rawData`
+    is `None` and `tag` is `'NA'` if `jumpFile` isn't a track file name.
+
+    Raises
+    ------
+    `SSScoringError` if the buffer isn't a valid track file.
+    """
+    trackFormat = trackFormatOf(headerPrefixIn(buffer))
+    if trackFormat is None:
+        raise SSScoringError('%s is an invalid speed skydiving file')
+    if not '.CSV' in jumpFile.upper() or any(x in jumpFile for x in ('EVENT.CSV', 'SENSOR.CSV')):
+        return (None, 'NA')
+    rawData = _readTrackIn(buffer, trackFormat, columns)
+    return (rawData, trackFormat.tag(rawData, jumpFile))
@@ -0,0 +1,153 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+"""
+Vectorized geodesy on a spherical Earth.  Every function takes scalars or NumPy
+arrays of latitudes and longitudes in degrees and broadcasts like any other
+NumPy operation, so that the geometry of a whole track, or of a stack of tracks,
+is resolved in a handful of array operations.
+"""
+
+
+from ssscoring.constants import EARTH_RADIUS
+
+import numpy as np
+
+
+# +++ implementation +++
+
+def haversineDistance(startLat, startLon, endLat, endLon) -> np.ndarray:
+    """
+    Great circle distance between two sets of terrestrial coordinates.
+
+    Arguments
+    ---------
+        startLat, startLon
+    Start point latitudes and longitudes, in degrees.
+
+        endLat, endLon
+    End point latitudes and longitudes, in degrees.
+
+    Returns
+    -------
+    The distances in meters, broadcast over the arguments.
+    """
+    startLat = np.radians(startLat)
+    endLat = np.radians(endLat)
+    latDelta = endLat-startLat
+    lonDelta = np.radians(endLon)-np.radians(startLon)
+    d = np.sin(latDelta*0.5)**2+np.cos(startLat)*np.cos(endLat)*np.sin(lonDelta*0.5)**2
+    return 2.0*EARTH_RADIUS*np.arcsin(np.sqrt(d))
+
+
+def bearingComponents(startLat, startLon, endLat, endLon) -> tuple:
+    """
+    East and north components of the initial bearing from the start points to
+    the end points.  Both components are zero for coincident points, where the
+    bearing is undefined.
+
+    Arguments
+    ---------
+        startLat, startLon
+    Start point latitudes and longitudes, in degrees.
+
+        endLat, endLon
+    End point latitudes and longitudes, in degrees.
+
+    Returns
+    -------
+    An `(east, north)` tuple of arrays; `np.arctan2(east, north)` is the bearing
+    in radians.
+    """
+    startLat = np.radians(startLat)
+    endLat = np.radians(endLat)
+    lonDelta = np.radians(endLon)-np.radians(startLon)
+    east = np.sin(lonDelta)*np.cos(endLat)
+    north = np.cos(startLat)*np.sin(endLat)-np.sin(startLat)*np.cos(endLat)*np.cos(lonDelta)
+    return (east, north)
+
+
+def initialBearing(startLat, startLon, endLat, endLon) -> np.ndarray:
+    """
+    Initial great circle bearing from the start points to the end points.
+
+    Arguments
+    ---------
+        startLat, startLon
+    Start point latitudes and longitudes, in degrees.
+
+        endLat, endLon
+    End point latitudes and longitudes, in degrees.
+
+    Returns
+    -------
+    The bearings in degrees [0, 360), broadcast over the arguments.
+    """
+    east, north = bearingComponents(startLat, startLon, endLat, endLon)
+    return np.degrees(np.arctan2(east, north)) % 360.0
+
+
+def destination(lat, lon, bearing, distance) -> tuple:
+    """
+    Destination points after travelling `distance` meters along the great
+    circle with initial `bearing` from `(lat, lon)`.
+
+    Arguments
+    ---------
+        lat, lon
+    Start point latitudes and longitudes, in degrees.
+
+        bearing
+    Initial bearings in degrees.
+
+        distance
+    Distances in meters.
+
+    Returns
+    -------
+    A `(latitude, longitude)` tuple of arrays, in degrees, with the longitudes
+    normalized to [-180, 180).
+    """
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    bearing = np.radians(bearing)
+    angularDistance = np.asarray(distance, dtype = float)/EARTH_RADIUS
+    endLat = np.arcsin(np.sin(lat)*np.cos(angularDistance)+np.cos(lat)*np.sin(angularDistance)*np.cos(bearing))
+    endLon = lon+np.arctan2(np.sin(bearing)*np.sin(angularDistance)*np.cos(lat), np.cos(angularDistance)-np.sin(lat)*np.sin(endLat))
+    return (np.degrees(endLat), (np.degrees(endLon)+540.0) % 360.0-180.0)
+
+
+def localENU(lat, lon, originLat, originLon, height = 0.0, originHeight = 0.0) -> tuple:
+    """
+    Project terrestrial coordinates onto the local east-north-up (ENU) tangent
+    plane at the origin.
+
+    Arguments
+    ---------
+        lat, lon
+    Point latitudes and longitudes, in degrees.
+
+        originLat, originLon
+    The tangent plane origin latitude and longitude, in degrees.
+
+        height, originHeight
+    Optional point and origin heights in meters.
+
+    Returns
+    -------
+    An `(east, north, up)` tuple of arrays, in meters from the origin.
+    """
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    originLat = np.radians(originLat)
+    originLon = np.radians(originLon)
+    radius = EARTH_RADIUS+np.asarray(height, dtype = float)
+    originRadius = EARTH_RADIUS+np.asarray(originHeight, dtype = float)
+    lonDelta = lon-originLon
+    # Earth-centred coordinates, rotated so that the origin meridian is x = 0:
+    x = radius*np.cos(lat)*np.sin(lonDelta)
+    y = radius*np.cos(lat)*np.cos(lonDelta)
+    z = radius*np.sin(lat)
+    east = x
+    north = -np.sin(originLat)*y+np.cos(originLat)*z
+    up = np.cos(originLat)*y+np.sin(originLat)*z-originRadius
+    return (east, north, up)
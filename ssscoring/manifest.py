@@ -0,0 +1,255 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+"""
+Persistent, incremental data lake manifest.  The manifest is a JSON lines file
+in the data lake root, one entry per speed track file, with the file's size,
+modification time, content hash, FlySight version, tag, and the summary of its
+last results.  Track files inside zip, tar, or gzip bundles have an entry each,
+keyed by `bundle/member`.  Rescanning the data lake only processes files that are new or
+whose contents changed since the previous scan.
+"""
+
+
+from pathlib import Path
+
+from ssscoring import __VERSION__
+from ssscoring.calc import aggregateResultsFromRows
+from ssscoring.calc import aggregateRowFrom
+from ssscoring.calc import iterJumpResults
+from ssscoring.constants import MANIFEST_FILE_NAME
+from ssscoring.datatypes import BundleMember
+from ssscoring.datatypes import JumpStatus
+from ssscoring.errors import SSScoringError
+from ssscoring.flysight import getAllSpeedJumpFilesFrom
+from ssscoring.flysight import readBundleMembers
+
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+
+# +++ constants +++
+
+_HASH_BLOCK_SIZE = 1024*1024
+
+
+# +++ implementation +++
+
+def _sha256Of(fileName: Path) -> str:
+    digest = hashlib.sha256()
+    with open(fileName, 'rb') as inputFile:
+        for block in iter(lambda: inputFile.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sha256sOf(jumpFiles: list) -> dict:
+    # Content hashes by jump file; bundle members are hashed on their bytes,
+    # reading each bundle once.  None for members that can't be read.
+    sha256s = dict()
+    bundleMembers = dict()
+    for jumpFile in jumpFiles:
+        if isinstance(jumpFile, BundleMember):
+            bundleMembers.setdefault(jumpFile.bundle, list()).append(jumpFile)
+        else:
+            sha256s[jumpFile] = _sha256Of(jumpFile)
+    for bundle, members in bundleMembers.items():
+        try:
+            buffers = readBundleMembers(bundle, [ member.member for member in members ])
+            for member, buffer in zip(members, buffers):
+                sha256s[member] = None if buffer is None else hashlib.sha256(buffer).hexdigest()
+        except SSScoringError:
+            pass
+        for member in members:
+            sha256s.setdefault(member, None)
+    return sha256s
+
+
+def _manifestPathOf(jumpFile, dataLake: str) -> str:
+    if isinstance(jumpFile, BundleMember):
+        return '%s/%s' % (jumpFile.bundle.relative_to(dataLake).as_posix(), jumpFile.member)
+    return jumpFile.relative_to(dataLake).as_posix()
+
+
+def loadManifest(dataLake: str) -> dict:
+    """
+    Load the data lake manifest.
+
+    Arguments
+    ---------
+        dataLake
+    A string or `pathlib.Path` with the data lake root directory.
+
+    Returns
+    -------
+    A dictionary of manifest entries keyed by the track file path relative to
+    `dataLake`, in POSIX format; `bundle/member` for bundle members.  An empty dictionary if the data lake has no
+    manifest.  Malformed lines are ignored; their files will be processed
+    again on the next `updateManifest` call.
+    """
+    manifest = dict()
+    manifestFileName = Path(dataLake) / MANIFEST_FILE_NAME
+    if not manifestFileName.is_file():
+        return manifest
+    with open(manifestFileName, 'r') as inputFile:
+        for line in inputFile:
+            try:
+                entry = json.loads(line)
+                manifest[entry['path']] = entry
+            except (ValueError, KeyError, TypeError):
+                continue
+    return manifest
+
+
+def saveManifest(dataLake: str, manifest: dict):
+    """
+    Save the data lake manifest.  The manifest file is replaced atomically, so
+    that an interrupted run never leaves a partial manifest behind.
+
+    Arguments
+    ---------
+        dataLake
+    A string or `pathlib.Path` with the data lake root directory.
+
+        manifest
+    A dictionary of manifest entries, as returned by `loadManifest` or
+    `updateManifest`.
+    """
+    manifestFileName = Path(dataLake) / MANIFEST_FILE_NAME
+    with tempfile.NamedTemporaryFile(mode = 'w', dir = dataLake, prefix = MANIFEST_FILE_NAME, suffix = '.tmp', delete = False) as outputFile:
+        for path in sorted(manifest.keys()):
+            outputFile.write(json.dumps(manifest[path])+'\n')
+        outputFile.flush()
+        os.fsync(outputFile.fileno())
+        tempFileName = outputFile.name
+    os.replace(tempFileName, manifestFileName)
+
+
+def _isCurrent(entry: dict, dataLake: str, altitudeDZMeters: float) -> bool:
+    # FlySight 1 tags are derived from the path as passed to the scan:
+    return entry.get('dataLake') == Path(dataLake).as_posix() and entry.get('altitudeDZMeters') == altitudeDZMeters and entry.get('ssscoringVersion') == __VERSION__
+
+
+def updateManifest(dataLake: str, altitudeDZMeters = 0.0, workers = 1, cacheDir = None) -> tuple:
+    """
+    Scan the data lake and bring its manifest up to date.  Only new files and
+    files whose size, modification time, and content hash changed are processed;
+    files removed from the data lake are dropped from the manifest.  A change in
+    drop zone elevation, in the SSScoring version, or in the `dataLake` path
+    spelling (FlySight 1 tags are derived from it) invalidates every entry.
+    Track files inside zip, tar, or gzip bundles are tracked like any other;
+    their size and modification time are the bundle's, and their content hash
+    is that of the member's bytes, so only the members that changed in a
+    rewritten bundle are processed again.
+
+    Arguments
+    ---------
+        dataLake
+    A string or `pathlib.Path` with the data lake root directory.
+
+        altitudeDZMeters : float
+    Drop zone height above MSL
+
+        workers : int
+    Number of worker processes for processing new and changed files.  See
+    `ssscoring.calc.iterJumpResults`.
+
+        cacheDir
+    Optional cache directory for scored tracks.  See
+    `ssscoring.calc.processAllJumpFiles`.
+
+    Returns
+    -------
+    A tuple with two elements:
+
+    - The updated manifest dictionary, also saved to the data lake
+    - A list of the relative paths of the files processed in this run, in
+      manifest key format
+
+    Raises
+    ------
+    `SSScoringError` if `dataLake` isn't a directory.
+
+    See
+    ---
+    `ssscoring.manifest.aggregateResultsFromManifest`
+    """
+    if not Path(dataLake).is_dir():
+        raise SSScoringError('%s - data lake not found' % dataLake)
+    oldManifest = loadManifest(dataLake)
+    manifest = dict()
+    changed = dict()
+    for jumpFile, version in getAllSpeedJumpFilesFrom(dataLake).items():
+        path = _manifestPathOf(jumpFile, dataLake)
+        stat = os.stat(jumpFile.bundle if isinstance(jumpFile, BundleMember) else jumpFile)
+        oldEntry = oldManifest.get(path, dict())
+        entry = dict(oldEntry)
+        entry.update({
+            'path': path,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'version': version,
+        })
+        manifest[path] = entry
+        if oldEntry.get('size') != stat.st_size or oldEntry.get('mtime') != stat.st_mtime_ns or not _isCurrent(entry, dataLake, altitudeDZMeters):
+            changed[jumpFile] = oldEntry
+
+    pending = list()
+    sha256s = _sha256sOf(changed.keys())
+    for jumpFile, oldEntry in changed.items():
+        entry = manifest[_manifestPathOf(jumpFile, dataLake)]
+        sha256 = sha256s[jumpFile]
+        entry['sha256'] = sha256
+        if sha256 is None or oldEntry.get('sha256') != sha256 or oldEntry.get('version') != entry['version'] or not _isCurrent(entry, dataLake, altitudeDZMeters):
+            pending.append(jumpFile)
+
+    if pending:
+        jumpResults = iterJumpResults(pending, altitudeDZMeters = altitudeDZMeters, workers = workers, cacheDir = cacheDir)
+        for jumpFile, (tag, jumpResult) in zip(pending, jumpResults):
+            scoreRow = aggregateRowFrom(jumpResult)
+            manifest[_manifestPathOf(jumpFile, dataLake)].update({
+                'tag': tag,
+                'status': jumpResult.status.name,
+                'dataLake': Path(dataLake).as_posix(),
+                'altitudeDZMeters': altitudeDZMeters,
+                'ssscoringVersion': __VERSION__,
+                'summary': scoreRow,
+            })
+    saveManifest(dataLake, manifest)
+    return manifest, [ _manifestPathOf(jumpFile, dataLake) for jumpFile in pending ]
+
+
+def aggregateResultsFromManifest(manifest: dict) -> pd.DataFrame:
+    """
+    Aggregate the results summaries stored in a data lake manifest, without
+    processing any track files.
+
+    Arguments
+    ---------
+        manifest
+    A dictionary of manifest entries, as returned by `updateManifest`.
+
+    Returns
+    -------
+    The same dataframe that `ssscoring.calc.aggregateResults` returns for the
+    results of processing all the files in the manifest.
+
+    Raises
+    ------
+    `SSScoringError` if the manifest is empty.
+    """
+    if not len(manifest):
+        raise SSScoringError('manifest is empty - impossible to aggregate results')
+
+    # Same precedence as processAllJumpFiles() for files with the same tag:
+    scoreRows = dict()
+    for path in sorted(manifest.keys()):
+        entry = manifest[path]
+        if entry.get('status') == JumpStatus.OK.name and entry.get('summary'):
+            scoreRows[entry['tag']] = entry['summary']
+        else:
+            scoreRows.pop(entry.get('tag'), None)
+    return aggregateResultsFromRows(scoreRows)
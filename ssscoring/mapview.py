@@ -1,12 +1,13 @@
 # See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
 
-from geopy import distance
-from ssscoring.calc import jumpRunBearing
+from ssscoring.calc import jumpGeometryFrom
 from ssscoring.constants import SAMPLE_RATE
 from ssscoring.constants import SCORING_INTERVAL
 from ssscoring.datatypes import JumpResults
+from ssscoring.geodesy import destination
 from ssscoring.notebook import convertHexColorToRGB
 
+import numpy as np
 import pandas as pd
 import pydeck as pdk
 
@@ -57,19 +58,16 @@ def viewPointBox(data: pd.DataFrame) -> pd.DataFrame:
     """
     mid = len(data)//2
     datum = data.iloc[mid]
-    origin = (datum.latitude, datum.longitude)
-    pointNW = distance.distance(meters=DISTANCE_FROM_MIDDLE).destination(origin, bearing=315)
-    pointSE = distance.distance(meters=DISTANCE_FROM_MIDDLE).destination(origin, bearing=135)
-    data = list(zip([ pointNW[0], pointSE[0], ], [ pointNW[1], pointSE[1], ]))
-    boundaryBox = pd.DataFrame(data, columns=[ 'latitude', 'longitude', ])
+    latitudes, longitudes = destination(datum.latitude, datum.longitude, [ 315.0, 135.0, ], DISTANCE_FROM_MIDDLE)
+    boundaryBox = pd.DataFrame({ 'latitude': latitudes, 'longitude': longitudes, })
     return boundaryBox
 
 
 def _resolveMaxScoreTimeFrom(jumpResult: JumpResults) -> float:
     scoreTime = jumpResult.scores[jumpResult.score]
-    workData = jumpResult.data.reset_index(drop=True).copy()
-    ref = workData.index[workData.plotTime == scoreTime][0]+round(SCORING_INTERVAL/SAMPLE_RATE/2.0)-1
-    return workData.iloc[ref].plotTime
+    plotTime = jumpResult.data.plotTime.to_numpy()
+    ref = np.flatnonzero(plotTime == scoreTime)[0]+round(SCORING_INTERVAL/SAMPLE_RATE/2.0)-1
+    return plotTime[ref]
 
 
 def _resolveMaxSpeedTimeFrom(jumpResult: JumpResults) -> float:
@@ -99,9 +97,8 @@ def speedJumpTrajectory(jumpResult: JumpResults,
     `st.map`
     """
     if jumpResult.data is not None and jumpResult.score != None and jumpResult.scores != None:
-        workData = jumpResult.data.copy()
         scoresData = pd.DataFrame(list(jumpResult.scores.items()), columns=[ 'score', 'plotTime', ])
-        workData = pd.merge(workData, scoresData, on='plotTime', how='left')
+        workData = pd.merge(jumpResult.data, scoresData, on='plotTime', how='left')
         workData.vKMh = workData.vKMh.apply(lambda x: round(x, 2))
         workData.speedAngle = workData.speedAngle.apply(lambda x: round(x, 2))
         if displayScorePoint:
@@ -112,11 +109,11 @@ def speedJumpTrajectory(jumpResult: JumpResults,
             maxValueTime = _resolveMaxSpeedTimeFrom(jumpResult)
             maxColorOuter = [ 255, 0, 0, 255, ]  # red
             maxCollorDot = [ 255, 255, 0, 255, ]  # yellow
-        bearing = jumpRunBearing(jumpResult.data)
+        bearing, _ = jumpGeometryFrom(jumpResult)
         exitRow = workData.iloc[0]
-        exitPoint = (exitRow.latitude, exitRow.longitude)
-        backPoint = distance.distance(meters=JUMP_RUN_BACK_M).destination(exitPoint, bearing=(bearing+180)%360)
-        aheadPoint = distance.distance(meters=JUMP_RUN_AHEAD_M).destination(exitPoint, bearing=bearing)
+        latitudes, longitudes = destination(exitRow.latitude, exitRow.longitude, [ (bearing+180)%360, bearing, ], [ JUMP_RUN_BACK_M, JUMP_RUN_AHEAD_M, ])
+        backPoint = (latitudes[0], longitudes[0])
+        aheadPoint = (latitudes[1], longitudes[1])
         jumpRunPath = pd.DataFrame({
             'path': [[[backPoint[1], backPoint[0]], [exitRow.longitude, exitRow.latitude], [aheadPoint[1], aheadPoint[0]]]],
             'color': [[200, 200, 200, 180]],
@@ -210,9 +207,8 @@ def multipleSpeedJumpsTrajectories(jumpResults, tagColors: dict):
     for tag in resultTags:
         jumpResult = jumpResults[tag]
         if jumpResult.scores != None:
-            workData = jumpResult.data.copy()
-            exitPointData = workData.head(1)
-            exitPointData['label'] = tag
+            workData = jumpResult.data
+            exitPointData = workData.head(1).assign(label=tag)
             maxScoreTime = _resolveMaxScoreTimeFrom(jumpResult)
             trackColor = convertHexColorToRGB(tagColors[tag])
             layers = [
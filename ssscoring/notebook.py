@@ -4,8 +4,7 @@
 ## Utility reusable code for notebooks.
 """
 
-from ssscoring.calc import forwardLateralDisplacement
-from ssscoring.calc import jumpRunBearing
+from ssscoring.calc import jumpGeometryFrom
 from ssscoring.constants import DEFAULT_PLOT_MAX_V_SCALE
 from ssscoring.constants import DEFAULT_SPEED_ACCURACY_SCALE
 from ssscoring.constants import MAX_ALTITUDE_FT
@@ -547,11 +546,7 @@ def graphGroundTrack(figure,
     st.plotly_chart(figure, width='stretch')
 ```
     """
-    data = jumpResult.data
-    exitLat = float(data.latitude.iloc[0])
-    exitLon = float(data.longitude.iloc[0])
-    bearing = jumpRunBearing(data)
-    displacement = forwardLateralDisplacement(data, exitLat, exitLon, bearing)
+    _, displacement = jumpGeometryFrom(jumpResult)
 
     figure.add_trace(go.Scatter(
         x=displacement.forwardM,
@@ -652,11 +647,7 @@ def graphForwardDisplacement(figure,
     st.plotly_chart(figure, width='stretch')
 ```
     """
-    data = jumpResult.data
-    exitLat = float(data.latitude.iloc[0])
-    exitLon = float(data.longitude.iloc[0])
-    bearing = jumpRunBearing(data)
-    displacement = forwardLateralDisplacement(data, exitLat, exitLon, bearing)
+    _, displacement = jumpGeometryFrom(jumpResult)
 
     figure.add_trace(go.Scatter(
         x=displacement.plotTime,
@@ -14,11 +14,11 @@ from ssscoring.appcommon import fetchResource
 from ssscoring.appcommon import initFileUploaderState
 from ssscoring.appcommon import interpretJumpResult
 from ssscoring.appcommon import plotJumpResult
+from ssscoring.appcommon import processUploadedJumpFiles
 from ssscoring.appcommon import setSideBarAndMain
 from ssscoring.calc import aggregateResults
 from ssscoring.calc import collateAnglesByTimeFromExit
 from ssscoring.calc import dropNonSkydiveDataFrom
-from ssscoring.calc import processAllJumpFiles
 from ssscoring.calc import totalResultsFrom
 from ssscoring.constants import DEFAULT_PLOT_INCREMENT
 from ssscoring.constants import DEFAULT_PLOT_MAX_V_SCALE
@@ -99,8 +99,7 @@ def _displayBadRowsISCAccuracyExceeded(data: pd.DataFrame, window: PerformanceWi
     st.dataframe(badRows, hide_index=True)
 
 
-    workData = data.copy()
-    workData = dropNonSkydiveDataFrom(workData)
+    workData = dropNonSkydiveDataFrom(data)
     times = pd.to_datetime(workData.timeUnix, unit='s').dt.strftime('%Y-%m-%d %H:%M:%S.%f').str[:-4]
     workData.insert(0, 'time', times)
     st.html('<h3>Full speed run data (%d rows)</h3>' % len(workData))
@@ -132,15 +131,24 @@ def _displaySpeedSummary(aggregate: pd.DataFrame,
         st.plotly_chart(allJumpsPlot, width='stretch')
 
 
+def _lazyExpander(label: str, key: str, **kwargs):
+    # Tracks its open state, so that its contents are only built when open.
+    return st.expander(label, key=key, on_change='rerun', **kwargs)
+
+
 def _displaySpeedAngles(jumpResults: dict):
-    with st.expander('**Speed angles**', icon=':material/arrow_back_ios_new:'):
-        angles = collateAnglesByTimeFromExit(jumpResults).style.format(precision=1)
-        st.dataframe(angles)
+    expander = _lazyExpander('**Speed angles**', 'totals-speedAngles', icon=':material/arrow_back_ios_new:')
+    if expander.open:
+        with expander:
+            angles = collateAnglesByTimeFromExit(jumpResults).style.format(precision=1)
+            st.dataframe(angles)
 
 
 def _displayAllTracksOnMap(jumpResults: dict, tagColors: dict):
-    with st.expander('**All jumps trajectories**', expanded=True):
-        displayTrackOnMap(multipleSpeedJumpsTrajectories(jumpResults, tagColors))
+    expander = _lazyExpander('**All jumps trajectories**', 'totals-map', expanded=True)
+    if expander.open:
+        with expander:
+            displayTrackOnMap(multipleSpeedJumpsTrajectories(jumpResults, tagColors))
 
 
 _FILE_ERROR_LABELS = {
@@ -169,6 +177,72 @@ def _maxSpeedScaleFrom(jumpResults: dict) -> float:
         return DEFAULT_PLOT_MAX_V_SCALE
 
 
+@st.fragment
+def _displayJumpTab(tag: str,
+                    jumpResult,
+                    jumpStatusInfo: str,
+                    scoringInfo: str,
+                    badJumpLegend: str,
+                    jumpStatus: JumpStatus,
+                    showJumpData: bool):
+    st.html('<h3>'+jumpStatusInfo+scoringInfo+(str(badJumpLegend) if badJumpLegend else ''))
+    st.html("<br>If this was NOT a warm-up file, it's probably an ISC altitude violation; please report to Eugene/pr3d4t0r and attach the TRACK.CSV file</h3>" if jumpStatus in [ JumpStatus.WARM_UP_FILE, ] else '</h3>')
+    if showJumpData:
+        displayJumpDataIn(jumpResult.table)
+        expander = _lazyExpander('Max score = crosshairs.  Max speed = diamond. V-accel = exponential mean average over 4 seconds.', '%s-plot' % tag, expanded=True)
+        if expander.open:
+            with expander:
+                plotJumpResult(tag, jumpResult)
+        if jumpResult.data is not None:
+            expander = _lazyExpander('**Horizontal displacement** - optimal ≦ 500 m from exit', '%s-displacement' % tag, expanded=True)
+            if expander.open:
+                with expander:
+                    groundTrackColumn, forwardDisplacementColumn = st.columns(2)
+                    with groundTrackColumn:
+                        groundTrackFigure = initializeGroundTrackPlot(tag, backgroundColorName='#2c2c2c')
+                        graphGroundTrack(groundTrackFigure, jumpResult)
+                        st.plotly_chart(groundTrackFigure, width='stretch')
+                    with forwardDisplacementColumn:
+                        displacementFigure = initializePlot(tag, yLabel='forward (m)', backgroundColorName='#2c2c2c', height=450)
+                        graphForwardDisplacement(displacementFigure, jumpResult)
+                        st.plotly_chart(displacementFigure, width='stretch')
+        expander = _lazyExpander('Speed run / jump run', '%s-map' % tag, expanded=True)
+        if expander.open:
+            with expander:
+                st.session_state.displayScorePoint = st.toggle('Display max score / max speed point', value=True, help='Show the fastest speed or score point along the flight path', key=tag)
+                displayTrackOnMap(speedJumpTrajectory(jumpResult, st.session_state.displayScorePoint), st.session_state.displayScorePoint, showJumpRunLegend=True)
+        _displayAllJumpDataIn(jumpResult.data)
+        _displayScoresIn(jumpResult.scores)
+    elif jumpStatus == JumpStatus.SPEED_ACCURACY_EXCEEDS_LIMIT:
+        _displayBadRowsISCAccuracyExceeded(jumpResult.data, jumpResult.window)
+
+
+@st.fragment
+def _displayTotalsIn(jumpResults: dict, jumpResultsSubset: dict):
+    if not len(jumpResults):
+        return
+    _displayFileErrorsIn(jumpResults, jumpResultsSubset)
+    if not jumpResultsSubset:
+        return
+    allJumpsPlot = initializePlot('All jumps', backgroundColorName='#2c2c2c', yMax=_maxSpeedScaleFrom(jumpResults))
+    tagColors = resolveJumpColors(jumpResultsSubset)
+    for tag in sorted(jumpResultsSubset.keys(), reverse=True):
+        jumpResult = jumpResultsSubset[tag]
+        graphJumpResult(
+            allJumpsPlot,
+            jumpResult,
+            lineColor=tagColors[tag],
+            legend='%s = %.2f' % (tag, jumpResult.score if jumpResult.score else -1.0),
+            showIt=False
+        )
+    aggregate = aggregateResults(jumpResultsSubset)
+    if len(aggregate) > 0:
+        _displayJumpsInSet(aggregate)
+        _displaySpeedAngles(jumpResults)
+        _displaySpeedSummary(aggregate, allJumpsPlot)
+        _displayAllTracksOnMap(jumpResults, tagColors)
+
+
 def main():
     st.set_page_config(
         layout = 'wide',
@@ -178,77 +252,38 @@ def main():
     setSideBarAndMain('🔢', False, _selectDZState)
 
     if st.session_state.trackFiles:
-        jumpResults = processAllJumpFiles(st.session_state.trackFiles, altitudeDZMeters=st.session_state.elevation)
-        allJumpsPlot = initializePlot('All jumps', backgroundColorName='#2c2c2c', yMax=_maxSpeedScaleFrom(jumpResults))
+        jumpResults = processUploadedJumpFiles(st.session_state.trackFiles, altitudeDZMeters=st.session_state.elevation)
         jumpResultsSubset = dict()
+        jumpTabsInfo = dict()
         resultTags = sorted(list(jumpResults.keys()), reverse=True)
-        tabs = st.tabs(['Totals']+resultTags)
-        index = 1
-        jumpStatus = JumpStatus.OK
         for tag in resultTags:
             jumpResult = jumpResults[tag]
-            with tabs[index]:
-                jumpStatusInfo,\
-                scoringInfo,\
-                badJumpLegend,\
-                jumpStatus = interpretJumpResult(tag, jumpResult, st.session_state.processBadJump)
-                if jumpStatus != JumpStatus.OK:
-                    st.toast('#### %s - %s' % (tag, str(jumpStatus)), icon='⚠️')
-                showJumpData = False
-                match jumpStatus:
-                    case JumpStatus.OK:
-                        showJumpData = True
-                    case JumpStatus.UNSUPPORTED_PLD_FORMAT:
-                        pass
-                    case _ if st.session_state.processBadJump:
-                        showJumpData = True
-                if showJumpData:
-                    jumpResultsSubset[tag] = jumpResult
-                st.html('<h3>'+jumpStatusInfo+scoringInfo+(str(badJumpLegend) if badJumpLegend else ''))
-                st.html("<br>If this was NOT a warm-up file, it's probably an ISC altitude violation; please report to Eugene/pr3d4t0r and attach the TRACK.CSV file</h3>" if jumpStatus in [ JumpStatus.WARM_UP_FILE, ] else '</h3>')
-                if showJumpData:
-                    displayJumpDataIn(jumpResult.table)
-                    with st.expander('Max score = crosshairs.  Max speed = diamond. V-accel = exponential mean average over 4 seconds.', expanded=True):
-                        plotJumpResult(tag, jumpResult)
-                    if jumpResult.data is not None:
-                        with st.expander('**Horizontal displacement** - optimal ≦ 500 m from exit', expanded=True):
-                            groundTrackColumn, forwardDisplacementColumn = st.columns(2)
-                            with groundTrackColumn:
-                                groundTrackFigure = initializeGroundTrackPlot(tag, backgroundColorName='#2c2c2c')
-                                graphGroundTrack(groundTrackFigure, jumpResult)
-                                st.plotly_chart(groundTrackFigure, width='stretch')
-                            with forwardDisplacementColumn:
-                                displacementFigure = initializePlot(tag, yLabel='forward (m)', backgroundColorName='#2c2c2c', height=450)
-                                graphForwardDisplacement(displacementFigure, jumpResult)
-                                st.plotly_chart(displacementFigure, width='stretch')
-                    with st.expander('Speed run / jump run', expanded=True):
-                        st.session_state.displayScorePoint = st.toggle('Display max score / max speed point', value=True, help='Show the fastest speed or score point along the flight path', key=tag)
-                        displayTrackOnMap(speedJumpTrajectory(jumpResult, st.session_state.displayScorePoint), st.session_state.displayScorePoint, showJumpRunLegend=True)
-                    _displayAllJumpDataIn(jumpResult.data)
-                    _displayScoresIn(jumpResult.scores)
-                elif jumpStatus == JumpStatus.SPEED_ACCURACY_EXCEEDS_LIMIT:
-                    _displayBadRowsISCAccuracyExceeded(jumpResult.data, jumpResult.window)
-            index += 1
-        with tabs[0]:
-            if len(resultTags):
-                _displayFileErrorsIn(jumpResults, jumpResultsSubset)
-                if jumpResultsSubset:
-                    tagColors = resolveJumpColors(jumpResultsSubset)
-                    for tag in sorted(jumpResultsSubset.keys(), reverse=True):
-                        jumpResult = jumpResultsSubset[tag]
-                        graphJumpResult(
-                            allJumpsPlot,
-                            jumpResult,
-                            lineColor=tagColors[tag],
-                            legend='%s = %.2f' % (tag, jumpResult.score if jumpResult.score else -1.0),
-                            showIt=False
-                        )
-                    aggregate = aggregateResults(jumpResultsSubset)
-                    if len(aggregate) > 0:
-                        _displayJumpsInSet(aggregate)
-                        _displaySpeedAngles(jumpResults)
-                        _displaySpeedSummary(aggregate, allJumpsPlot)
-                        _displayAllTracksOnMap(jumpResults, tagColors)
+            jumpStatusInfo,\
+            scoringInfo,\
+            badJumpLegend,\
+            jumpStatus = interpretJumpResult(tag, jumpResult, st.session_state.processBadJump)
+            if jumpStatus != JumpStatus.OK:
+                st.toast('#### %s - %s' % (tag, str(jumpStatus)), icon='⚠️')
+            showJumpData = False
+            match jumpStatus:
+                case JumpStatus.OK:
+                    showJumpData = True
+                case JumpStatus.UNSUPPORTED_PLD_FORMAT:
+                    pass
+                case _ if st.session_state.processBadJump:
+                    showJumpData = True
+            if showJumpData:
+                jumpResultsSubset[tag] = jumpResult
+            jumpTabsInfo[tag] = (jumpStatusInfo, scoringInfo, badJumpLegend, jumpStatus, showJumpData)
+        # Only the open tab is rendered; each tab reruns on its own widgets.
+        tabs = st.tabs(['Totals']+resultTags, key='jumpTabs', on_change='rerun')
+        if tabs[0].open:
+            with tabs[0]:
+                _displayTotalsIn(jumpResults, jumpResultsSubset)
+        for tab, tag in zip(tabs[1:], resultTags):
+            if tab.open:
+                with tab:
+                    _displayJumpTab(tag, jumpResults[tag], *jumpTabsInfo[tag])
     else:
         st.write(fetchInstructionsHTML(), unsafe_allow_html=True)
 
@@ -0,0 +1,372 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+"""
+Columnar track archives, a compact alternative to the FlySight CSV files in a
+data lake.  An archive holds the raw track dataframe exactly as the
+`ssscoring.flysight` readers return it, so that loading it is equivalent to
+parsing the original CSV file, plus the track metadata:  the FlySight version,
+the tag, the source file name, and the original header lines, including the
+FlySight 2 `$FLYS` device variables.
+
+Archives are LZ4 compressed Feather (Arrow IPC) files if PyArrow is installed,
+otherwise compressed NumPy archives.  Either kind loads regardless of its file
+suffix.
+"""
+
+
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+from ssscoring.constants import IGNORE_LIST
+from ssscoring.constants import TRACK_ARCHIVE_SUFFIX
+from ssscoring.datatypes import FlySightVersion
+from ssscoring.errors import SSScoringError
+from ssscoring.flysight import dataLakeVersionOf
+from ssscoring.flysight import getAllSpeedJumpFilesFrom
+from ssscoring.flysight import getFlySightDataFromFileBuffer
+from ssscoring.flysight import headerLinesIn
+from ssscoring.flysight import headerPrefixIn
+from ssscoring.flysight import trackFormatOf
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pf
+except ImportError:
+    pa = None
+    pf = None
+
+
+# +++ constants +++
+
+_ARCHIVE_FORMAT_VERSION = 1
+_FEATHER_SIGNATURE = b'ARROW1'
+_METADATA_KEY = b'ssscoring'
+_NPZ_SIGNATURE = b'PK\x03\x04'
+
+
+# +++ implementation +++
+
+def isTrackArchive(fileThing) -> bool:
+    """
+    Tests if `fileThing` is named like a track archive.
+
+    Arguments
+    ---------
+        fileThing
+    A string or `pathlib.Path` object.
+
+    Returns
+    -------
+    `True` if the file name ends in `TRACK_ARCHIVE_SUFFIX`.
+    """
+    return isinstance(fileThing, (str, Path)) and str(fileThing).endswith(TRACK_ARCHIVE_SUFFIX)
+
+
+def _archiveEngineFor(engine: str) -> str:
+    if engine is None:
+        engine = 'npz' if pf is None else 'feather'
+    if engine == 'feather' and pf is None:
+        raise SSScoringError('Feather track archives require the pyarrow package')
+    if engine not in ('feather', 'npz', ):
+        raise SSScoringError('unsupported track archive engine %s' % engine)
+    return engine
+
+
+def _variablesIn(headerLines: list) -> dict:
+    fields = (line.split(',', 2) for line in headerLines if line.startswith('$VAR,'))
+    return { field[1]: field[2] if len(field) > 2 else '' for field in fields }
+
+
+def _writeFeather(rawData: pd.DataFrame, metadata: dict, outputFile):
+    table = pa.Table.from_pandas(rawData, preserve_index = False)
+    table = table.replace_schema_metadata({ **table.schema.metadata, _METADATA_KEY: json.dumps(metadata).encode() })
+    pf.write_feather(table, outputFile, compression = 'lz4')
+
+
+def _writeNPZ(rawData: pd.DataFrame, metadata: dict, outputFile):
+    arrays = dict()
+    dtypes = list()
+    for n, column in enumerate(rawData.columns):
+        values = rawData[column]
+        dtypes.append(str(values.dtype))
+        if values.dtype.kind in 'fiub':
+            arrays['data.%d' % n] = values.to_numpy()
+        else:
+            arrays['data.%d' % n] = values.fillna('').to_numpy(dtype = str)
+            arrays['data.%d.null' % n] = values.isna().to_numpy()
+    metadata = { **metadata, 'columns': [ str(column) for column in rawData.columns ], 'dtypes': dtypes, }
+    arrays['meta'] = np.array(json.dumps(metadata))
+    np.savez_compressed(outputFile, **arrays)
+
+
+def writeTrackArchive(jumpFile, archiveFile, engine = None) -> dict:
+    """
+    Convert a FlySight or Insight track file to a track archive.  The archive
+    is written atomically.
+
+    Arguments
+    ---------
+        jumpFile
+    A string or `pathlib.Path` object with the track file name.
+
+        archiveFile
+    A string or `pathlib.Path` object with the archive file name, usually with
+    a `TRACK_ARCHIVE_SUFFIX` suffix.
+
+        engine
+    The archive format, `'feather'` or `'npz'`.  Default: `'feather'` if
+    PyArrow is installed, otherwise `'npz'`.
+
+    Returns
+    -------
+    The archive metadata, as returned by `trackArchiveMetadataOf`.
+
+    Raises
+    ------
+    `SSScoringError` if `jumpFile` isn't a valid track file or if the engine
+    isn't supported or available.
+    """
+    engine = _archiveEngineFor(engine)
+    jumpFile = Path(jumpFile).as_posix()
+    with open(jumpFile, 'rb') as inputFile:
+        buffer = inputFile.read()
+    prefix = headerPrefixIn(buffer)
+    trackFormat = trackFormatOf(prefix)
+    rawData, tag = getFlySightDataFromFileBuffer(buffer, jumpFile)
+    if rawData is None:
+        raise SSScoringError('%s is not a speed skydiving track file' % jumpFile)
+    headerLines = headerLinesIn(prefix)
+    metadata = {
+        'archiveFormat': _ARCHIVE_FORMAT_VERSION,
+        'version': trackFormat.version.name,
+        'tag': tag,
+        'source': jumpFile,
+        'header': headerLines,
+        'variables': _variablesIn(headerLines),
+    }
+    archiveFile = Path(archiveFile)
+    archiveFile.parent.mkdir(parents = True, exist_ok = True)
+    with tempfile.NamedTemporaryFile(dir = archiveFile.parent, prefix = '.%s.' % archiveFile.stem, suffix = '.tmp', delete = False) as outputFile:
+        tempFileName = outputFile.name
+        try:
+            if engine == 'feather':
+                _writeFeather(rawData, metadata, outputFile)
+            else:
+                _writeNPZ(rawData, metadata, outputFile)
+        except BaseException:
+            outputFile.close()
+            os.unlink(tempFileName)
+            raise
+    os.replace(tempFileName, archiveFile)
+    return metadata
+
+
+def _archiveSourceOf(fileThing):
+    # (source, signature) of an archive file name or bytes-like buffer.
+    if isinstance(fileThing, (bytes, bytearray, memoryview)):
+        view = memoryview(fileThing)
+        return (view, bytes(view[:len(_FEATHER_SIGNATURE)]))
+    if not isinstance(fileThing, (str, Path)):
+        raise SSScoringError('fileThing must be a string, a Path, or a bytes-like object')
+    with open(fileThing, 'rb') as inputFile:
+        return (fileThing, inputFile.read(len(_FEATHER_SIGNATURE)))
+
+
+def _featherSourceOf(source):
+    if pf is None:
+        raise SSScoringError('Feather track archives require the pyarrow package')
+    return pa.BufferReader(pa.py_buffer(source)) if isinstance(source, memoryview) else source
+
+
+def _npzSourceOf(source):
+    return BytesIO(source) if isinstance(source, memoryview) else source
+
+
+def _loadFeather(source, columns) -> tuple:
+    table = pf.read_table(_featherSourceOf(source), columns = None if columns is None else list(columns))
+    metadata = json.loads(table.schema.metadata[_METADATA_KEY])
+    return (table.to_pandas(), metadata)
+
+
+def _loadNPZ(source, columns) -> tuple:
+    with np.load(_npzSourceOf(source), allow_pickle = False) as archive:
+        metadata = json.loads(str(archive['meta']))
+        allColumns = metadata['columns']
+        if columns is None:
+            columns = allColumns
+        data = dict()
+        for column in columns:
+            n = allColumns.index(column)
+            values = pd.Series(archive['data.%d' % n], dtype = metadata['dtypes'][n])
+            if 'data.%d.null' % n in archive.files:
+                values = values.mask(archive['data.%d.null' % n])
+            data[column] = values
+    return (pd.DataFrame(data, columns = list(columns)), metadata)
+
+
+def _loadTrackArchive(fileThing, columns) -> tuple:
+    source, signature = _archiveSourceOf(fileThing)
+    try:
+        if signature == _FEATHER_SIGNATURE:
+            return _loadFeather(source, columns)
+        elif signature.startswith(_NPZ_SIGNATURE):
+            return _loadNPZ(source, columns)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise SSScoringError('invalid track archive - %s' % str(e))
+    raise SSScoringError('%s is not a track archive' % fileThing)
+
+
+def loadTrackArchive(fileThing, columns = None) -> tuple:
+    """
+    Load a track archive for SSScoring processing.  The counterpart of
+    `ssscoring.flysight.getFlySightDataFromCSVFileName` for track archives.
+
+    Arguments
+    ---------
+        fileThing
+    A string or `pathlib.Path` object with the archive file name, or a
+    bytes-like object with the archive contents.
+
+        columns
+    An optional sequence of column names to load, e.g. `RAW_TRACK_COLUMNS`;
+    the other columns aren't read.  Default: all columns.
+
+    Returns
+    -------
+    A `tuple` with two items:
+        - `rawData` - the raw track dataframe, the same as reading the original
+          track file with `ssscoring.flysight.getFlySightDataFromCSVFileName`
+        - `tag` - the tag of the original track file
+
+    Raises
+    ------
+    `SSScoringError` if `fileThing` isn't a valid track archive.
+    """
+    rawData, metadata = _loadTrackArchive(fileThing, columns)
+    return (rawData, metadata['tag'])
+
+
+def trackArchiveMetadataOf(fileThing) -> dict:
+    """
+    Get the metadata stored in a track archive.
+
+    Arguments
+    ---------
+        fileThing
+    A string or `pathlib.Path` object with the archive file name, or a
+    bytes-like object with the archive contents.
+
+    Returns
+    -------
+    A dictionary with the track metadata:
+        - `archiveFormat` - the archive layout version
+        - `version` - the `FlySightVersion` name of the original track file
+        - `tag` - the tag of the original track file
+        - `source` - the original track file name
+        - `header` - list of the original header lines, without EOL markers
+        - `variables` - dictionary of the FlySight 2 `$VAR` device variables,
+          e.g. `FIRMWARE_VER`, `DEVICE_ID`, `SESSION_ID`; empty for other
+          devices
+
+    Raises
+    ------
+    `SSScoringError` if `fileThing` isn't a valid track archive.
+    """
+    source, signature = _archiveSourceOf(fileThing)
+    if signature == _FEATHER_SIGNATURE:
+        try:
+            return json.loads(pf.read_table(_featherSourceOf(source), columns = []).schema.metadata[_METADATA_KEY])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise SSScoringError('invalid track archive - %s' % str(e))
+    _, metadata = _loadTrackArchive(fileThing, [])
+    for key in ('columns', 'dtypes', ):
+        metadata.pop(key, None)
+    return metadata
+
+
+def compactDataLake(dataLake, archiveLake = None, engine = None) -> dict:
+    """
+    Convert all the speed jump files in a data lake to track archives.  Each
+    archive has the relative path of its track file in `archiveLake`, with the
+    `TRACK_ARCHIVE_SUFFIX` suffix instead of the CSV one.  Archives newer than
+    their track file aren't rewritten, so compacting a data lake again only
+    converts new or changed files.  Track files inside zip, tar, or gzip
+    bundles aren't converted.
+
+    Arguments
+    ---------
+        dataLake
+    A string or `pathlib.Path` object with the data lake directory.
+
+        archiveLake
+    A string or `pathlib.Path` object with the archive directory.  Default:
+    `dataLake`, storing each archive next to its track file.
+
+        engine
+    Same as in `writeTrackArchive`.
+
+    Returns
+    -------
+    A dictionary of archive file names, keyed by track file name, in the same
+    order as `ssscoring.flysight.getAllSpeedJumpFilesFrom`.
+
+    See
+    ---
+    `ssscoring.trackarchive.getAllTrackArchivesFrom`
+    """
+    engine = _archiveEngineFor(engine)
+    dataLake = Path(dataLake)
+    archiveLake = dataLake if archiveLake is None else Path(archiveLake)
+    archives = OrderedDict()
+    for jumpFile in getAllSpeedJumpFilesFrom(dataLake, bundles = False):
+        jumpFile = Path(jumpFile)
+        archiveFile = (archiveLake / jumpFile.relative_to(dataLake)).with_suffix(TRACK_ARCHIVE_SUFFIX)
+        if not archiveFile.is_file() or archiveFile.stat().st_mtime_ns < jumpFile.stat().st_mtime_ns:
+            try:
+                writeTrackArchive(jumpFile, archiveFile, engine)
+            except SSScoringError:
+                continue
+        archives[jumpFile] = archiveFile
+    return archives
+
+
+def getAllTrackArchivesFrom(dataLake) -> dict:
+    """
+    Get all the track archives from a data lake.  The counterpart of
+    `ssscoring.flysight.getAllSpeedJumpFilesFrom` for track archives; only the
+    archives' metadata is read.
+
+    Arguments
+    ---------
+        dataLake
+    A string or `pathlib.Path` object with the data lake directory.
+
+    Returns
+    -------
+    A dictionary of track archive file names for later SSScoring processing,
+    e.g. with `ssscoring.calc.processAllJumpFiles`:
+        - keys are the file names
+        - values are a FlySight version string tag
+    """
+    archives = OrderedDict()
+    for root, dirs, files in os.walk(dataLake):
+        if any(name in root for name in IGNORE_LIST):
+            continue
+        for fileName in files:
+            if not isTrackArchive(fileName):
+                continue
+            archiveFile = Path(root) / fileName
+            try:
+                version = FlySightVersion[trackArchiveMetadataOf(archiveFile)['version']]
+            except (SSScoringError, OSError, KeyError):
+                continue
+            archives[archiveFile] = dataLakeVersionOf(version)
+    return OrderedDict(sorted(archives.items()))
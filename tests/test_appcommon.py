@@ -9,13 +9,17 @@ from ssscoring.appcommon import fetchResource
 from ssscoring.appcommon import initDropZonesFromResource
 from ssscoring.appcommon import interpretJumpResult
 from ssscoring.appcommon import isStreamlitHostedApp
+from ssscoring.appcommon import processUploadedJumpFiles
 from ssscoring.constants import SSSCORE_DOWNLOAD_PNG
 from ssscoring.calc import convertFlySight2SSScoring
+from ssscoring.calc import processAllJumpFiles
 from ssscoring.calc import processJump
 from ssscoring.constants import DZ_DIRECTORY
 from ssscoring.datatypes import JumpStatus
 from ssscoring.errors import SSScoringError
 
+from io import BytesIO
+
 import warnings
 import os
 import pathlib
@@ -107,6 +111,27 @@ def test_fetchInstructionsHTML():
     assert '{{SSSCORE_ICON_128}}' not in html
 
 
+class _NamedBytesIO(BytesIO):
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+
+
+def test_processUploadedJumpFiles():
+    trackFiles = [ _NamedBytesIO(TEST_FLYSIGHT_DATA.read_bytes(), 'test-data-00.CSV'),
+                   _NamedBytesIO(TEST_FLYSIGHT_DATA_V1_WARM_UP.read_bytes(), 'test-data-05-warm-up.CSV'),
+                   _NamedBytesIO(b'bogus', 'SENSOR.CSV'), ]
+    expected = processAllJumpFiles(trackFiles, altitudeDZMeters = 42.0)
+    for _ in range(2):
+        jumpResults = processUploadedJumpFiles(trackFiles, altitudeDZMeters = 42.0)
+        assert list(jumpResults.keys()) == list(expected.keys())
+        for tag in expected:
+            assert jumpResults[tag].status == expected[tag].status
+            assert jumpResults[tag].score == expected[tag].score
+    jumpResults = processUploadedJumpFiles(trackFiles[:1], altitudeDZMeters = 0.0)
+    assert jumpResults['test-data-00:v1'].window != expected['test-data-00:v1'].window
+
+
 # test_interpretJumpResult()
 # test_fetchResource()
 # test_fetchInstructionsHTML()
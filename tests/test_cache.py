@@ -0,0 +1,103 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+from ssscoring import cache
+from ssscoring.cache import jumpCacheKey
+from ssscoring.cache import loadCachedJumpResult
+from ssscoring.cache import storeJumpResult
+from ssscoring.calc import convertFlySight2SSScoring
+from ssscoring.calc import processAllJumpFiles
+from ssscoring.calc import processJump
+from ssscoring.datatypes import JumpStatus
+from ssscoring.flysight import getAllSpeedJumpFilesFrom
+from ssscoring.flysight import getFlySightDataFromCSVFileName
+
+import os
+import pathlib
+
+import pandas as pd
+
+
+# +++ constants +++
+
+TEST_FLYSIGHT_DATA_LAKE = './resources/test-tracks'
+TEST_FLYSIGHT_DATA_V2 = pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS2' / '01-00-00' / 'TRACK.CSV'
+
+
+# +++ tests +++
+
+def _assertSameJumpResult(jumpResult, expected):
+    assert jumpResult.status == expected.status
+    assert jumpResult.score == expected.score
+    assert jumpResult.maxSpeed == expected.maxSpeed
+    assert jumpResult.scores == expected.scores
+    assert jumpResult.window == expected.window
+    assert jumpResult.backFall == expected.backFall
+    assert jumpResult.backFallOnset == expected.backFallOnset
+    for frame in ('data', 'table', ):
+        if getattr(expected, frame) is None:
+            assert getattr(jumpResult, frame) is None
+        else:
+            pd.testing.assert_frame_equal(getattr(jumpResult, frame), getattr(expected, frame))
+
+
+def test_jumpCacheKey():
+    buffer = TEST_FLYSIGHT_DATA_V2.read_bytes()
+    assert jumpCacheKey(buffer) == jumpCacheKey(buffer, 0.0)
+    assert jumpCacheKey(buffer) != jumpCacheKey(buffer, 42.0)
+    assert jumpCacheKey(buffer) != jumpCacheKey(buffer+b'\n')
+
+
+def test_storeJumpResult(tmp_path):
+    rawData, tag = getFlySightDataFromCSVFileName(TEST_FLYSIGHT_DATA_V2)
+    jumpResult = processJump(convertFlySight2SSScoring(rawData))
+    key = jumpCacheKey(TEST_FLYSIGHT_DATA_V2.read_bytes())
+    assert loadCachedJumpResult(tmp_path, key) is None
+    storeJumpResult(tmp_path, key, tag, jumpResult)
+    cachedTag, cachedJumpResult = loadCachedJumpResult(tmp_path, key)
+    assert cachedTag == tag
+    _assertSameJumpResult(cachedJumpResult, jumpResult)
+
+    (tmp_path / (key+'.npz')).write_bytes(b'bogus')
+    assert loadCachedJumpResult(tmp_path, key) is None
+
+
+def test_storeJumpResult_eviction(tmp_path):
+    rawData, tag = getFlySightDataFromCSVFileName(TEST_FLYSIGHT_DATA_V2)
+    jumpResult = processJump(convertFlySight2SSScoring(rawData))
+    storeJumpResult(tmp_path, 'a', tag, jumpResult)
+    entrySize = (tmp_path / 'a.npz').stat().st_size
+    os.utime(tmp_path / 'a.npz', ns = (0, 0))
+    storeJumpResult(tmp_path, 'b', tag, jumpResult)
+    os.utime(tmp_path / 'b.npz', ns = (1, 1))
+    assert loadCachedJumpResult(tmp_path, 'a')
+    storeJumpResult(tmp_path, 'c', tag, jumpResult, maxBytes = 2*entrySize+entrySize//2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [ 'a.npz', 'c.npz', ]
+
+
+def test_processAllJumpFiles_cacheDir(tmp_path):
+    jumpFiles = getAllSpeedJumpFilesFrom(TEST_FLYSIGHT_DATA_LAKE)
+    expected = processAllJumpFiles(jumpFiles)
+    jumpResults = processAllJumpFiles(jumpFiles, cacheDir = tmp_path)
+    assert len(list(tmp_path.glob('*.npz')))
+    cachedJumpResults = processAllJumpFiles(jumpFiles, cacheDir = tmp_path, workers = 2)
+    for results in (jumpResults, cachedJumpResults, ):
+        assert list(results.keys()) == list(expected.keys())
+        for tag in expected:
+            _assertSameJumpResult(results[tag], expected[tag])
+    assert any(jumpResult.status == JumpStatus.OK for jumpResult in cachedJumpResults.values())
+
+
+def test_storeJumpResult_scans(tmp_path, monkeypatch):
+    rawData, tag = getFlySightDataFromCSVFileName(TEST_FLYSIGHT_DATA_V2)
+    jumpResult = processJump(convertFlySight2SSScoring(rawData))
+    scans = list()
+    evictFrom = cache._evictFrom
+    monkeypatch.setattr(cache, '_evictFrom', lambda *arguments: scans.append(arguments) or evictFrom(*arguments))
+    storeJumpResult(tmp_path, 'a', tag, jumpResult)
+    entrySize = (tmp_path / 'a.npz').stat().st_size
+    for key in ('b', 'c', 'a', ):
+        storeJumpResult(tmp_path, key, tag, jumpResult, maxBytes = 3*entrySize+entrySize//2)
+    assert len(scans) == 1
+    storeJumpResult(tmp_path, 'd', tag, jumpResult, maxBytes = 3*entrySize+entrySize//2)
+    assert len(scans) == 2
+    assert len(list(tmp_path.iterdir())) == 3
@@ -4,6 +4,9 @@ from io import BytesIO
 
 from ssscoring.calc import _verticalAcceleration
 from ssscoring.calc import aggregateResults
+from ssscoring.calc import aggregateResultsFrom
+from ssscoring.calc import aggregateResultsFromRows
+from ssscoring.calc import aggregateRowFrom
 from ssscoring.calc import calcScoreISC
 from ssscoring.calc import calcScoreMeanVelocity
 from ssscoring.calc import calculateDistance
@@ -12,19 +15,25 @@ from ssscoring.calc import convertFlySight2SSScoring
 from ssscoring.calc import detectBackFall
 from ssscoring.calc import dropNonSkydiveDataFrom
 from ssscoring.calc import forwardLateralDisplacement
+from ssscoring.calc import freeFallSegmentsFrom
 from ssscoring.calc import getSpeedSkydiveFrom
 from ssscoring.calc import isValidJumpISC
+from ssscoring.calc import iterJumpResults
 from ssscoring.calc import isValidMaximumAltitude
 from ssscoring.calc import isValidMinimumAltitude
 from ssscoring.calc import jumpAnalysisTable
+from ssscoring.calc import jumpGeometryFrom
 from ssscoring.calc import jumpRunBearing
 from ssscoring.calc import processAllJumpFiles
+from ssscoring.calc import processAllJumpsInTrack
 from ssscoring.calc import processJump
 from ssscoring.calc import roundedAggregateResults
+from ssscoring.calc import scoringWindowsISC
 from ssscoring.calc import totalResultsFrom
 from ssscoring.calc import validateJumpISC
 from ssscoring.constants import BREAKOFF_ALTITUDE
 from ssscoring.constants import FT_IN_M
+from ssscoring.datatypes import BundleMember
 from ssscoring.datatypes import JumpStatus
 from ssscoring.errors import SSScoringError
 from ssscoring.flysight import getAllSpeedJumpFilesFrom
@@ -34,8 +43,10 @@ from ssscoring.flysight import getFlySightDataFromCSVFileName
 import os
 import pathlib
 import pytest
+import tarfile
 import tempfile
 import warnings
+import zipfile
 
 import numpy as np
 import pandas as pd
@@ -122,6 +133,13 @@ def test_convertFlySight2SSScoring():
     assert 'speedAngle' in _data.columns
     assert _data.altitudeAGL.iloc[0] == rawData.hMSL.iloc[0]-altDZ
     assert _data.altitudeAGLFt.iloc[0] == FT_IN_M*rawData.hMSL.iloc[0]-altDZFt
+    assert _data.timeUnix.iloc[0] == round(pd.Timestamp(rawData.time.iloc[0]).timestamp(), 2)
+    assert _data.timeUnix.equals(np.round(rawData.time.apply(lambda t: pd.Timestamp(t).timestamp()), decimals = 2))
+
+    bogus = rawData.head(10).copy()
+    bogus.loc[5, 'time'] = None
+    with pytest.raises(SSScoringError):
+        convertFlySight2SSScoring(bogus)
 
 
 def test_dropNonSkydiveDataFrom():
@@ -132,6 +150,30 @@ def test_dropNonSkydiveDataFrom():
     assert len(_data) < rowCount
 
 
+def test_freeFallSegmentsFrom():
+    # Climb, jump, canopy, short dive, canopy, jump:
+    vMetersPerSecond = np.concatenate((
+        np.full(20, -5.0),
+        np.full(150, 80.0),
+        np.full(30, -1.0),
+        np.full(50, 90.0),
+        np.full(30, -1.0),
+        np.full(120, 70.0),
+    ))
+    data = pd.DataFrame({ 'vMetersPerSecond': vMetersPerSecond, 'vKMh': vMetersPerSecond*3.6, })
+    segments = freeFallSegmentsFrom(data)
+
+    assert list(segments.start) == [ 0, 20, 170, 200, 250, 280, ]
+    assert list(segments.end) == [ 20, 170, 200, 250, 280, 400, ]
+    assert list(segments.length) == [ 20, 150, 30, 50, 30, 120, ]
+    assert list(segments.freeFall) == [ False, True, False, False, False, True, ]
+    assert segments.maxVKMh.iat[1] == 288.0
+
+    freeFalls = segments[segments.freeFall]
+    assert len(freeFalls) == 2
+    assert not len(freeFallSegmentsFrom(data.iloc[0:0]))
+
+
 def test_getSpeedSkydiveFrom():
     global _data, _window
 
@@ -196,6 +238,15 @@ def test_jumpAnalysisTable():
     assert 'altitude (ft)' in table.columns
     assert 'speedAngle' in table.columns
     assert 'deltaAngle' in table.columns
+    assert list(table.time) == [ 5.0, 10.0, 15.0, 20.0, 25.0, ]
+
+
+def test_jumpAnalysisTable_tranches():
+    table = jumpAnalysisTable(_data, tranches = np.arange(1.0, 26.0))
+    assert len(table) == 25
+    assert list(table.time[:3]) == [ 1.0, 2.0, 3.0, ]
+    table5 = jumpAnalysisTable(_data)
+    pd.testing.assert_series_equal(table5.vKMh, table[table.time.isin(table5.time)].vKMh)
 
 
 def test__verticalAcceleration():
@@ -217,6 +268,19 @@ def test_calcScoreMeanVelocity():
     assert type(scores) == dict
 
 
+def test_calcScoreMeanVelocity_trailingWindow():
+    data = pd.DataFrame({
+        'plotTime': [ 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, ],
+        'vKMh': [ 100.0, 200.0, np.nan, 300.0, 400.0, 500.0, ],
+    })
+    score, scores = calcScoreMeanVelocity(data)
+    assert score == 400.0
+    assert scores[100.0] == 0.0
+    assert scores[150.0] == 2.0
+    assert scores[200.0] == 3.0
+    assert scores[300.0] == 4.0
+
+
 def test_calcScoreISC():
     data = _data.copy()
     baseTime = data.iloc[0].timeUnix
@@ -229,6 +293,24 @@ def test_calcScoreISC():
     assert type(scores) == dict
 
 
+def test_scoringWindowsISC():
+    data = _data.copy()
+    baseTime = data.iloc[0].timeUnix
+    data['plotTime'] = np.round(data.timeUnix-baseTime, decimals = 2)
+
+    windows = scoringWindowsISC(data)
+    assert 'plotTime' in windows.columns
+    assert 'score' in windows.columns
+    assert windows.valid.all()
+    assert windows.score.max() == 444.61
+
+    missingSample = data.drop(data.index[10])
+    windows = scoringWindowsISC(missingSample)
+    assert not windows.valid.all()
+    assert windows[~windows.valid].score.isna().all()
+    assert windows.score.max() == 444.61
+
+
 def test_jumpRunBearing():
     bearing = jumpRunBearing(_data)
     assert 0.0 <= bearing < 360.0
@@ -299,6 +381,21 @@ def test_processJump():
     assert jumpResults.backFallOnset is None
     assert jumpResults.forwardReversalM == 0.0
     assert jumpResults.lateralReversalM == 0.0
+    assert 0.0 <= jumpResults.jumpRunBearing < 360.0
+    assert 'forwardM' in jumpResults.data.columns
+    assert 'lateralM' in jumpResults.data.columns
+
+
+def test_jumpGeometryFrom():
+    jumpResult = processJump(convertFlySight2SSScoring(pd.read_csv(TEST_FLYSIGHT_DATA_V1, skiprows = (1,1))))
+    bearing, data = jumpGeometryFrom(jumpResult)
+    assert bearing == jumpResult.jumpRunBearing
+    assert data is jumpResult.data
+
+    bareData = jumpResult.data.drop(columns = [ 'forwardM', 'lateralM', ])
+    bearing, data = jumpGeometryFrom(jumpResult._replace(data = bareData, jumpRunBearing = None))
+    assert bearing == pytest.approx(jumpResult.jumpRunBearing)
+    pd.testing.assert_frame_equal(data, jumpResult.data)
 
 
 def test_processJump_WarmUpFile():
@@ -353,6 +450,89 @@ def test_processAllJumpFiles():
          processAllJumpFiles(jumpFiles)
 
 
+def test_iterJumpResults():
+    jumpFiles = getAllSpeedJumpFilesFrom(TEST_FLYSIGHT_DATA_LAKE)
+    jumpResults = iterJumpResults(jumpFiles)
+    tag, jumpResult = next(jumpResults)
+    assert isinstance(tag, str)
+    assert jumpResult.status in JumpStatus
+    tags = list(processAllJumpFiles(jumpFiles).keys())
+    assert list(dict.fromkeys([ tag, ]+[ t for t, _ in jumpResults ])) == tags
+    assert list(dict.fromkeys(t for t, _ in iterJumpResults(jumpFiles, workers = 2))) == tags
+
+    with pytest.raises(SSScoringError):
+        next(iterJumpResults(list()))
+
+
+def test_processAllJumpFiles_workers():
+    jumpFiles = getAllSpeedJumpFilesFrom(TEST_FLYSIGHT_DATA_LAKE)
+    serial = processAllJumpFiles(jumpFiles)
+    parallel = processAllJumpFiles(jumpFiles, workers = 2)
+    assert list(parallel.keys()) == list(serial.keys())
+    for tag in serial:
+        assert parallel[tag].status == serial[tag].status
+        assert parallel[tag].score == serial[tag].score
+        assert parallel[tag].scores == serial[tag].scores
+
+    with open(TEST_FLYSIGHT_DATA, 'rb') as inputFile:
+        v1Bytes = inputFile.read()
+    buffers = [ _NamedBytesIO(v1Bytes, '08-40-06.CSV'), _NamedBytesIO(v1Bytes, 'SENSOR.CSV'), _NamedBytesIO(v1Bytes, '09-12-00.CSV'), ]
+    results = processAllJumpFiles(buffers, workers = 2)
+    assert list(results.keys()) == [ '08-40-06:v1', '09-12-00:v1', ]
+
+    with pytest.raises(SSScoringError):
+        processAllJumpFiles(jumpFiles, workers = 0)
+
+
+def test_processAllJumpFiles_corruptTrack(tmp_path):
+    lines = TEST_FLYSIGHT_DATA.read_text().split('\n')
+    column = lines[0].split(',').index('hMSL')
+    cells = lines[50].split(',')
+    cells[column] = 'abc'
+    lines[50] = ','.join(cells)
+    corruptFile = tmp_path / 'corrupt.CSV'
+    corruptFile.write_text('\n'.join(lines))
+    results = processAllJumpFiles([ corruptFile, TEST_FLYSIGHT_DATA_V2, ])
+    assert results['%s:INVALID' % corruptFile.as_posix()].status == JumpStatus.INVALID_SPEED_FILE
+    assert [ jumpResult.status for jumpResult in results.values() ][1] == JumpStatus.OK
+    results = processAllJumpFiles([ _NamedBytesIO(corruptFile.read_bytes(), 'corrupt.CSV'), ], cacheDir = tmp_path / 'cache')
+    assert results == { 'corrupt.CSV:INVALID': results['corrupt.CSV:INVALID'], }
+    assert results['corrupt.CSV:INVALID'].status == JumpStatus.INVALID_SPEED_FILE
+
+
+def test_processAllJumpFiles_bundles(tmp_path):
+    with zipfile.ZipFile(tmp_path/'season.zip', 'w', zipfile.ZIP_DEFLATED) as bundle:
+        bundle.write(TEST_FLYSIGHT_DATA_V2, '01-00-00/TRACK.CSV')
+        bundle.write(TEST_FLYSIGHT_DATA_V2_STRATOSPHERE, '02-00-00/TRACK.CSV')
+    with tarfile.open(tmp_path/'season.tar.gz', 'w:gz') as bundle:
+        bundle.add(TEST_FLYSIGHT_DATA.resolve(), 'FS1/test-data-00.CSV')
+        bundle.add(TEST_FLYSIGHT_DATA_V1.resolve(), 'FS1/test-data-02.CSV')
+    jumpFiles = getAllSpeedJumpFilesFrom(tmp_path)
+    assert len(jumpFiles) == 4
+    expected = processAllJumpFiles([ TEST_FLYSIGHT_DATA, TEST_FLYSIGHT_DATA_V1, TEST_FLYSIGHT_DATA_V2, TEST_FLYSIGHT_DATA_V2_STRATOSPHERE, ])
+    for workers in (1, 2, ):
+        results = processAllJumpFiles(jumpFiles, workers = workers)
+        assert list(results.keys())[:2] == [ '%s season.tar.gz FS1 test-data-00:v1' % tmp_path.as_posix().replace('/', ' ').strip(), '%s season.tar.gz FS1 test-data-02:v1' % tmp_path.as_posix().replace('/', ' ').strip(), ]
+        assert [ (jumpResult.status, jumpResult.score) for jumpResult in results.values() ] == [ (jumpResult.status, jumpResult.score) for jumpResult in expected.values() ]
+
+
+def test_iterJumpResults_bundleOrder(tmp_path):
+    bundleFile = tmp_path / 'season.tar'
+    with tarfile.open(bundleFile, 'w') as bundle:
+        bundle.add(TEST_FLYSIGHT_DATA_V1.resolve(), 'b.CSV')
+        bundle.add(TEST_FLYSIGHT_DATA.resolve(), 'a.CSV')
+    jumpFiles = getAllSpeedJumpFilesFrom(tmp_path)
+    expected = [ '%s season.tar %s:v1' % (tmp_path.as_posix().replace('/', ' ').strip(), name) for name in ('a', 'b', ) ]
+    for workers in (1, 2, ):
+        assert [ tag for tag, _ in iterJumpResults(jumpFiles, workers = workers) ] == expected
+
+    # Members that can't be read are invalid, the rest are scored:
+    jumpFiles = [ BundleMember(bundleFile, 'a.CSV'), BundleMember(bundleFile, 'bogus.CSV'), BundleMember(tmp_path / 'bogus.tar', 'a.CSV'), ]
+    results = list(iterJumpResults(jumpFiles))
+    assert [ jumpResult.status for _, jumpResult in results ] == [ JumpStatus.OK, JumpStatus.INVALID_SPEED_FILE, JumpStatus.INVALID_SPEED_FILE, ]
+    assert results[1][0] == '%s/bogus.CSV:INVALID' % bundleFile.as_posix()
+
+
 def test_processAllJumpFiles_filenameFilter():
     with open(TEST_FLYSIGHT_DATA, 'rb') as inputFile:
         v1Bytes = inputFile.read()
@@ -384,23 +564,67 @@ def test_processAllJumpFiles_filenameFilter():
     assert any(tag.endswith(':v2') for tag in resultsV2Lower)
 
 
+def test_processAllJumpsInTrack():
+    results = processAllJumpsInTrack(TEST_FLYSIGHT_DATA_V2)
+    assert list(results.keys()) == [ '18-56-32:v2', ]
+    assert results['18-56-32:v2'].score == processAllJumpFiles([ TEST_FLYSIGHT_DATA_V2, ])['18-56-32:v2'].score
+
+    # Same unit left on for a second load, one hour later:
+    with open(TEST_FLYSIGHT_DATA, 'r') as inputFile:
+        lines = inputFile.readlines()
+    track = ''.join(lines)+''.join(line.replace('T18:', 'T19:') for line in lines[2:])
+    results = processAllJumpsInTrack(_NamedBytesIO(track.encode(), '08-40-06.CSV'))
+    assert len(results) == 2
+    tags = list(results.keys())
+    assert tags[0] == '08-40-06:v1'
+    assert tags[1].startswith('08-40-06 19-')
+    assert tags[1].endswith(':v1')
+    for jumpResult in results.values():
+        assert jumpResult.status == JumpStatus.OK
+        assert jumpResult.score == 444.61
+
+    results = processAllJumpsInTrack(TEST_FLYSIGHT_DATA_V1_WARM_UP)
+    assert len(results) == 1
+    assert list(results.values())[0].status == JumpStatus.WARM_UP_FILE
+
+    with pytest.raises(SSScoringError):
+        processAllJumpsInTrack(42)
+
+
 def test_aggregateResults():
     global _speeds
 
     _speeds = aggregateResults(_jumpResults)
     assert len(_speeds)
     assert _speeds.iloc[0].score
-    assert 'maxSpeed' in _speeds.columns
+    assert list(_speeds.columns) == [ 'score', '5.0', '10.0', '15.0', '20.0', 'finalSpeed', 'finalTime', 'maxSpeed', ]
+    assert list(_speeds.index) == sorted(tag for tag, jumpResult in _jumpResults.items() if jumpResult.status == JumpStatus.OK)
 
     with pytest.raises(SSScoringError):
         _ = aggregateResults(dict())
 
 
+def test_aggregateResultsFrom():
+    speeds = aggregateResultsFrom(iterJumpResults(getAllSpeedJumpFilesFrom(TEST_FLYSIGHT_DATA_LAKE)))
+    assert speeds.equals(aggregateResults(_jumpResults))
+
+    with pytest.raises(SSScoringError):
+        aggregateResultsFrom(iter(()))
+
+
+def test_aggregateResultsFromRows():
+    scoreRows = { tag: aggregateRowFrom(jumpResult) for tag, jumpResult in _jumpResults.items() }
+    assert all(scoreRow is None for tag, scoreRow in scoreRows.items() if _jumpResults[tag].status != JumpStatus.OK)
+    speeds = aggregateResultsFromRows({ tag: scoreRow for tag, scoreRow in scoreRows.items() if scoreRow is not None })
+    assert speeds.equals(aggregateResults(_jumpResults))
+
+
 def test_collateAnglesByTimeFromExit():
     angles = collateAnglesByTimeFromExit(_jumpResults)
     assert len(angles)
     assert angles.iloc[0].score
-    assert 'finalTime' in angles.columns
+    assert list(angles.columns) == [ 'score', '5.0', '10.0', '15.0', '20.0', 'finalAngle', 'finalTime', ]
+    assert not angles.isna().any().any()
 
     with pytest.raises(SSScoringError):
         angles = collateAnglesByTimeFromExit(dict())
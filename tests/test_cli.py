@@ -2,12 +2,17 @@
 
 from click.testing import CliRunner
 
+from ssscoring.calc import processAllJumpFiles
 from ssscoring.cli import _assertDataLake
 from ssscoring.cli import die
 from ssscoring.cli import _ssscoreCommand
+from ssscoring.cli import ssscore
+from ssscoring.flysight import getAllSpeedJumpFilesFrom
 
 import pathlib
 import pytest
+import shutil
+import tarfile
 
 
 # +++ constants +++
@@ -53,3 +58,18 @@ def test_ssscoreCommand():
     result = runner.invoke(_ssscoreCommand, [ 42.0, TEST_DATA_LAKE, ])
     assert result
 
+
+def test_ssscore(tmp_path):
+    expected = len(processAllJumpFiles(getAllSpeedJumpFilesFrom(TEST_DATA_LAKE)))
+    assert ssscore(0.0, False, TEST_DATA_LAKE) == expected
+    dataLake = shutil.copytree(TEST_DATA_LAKE, tmp_path / 'lake')
+    assert ssscore(0.0, False, dataLake, useManifest = True) == expected
+
+    # Both modes score the tracks inside bundles:
+    dataLake = tmp_path / 'bundles'
+    dataLake.mkdir()
+    with tarfile.open(dataLake / 'lake.tar', 'w') as bundle:
+        for name in ('test-data-00.CSV', 'test-data-02.CSV', ):
+            bundle.add(pathlib.Path(TEST_DATA_LAKE) / 'FS1' / name, name)
+    assert ssscore(0.0, False, dataLake) == 2
+    assert ssscore(0.0, False, dataLake, useManifest = True) == 2
@@ -2,16 +2,21 @@
 
 from enum import Enum
 
+from ssscoring.calc import calcScoreISC
+from ssscoring.calc import calcScoreMeanVelocity
 from ssscoring.calc import processJump
+from ssscoring.datatypes import CompactJumpResults
 from ssscoring.datatypes import FlySightVersion
 from ssscoring.datatypes import JumpResults
 from ssscoring.datatypes import JumpStatus
 from ssscoring.datatypes import PerformanceWindow
 from ssscoring.calc import convertFlySight2SSScoring
+from ssscoring.calc import scoringWindowsISC
 
 import pathlib
 import warnings
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -76,3 +81,54 @@ def test_PerformanceWindow(_validJump):
     assert isinstance(window.end, float)
     assert isinstance(window.validationStart, float)
 
+
+
+def test_CompactJumpResults(_validJump):
+    compact = CompactJumpResults.fromJumpResults(_validJump)
+    assert not hasattr(compact, '__dict__')
+    assert compact.hasSamples
+    assert compact.doubles.dtype == np.float64
+    assert compact.samples.flags['C_CONTIGUOUS']
+    assert compact.scoreValues.shape == compact.scoreTimes.shape
+    jumpResult = compact.toJumpResults()
+    assert isinstance(jumpResult, JumpResults)
+    pd.testing.assert_frame_equal(jumpResult.data, _validJump.data)
+    pd.testing.assert_frame_equal(jumpResult.table, _validJump.table)
+    assert jumpResult.scores == _validJump.scores
+    assert jumpResult[1:3] == _validJump[1:3]
+    assert jumpResult[5:] == _validJump[5:]
+
+    compact32 = CompactJumpResults.fromJumpResults(_validJump, dtype = np.float32)
+    assert compact32.samples.dtype == np.float32
+    assert compact32.nbytes < compact.nbytes
+    data = compact32.toJumpResults().data
+    assert (data.timeUnix == _validJump.data.timeUnix).all()
+    assert np.allclose(data.vKMh, _validJump.data.vKMh)
+
+    compact = CompactJumpResults.fromJumpResults(_validJump, keepSamples = False)
+    assert not compact.hasSamples
+    jumpResult = compact.toJumpResults()
+    assert jumpResult.data is None
+    assert jumpResult.score == _validJump.score
+    pd.testing.assert_frame_equal(jumpResult.table, _validJump.table)
+
+    compact = CompactJumpResults.fromJumpResults(JumpResults(None, None, None, None, None, None, JumpStatus.INVALID_SPEED_FILE))
+    jumpResult = compact.toJumpResults()
+    assert jumpResult.data is None and jumpResult.scores is None and jumpResult.table is None
+    assert jumpResult.status == JumpStatus.INVALID_SPEED_FILE
+
+
+def test_CompactJumpResults_scores(_validJump):
+    score, scores = calcScoreMeanVelocity(_validJump.data)
+    jumpResult = _validJump._replace(score = score, scores = scores)
+    assert CompactJumpResults.fromJumpResults(jumpResult).toJumpResults().scores == scores
+
+    # Two windows with tied scores:
+    data = pd.DataFrame({ 'plotTime': np.arange(6.0), 'altitudeAGL': 3000.0-50.0*np.arange(6.0), })
+    jumpResult = JumpResults(data, 180.0, *calcScoreISC(data), None, None, JumpStatus.OK)
+    compact = CompactJumpResults.fromJumpResults(jumpResult)
+    assert list(compact.scoreValues) == [ 180.0, ]
+    compact = CompactJumpResults.fromJumpResults(jumpResult, scoreWindows = scoringWindowsISC(data))
+    assert list(compact.scoreValues) == [ 180.0, 180.0, ]
+    assert list(compact.scoreTimes) == [ 0.0, 1.0, ]
+    assert compact.toJumpResults().scores == jumpResult.scores
@@ -1,31 +1,52 @@
 # See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
 
 
+from io import BufferedReader
+from io import BytesIO
 from io import StringIO
 from pathlib import Path
 
 from ssscoring.constants import BREAKOFF_ALTITUDE
 from ssscoring.constants import FLYSIGHT_2_HEADER
 from ssscoring.constants import INSIGHT_1_HEADER
+from ssscoring.constants import MIN_JUMP_FILE_SIZE
+from ssscoring.constants import RAW_TRACK_COLUMNS
+from ssscoring.datatypes import BundleMember
+from ssscoring.datatypes import TrackFormat
 from ssscoring.errors import SSScoringError
+from ssscoring.flysight import CRNormalizingReader
 from ssscoring.flysight import FLYSIGHT_1_HEADER
 from ssscoring.flysight import FLYSIGHT_FILE_ENCODING
 from ssscoring.flysight import FlySightVersion
+from ssscoring.flysight import bundleKindOf
+from ssscoring.flysight import dataLakeVersionOf
 from ssscoring.flysight import detectFlySightFileVersionOf
 from ssscoring.flysight import fixCRMangledCSV
 from ssscoring.flysight import getAllSpeedJumpFilesFrom
 from ssscoring.flysight import getFlySightDataFromCSVBuffer
 from ssscoring.flysight import getFlySightDataFromCSVFileName
+from ssscoring.flysight import headerLinesIn
+from ssscoring.flysight import headerPrefixIn
 from ssscoring.flysight import isCRMangledCSV
+from ssscoring.flysight import readBundleMember
+from ssscoring.flysight import readBundleMembers
 from ssscoring.flysight import readInsightCSV
 from ssscoring.flysight import readVersion1CSV
 from ssscoring.flysight import readVersion2CSV
+from ssscoring.flysight import registerTrackFormat
 from ssscoring.flysight import skipOverFS2MetadataRowsIn
+from ssscoring.flysight import trackFormatOf
 from ssscoring.flysight import validFlySightHeaderIn
 
+import gzip
+import importlib.util
 import os
 import pytest
+import tarfile
 import tempfile
+import zipfile
+
+import ssscoring.flysight
 
 import pandas as pd
 
@@ -38,6 +59,7 @@ TEST_FLYSIGHT_2_DATA = Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS2' / '01-00-00' / 'TRA
 TEST_FLYSIGHT_2_DATA_ALT = Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS2' / '02-00-00-startosphere' / 'TRACK.CSV'
 TEST_FLYSIGHT_4_DATA = Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS1' / 'test-data-04-DOS-CRLF.CSV'
 TEST_INSIGHT_DATA = Path(TEST_FLYSIGHT_DATA_LAKE) / 'INSIGHT' / 'gps_00104.csv'
+TEST_CSV_ENGINES = ('c', pytest.param('pyarrow', marks = pytest.mark.skipif(not importlib.util.find_spec('pyarrow'), reason = 'pyarrow not installed')), )
 
 
 # +++ tests +++
@@ -82,6 +104,22 @@ def _tooSmallCSV(tmp_path_factory):
     os.unlink(fileName)
 
 
+@pytest.fixture
+def _bundlesDataLake(tmp_path):
+    with zipfile.ZipFile(tmp_path/'season.zip', 'w', zipfile.ZIP_DEFLATED) as bundle:
+        bundle.write(TEST_FLYSIGHT_2_DATA, '01-00-00/TRACK.CSV')
+        bundle.write(TEST_FLYSIGHT_1_DATA, 'FS1/test-data-00.CSV')
+        bundle.writestr('01-00-00/SENSOR.CSV', TEST_FLYSIGHT_2_DATA.read_bytes())
+    with tarfile.open(tmp_path/'season.tar.gz', 'w:gz') as bundle:
+        # Stored out of order:
+        bundle.add(TEST_INSIGHT_DATA, 'INSIGHT/gps_00104.csv')
+        bundle.add(TEST_FLYSIGHT_2_DATA, '01-00-00/TRACK.CSV')
+    with gzip.open(tmp_path/'TRACK.CSV.gz', 'wb') as bundle:
+        bundle.write(TEST_FLYSIGHT_2_DATA.read_bytes())
+    (tmp_path/'corrupt.zip').write_bytes(b'PK\x03\x04bogus')
+    yield tmp_path
+
+
 def test_skipOverFS2MetadataRowsIn():
     data = pd.read_csv(TEST_FLYSIGHT_2_DATA, names = FLYSIGHT_2_HEADER, skiprows = 6).head(50)
     dataMod = skipOverFS2MetadataRowsIn(data)
@@ -119,6 +157,54 @@ def test_getAllSpeedJumpFilesFrom(_tooSmallCSV):
     assert not len(getAllSpeedJumpFilesFrom('./bogus'))
 
 
+def test_getAllSpeedJumpFilesFrom_headerOnly(tmp_path):
+    # Only the header matters during discovery; the track body isn't parsed:
+    with open(TEST_FLYSIGHT_1_DATA, 'rb') as inputFile:
+        header = b''.join(inputFile.readlines()[:2])
+    padding = b'\x00'*MIN_JUMP_FILE_SIZE
+    (tmp_path/'header-only.CSV').write_bytes(header+padding)
+    (tmp_path/'binary.CSV').write_bytes(b'\xff\xfe'+padding)
+    (tmp_path/'too-small.CSV').write_bytes(header)
+    # Left behind by an interrupted fixCRMangledCSV():
+    (tmp_path/'TRACK.CSVx1y2z3.tmp').write_bytes(header+padding)
+    files = getAllSpeedJumpFilesFrom(tmp_path)
+    assert list(files.items()) == [ (tmp_path/'header-only.CSV', '1'), ]
+
+
+def test_getAllSpeedJumpFilesFrom_bundles(_bundlesDataLake):
+    files = getAllSpeedJumpFilesFrom(_bundlesDataLake)
+    assert [ (str(jumpFile), version) for jumpFile, version in files.items() ] == [
+        ('%s/TRACK.CSV.gz/TRACK.CSV' % _bundlesDataLake.as_posix(), '2'),
+        ('%s/season.tar.gz/01-00-00/TRACK.CSV' % _bundlesDataLake.as_posix(), '2'),
+        ('%s/season.tar.gz/INSIGHT/gps_00104.csv' % _bundlesDataLake.as_posix(), 'i'),
+        ('%s/season.zip/01-00-00/TRACK.CSV' % _bundlesDataLake.as_posix(), '2'),
+        ('%s/season.zip/FS1/test-data-00.CSV' % _bundlesDataLake.as_posix(), '1'),
+    ]
+    assert all(isinstance(jumpFile, BundleMember) for jumpFile in files)
+    assert not getAllSpeedJumpFilesFrom(_bundlesDataLake, bundles = False)
+
+
+def test_readBundleMembers(_bundlesDataLake):
+    tarBundle = _bundlesDataLake/'season.tar.gz'
+    # Requested order, with and without room to hold the members stored ahead:
+    memberNames = [ '01-00-00/TRACK.CSV', 'bogus.CSV', 'INSIGHT/gps_00104.csv', ]
+    expected = [ TEST_FLYSIGHT_2_DATA.read_bytes(), None, TEST_INSIGHT_DATA.read_bytes(), ]
+    assert list(readBundleMembers(tarBundle, memberNames)) == expected
+    assert list(readBundleMembers(tarBundle, memberNames, maxPendingBytes = 0)) == expected
+    assert list(readBundleMembers(_bundlesDataLake/'season.zip', [ 'bogus.CSV', ])) == [ None, ]
+    assert readBundleMember(BundleMember(_bundlesDataLake/'season.zip', 'FS1/test-data-00.CSV')) == TEST_FLYSIGHT_1_DATA.read_bytes()
+    assert readBundleMember(BundleMember(_bundlesDataLake/'TRACK.CSV.gz', 'TRACK.CSV')) == TEST_FLYSIGHT_2_DATA.read_bytes()
+
+    for bundleMember in (BundleMember(tarBundle, 'bogus.CSV'), BundleMember(_bundlesDataLake/'season.zip', 'bogus.CSV'), BundleMember(_bundlesDataLake/'corrupt.zip', 'TRACK.CSV'), ):
+        with pytest.raises(SSScoringError):
+            readBundleMember(bundleMember)
+
+    rawData, tag = getFlySightDataFromCSVFileName(BundleMember(tarBundle, '01-00-00/TRACK.CSV'))
+    expected, expectedTag = getFlySightDataFromCSVFileName(TEST_FLYSIGHT_2_DATA)
+    assert tag == expectedTag
+    pd.testing.assert_frame_equal(rawData, expected)
+
+
 def test_detectFlySightFileVersionOf(_missingColumnInCSV):
     invalidFile = TEST_FLYSIGHT_2_DATA.as_posix().replace('TRACK', 'BAD_CSV_FILE')
 
@@ -150,6 +236,52 @@ def test_detectFlySightFileVersionOf(_missingColumnInCSV):
     assert detectFlySightFileVersionOf(buffer) == FlySightVersion.INSIGHT
 
 
+def test_trackFormatOf():
+    prefixes = { fileName: fileName.read_bytes()[:1024] for fileName in (TEST_FLYSIGHT_1_DATA, TEST_FLYSIGHT_2_DATA, TEST_INSIGHT_DATA, ) }
+    assert trackFormatOf(prefixes[TEST_FLYSIGHT_1_DATA]).version == FlySightVersion.V1
+    assert trackFormatOf(prefixes[TEST_FLYSIGHT_2_DATA]).version == FlySightVersion.V2
+    assert trackFormatOf(prefixes[TEST_INSIGHT_DATA]).version == FlySightVersion.INSIGHT
+    assert trackFormatOf(prefixes[TEST_INSIGHT_DATA].replace(b'headAcc', b'cAcc')).version == FlySightVersion.V1
+    assert trackFormatOf(prefixes[TEST_FLYSIGHT_1_DATA].replace(b',', b'\t')) is None
+    assert trackFormatOf(prefixes[TEST_FLYSIGHT_1_DATA].replace(b'velD', b'speedD')) is None
+    assert trackFormatOf(b'\xff\xfe\x00\n') is None
+    assert trackFormatOf(b'') is None
+
+
+def test_headerLinesIn():
+    lines = headerLinesIn(headerPrefixIn(TEST_FLYSIGHT_2_DATA.read_bytes()))
+    assert lines[0] == '$FLYS,1'
+    assert lines[-1] == '$DATA'
+    lines = headerLinesIn(headerPrefixIn(TEST_FLYSIGHT_1_DATA.read_bytes()))
+    assert len(lines) == 2 and lines[0].startswith('time,lat,lon')
+    assert dataLakeVersionOf(FlySightVersion.INSIGHT) == 'i'
+
+
+def test_bundleKindOf():
+    assert bundleKindOf('season.ZIP') == 'zip'
+    assert bundleKindOf(Path('season.tar.gz')) == 'tar'
+    assert bundleKindOf('TRACK.CSV.gz') == 'gzip'
+    assert bundleKindOf('TRACK.CSV') is None
+
+
+def test_registerTrackFormat(monkeypatch):
+    def _reader(fileThing, columns = None, engine = None):
+        return pd.read_csv(fileThing, skiprows = 1).rename(columns = { 't': 'time', })
+
+    monkeypatch.setattr(ssscoring.flysight, '_TRACK_FORMATS', list(ssscoring.flysight._TRACK_FORMATS))
+    rawData = pd.read_csv(TEST_FLYSIGHT_1_DATA, skiprows = [ 1, ]).rename(columns = { 'time': 't', })
+    buffer = ('#CUSTOM\n'+rawData.to_csv(index = False)).encode()
+    assert getFlySightDataFromCSVBuffer(buffer, 'custom') == (None, 'custom:INVALID')
+
+    with pytest.raises(SSScoringError):
+        registerTrackFormat(('bogus', ))
+    registerTrackFormat(TrackFormat(FlySightVersion.V1, b'#CUSTOM', frozenset(), frozenset(), _reader, lambda rawData, name: '%s:custom' % name))
+    customData, tag = getFlySightDataFromCSVBuffer(buffer, 'track')
+    assert tag == 'track:custom'
+    assert customData.time.iloc[0] == rawData.t.iloc[0]
+    assert trackFormatOf(TEST_FLYSIGHT_1_DATA.read_bytes()[:512]).version == FlySightVersion.V1
+
+
 def test_isCRMangledCSV():
     assert isCRMangledCSV(TEST_FLYSIGHT_4_DATA)
     x = isCRMangledCSV(TEST_FLYSIGHT_1_DATA)
@@ -166,9 +298,33 @@ def test_fixCRMangledCSV():
     assert isCRMangledCSV(tempFile)
     fixCRMangledCSV(tempFile)
     assert not isCRMangledCSV(tempFile)
+    with open(tempFile, 'rb') as inputFile:
+        assert inputFile.read() == rawData.replace(b'\r\r\n', b'\r\n')
     os.unlink(tempFile)
 
 
+@pytest.mark.parametrize('chunkSize', [ 1, 2, 3, 7, 1024, ])
+def test_fixCRMangledCSV_chunks(tmp_path, chunkSize):
+    rawData = b'a,b\r\r\n\r\r\r\n1,2\r\r\n\r\r\r\r\n3,4\r'
+    fileName = tmp_path/'mangled.CSV'
+    fileName.write_bytes(rawData)
+    fixCRMangledCSV(fileName, chunkSize = chunkSize)
+    assert fileName.read_bytes() == rawData.replace(b'\r\r\n', b'\r\n')
+    assert [ path.name for path in tmp_path.iterdir() ] == [ 'mangled.CSV', ]
+    assert BufferedReader(CRNormalizingReader(BytesIO(rawData), chunkSize)).read() == fileName.read_bytes()
+
+
+@pytest.mark.parametrize('engine', TEST_CSV_ENGINES)
+def test_CRNormalizingReader(engine):
+    with open(TEST_FLYSIGHT_4_DATA, 'rb') as inputFile:
+        rawData = inputFile.read()
+    expected = readVersion1CSV(BytesIO(rawData.replace(b'\r\r\n', b'\r\n')), engine = engine)
+    assert len(expected)
+    pd.testing.assert_frame_equal(readVersion1CSV(BufferedReader(CRNormalizingReader(BytesIO(rawData))), engine = engine), expected)
+    pd.testing.assert_frame_equal(readVersion1CSV(TEST_FLYSIGHT_4_DATA, engine = engine), expected)
+    pd.testing.assert_frame_equal(getFlySightDataFromCSVBuffer(rawData, 'mangled')[0], expected)
+
+
 def test_readVersion1CSV():
     rawData = readVersion1CSV(TEST_FLYSIGHT_1_DATA.as_posix())
     assert isinstance(rawData, pd.DataFrame)
@@ -220,6 +376,52 @@ def test_readVersion2CSV():
     assert 'GNSS' not in rawData.columns
 
 
+def _inferredVersion1CSV(fileThing) -> pd.DataFrame:
+    return pd.read_csv(fileThing, skiprows = (1, 1), index_col = False)
+
+
+def _inferredVersion2CSV(fileThing) -> pd.DataFrame:
+    rawData = pd.read_csv(fileThing, names = FLYSIGHT_2_HEADER, skiprows = 6, index_col = False, na_values=['NA',])
+    return skipOverFS2MetadataRowsIn(rawData).drop('GNSS', axis = 1).reset_index(drop = True)
+
+
+@pytest.mark.parametrize('engine', TEST_CSV_ENGINES)
+@pytest.mark.parametrize('reader, inferredReader, fileName', [
+    (readVersion1CSV, _inferredVersion1CSV, TEST_FLYSIGHT_1_DATA),
+    (readVersion2CSV, _inferredVersion2CSV, TEST_FLYSIGHT_2_DATA),
+    (readVersion2CSV, _inferredVersion2CSV, TEST_FLYSIGHT_2_DATA_ALT),
+    (readInsightCSV, lambda fileThing: _inferredVersion1CSV(fileThing).drop('headAcc', axis = 1), TEST_INSIGHT_DATA),
+])
+def test_readCSV_parity(reader, inferredReader, fileName, engine):
+    expected = inferredReader(fileName)
+    buffer = fileName.read_bytes()
+    for fileThing in (fileName, BytesIO(buffer), StringIO(buffer.decode(FLYSIGHT_FILE_ENCODING)), ):
+        rawData = reader(fileThing, engine = engine)
+        pd.testing.assert_frame_equal(rawData, expected, check_dtype = False)
+        assert all(rawData[column].dtype == 'float64' for column in rawData.columns if column != 'time')
+    for fileThing in (fileName, BytesIO(buffer), ):
+        rawData = reader(fileThing, columns = RAW_TRACK_COLUMNS, engine = engine)
+        assert tuple(rawData.columns) == RAW_TRACK_COLUMNS
+        pd.testing.assert_frame_equal(rawData, expected[list(RAW_TRACK_COLUMNS)], check_dtype = False)
+
+
+def test_readCSV_engine():
+    with pytest.raises(SSScoringError):
+        readVersion1CSV(TEST_FLYSIGHT_1_DATA, engine = 'bogus')
+
+
+@pytest.mark.parametrize('engine', TEST_CSV_ENGINES)
+def test_readVersion2CSV_header(engine):
+    # The track data starts after the $DATA marker, wherever it is:
+    buffer = TEST_FLYSIGHT_2_DATA.read_bytes()
+    variables = b''.join(b'$VAR,NOTE_%d,%s\n' % (n, b'x'*80) for n in range(10))
+    longHeader = buffer.replace(b'$COL,', variables+b'$COL,', 1)
+    expected = readVersion2CSV(TEST_FLYSIGHT_2_DATA, engine = engine)
+    pd.testing.assert_frame_equal(readVersion2CSV(BytesIO(longHeader), engine = engine), expected)
+    with pytest.raises(SSScoringError):
+        readVersion2CSV(BytesIO(buffer.replace(b'$DATA', b'$NODATA')), engine = 'pyarrow')
+
+
 def test_getFlySightDataFromCSVBuffer():
     with pytest.raises(SSScoringError):
         getFlySightDataFromCSVBuffer('not bytes', 'test')
@@ -255,6 +457,41 @@ def test_getFlySightDataFromCSVBuffer():
     assert 'headAcc' not in rawData.columns
 
 
+def test_getFlySightDataFromCSVBuffer_bytesLike():
+    buffer = TEST_FLYSIGHT_2_DATA.read_bytes()
+    expected, expectedTag = getFlySightDataFromCSVBuffer(buffer, TEST_FLYSIGHT_2_DATA.name)
+    upload = BytesIO(buffer)
+    for bytesLike in (bytearray(buffer), memoryview(buffer), ):
+        rawData, tag = getFlySightDataFromCSVBuffer(bytesLike, TEST_FLYSIGHT_2_DATA.name)
+        assert tag == expectedTag
+        pd.testing.assert_frame_equal(rawData, expected)
+    with upload.getbuffer() as view:
+        rawData, tag = getFlySightDataFromCSVBuffer(view, TEST_FLYSIGHT_2_DATA.name)
+    assert tag == expectedTag
+    pd.testing.assert_frame_equal(rawData, expected)
+    # No exports of the upload's buffer outlive the parse:
+    upload.write(b'\n')
+
+    with pytest.raises(SSScoringError):
+        getFlySightDataFromCSVBuffer(buffer[:1024]+b'\xff\xfe'+buffer[1024:], TEST_FLYSIGHT_2_DATA.name)
+
+
+def test_getFlySightDataFromCSVFileName_singleOpen(monkeypatch):
+    opened = list()
+    builtinOpen = open
+
+    def _countingOpen(fileName, *args, **kwargs):
+        opened.append(Path(fileName).name)
+        return builtinOpen(fileName, *args, **kwargs)
+
+    monkeypatch.setattr('builtins.open', _countingOpen)
+    for fileName in (TEST_FLYSIGHT_1_DATA, TEST_FLYSIGHT_2_DATA, TEST_INSIGHT_DATA, ):
+        opened.clear()
+        rawData, _ = getFlySightDataFromCSVFileName(fileName)
+        assert len(rawData)
+        assert opened == [ fileName.name, ]
+
+
 def test_getFlySightDataFromCSVFileName(_missingColumnInCSV):
     with pytest.raises(SSScoringError):
         getFlySightDataFromCSVFileName(42)
@@ -0,0 +1,66 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+from ssscoring.geodesy import bearingComponents
+from ssscoring.geodesy import destination
+from ssscoring.geodesy import haversineDistance
+from ssscoring.geodesy import initialBearing
+from ssscoring.geodesy import localENU
+
+import numpy as np
+import pytest
+
+
+# +++ constants +++
+
+START = (37.8329426, -121.64040112)
+END = (37.8285883, -121.6356015)
+
+
+# +++ tests +++
+
+def test_haversineDistance():
+    assert '%3.4f' % haversineDistance(*START, *END) == '641.9585'
+    distances = haversineDistance(START[0], START[1], np.array([ START[0], END[0], ]), np.array([ START[1], END[1], ]))
+    assert distances.shape == (2, )
+    assert distances[0] == 0.0
+    assert distances[1] == pytest.approx(641.9585, abs = 1e-4)
+
+
+def test_bearingComponents():
+    east, north = bearingComponents(*START, *START)
+    assert east == 0.0
+    assert north == 0.0
+    east, north = bearingComponents(*START, *END)
+    assert east > 0.0
+    assert north < 0.0
+
+
+def test_initialBearing():
+    assert initialBearing(0.0, 0.0, 1.0, 0.0) == pytest.approx(0.0)
+    assert initialBearing(0.0, 0.0, 0.0, 1.0) == pytest.approx(90.0)
+    assert initialBearing(0.0, 0.0, -1.0, 0.0) == pytest.approx(180.0)
+    assert initialBearing(0.0, 0.0, 0.0, -1.0) == pytest.approx(270.0)
+
+
+def test_destination():
+    bearing = initialBearing(*START, *END)
+    distance = haversineDistance(*START, *END)
+    lat, lon = destination(*START, bearing, distance)
+    assert lat == pytest.approx(END[0], abs = 1e-9)
+    assert lon == pytest.approx(END[1], abs = 1e-9)
+
+    lats, lons = destination(*START, [ 0.0, 90.0, 180.0, 270.0, ], 400.0)
+    assert lats.shape == (4, )
+    assert haversineDistance(*START, lats, lons) == pytest.approx(400.0)
+    assert destination(0.0, 179.9999, 90.0, 1000.0)[1] < 0.0
+
+
+def test_localENU():
+    east, north, up = localENU(*START, *START)
+    assert (east, north, up) == pytest.approx((0.0, 0.0, 0.0), abs = 1e-6)
+    east, north, up = localENU(*END, *START)
+    assert east > 0.0
+    assert north < 0.0
+    assert np.hypot(east, north) == pytest.approx(haversineDistance(*START, *END), rel = 1e-6)
+    _, _, up = localENU(*START, *START, height = 100.0)
+    assert up == pytest.approx(100.0)
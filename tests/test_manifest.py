@@ -0,0 +1,113 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+from ssscoring.calc import aggregateResults
+from ssscoring.calc import processAllJumpFiles
+from ssscoring.constants import MANIFEST_FILE_NAME
+from ssscoring.errors import SSScoringError
+from ssscoring.flysight import getAllSpeedJumpFilesFrom
+from ssscoring.manifest import aggregateResultsFromManifest
+from ssscoring.manifest import loadManifest
+from ssscoring.manifest import saveManifest
+from ssscoring.manifest import updateManifest
+
+import os
+import pathlib
+import shutil
+import tarfile
+
+import pandas as pd
+import pytest
+
+
+# +++ constants +++
+
+TEST_FLYSIGHT_DATA_LAKE = './resources/test-tracks'
+
+
+# +++ tests +++
+
+@pytest.fixture
+def _bundleDataLake(tmp_path):
+    dataLake = tmp_path / 'bundles'
+    dataLake.mkdir()
+    with tarfile.open(dataLake / 'lake.tar', 'w') as bundle:
+        for name in ('test-data-00.CSV', 'test-data-02.CSV', ):
+            bundle.add(pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS1' / name, 'FS1/%s' % name)
+    yield dataLake
+
+
+@pytest.fixture
+def _dataLake(tmp_path):
+    dataLake = tmp_path / 'test-tracks'
+    shutil.copytree(TEST_FLYSIGHT_DATA_LAKE, dataLake)
+    yield dataLake.as_posix()
+
+
+def test_loadManifest(_dataLake):
+    assert loadManifest(_dataLake) == dict()
+    manifest = { 'a.CSV': { 'path': 'a.CSV', 'size': 42, }, }
+    saveManifest(_dataLake, manifest)
+    with open(pathlib.Path(_dataLake) / MANIFEST_FILE_NAME, 'a') as outputFile:
+        outputFile.write('{bogus\n')
+    assert loadManifest(_dataLake) == manifest
+
+
+def test_updateManifest(_dataLake):
+    manifest, updated = updateManifest(_dataLake)
+    jumpFiles = getAllSpeedJumpFilesFrom(_dataLake)
+    assert len(updated) == len(jumpFiles)
+    assert (pathlib.Path(_dataLake) / MANIFEST_FILE_NAME).is_file()
+    assert loadManifest(_dataLake) == manifest
+
+    manifest, updated = updateManifest(_dataLake)
+    assert not updated
+
+    # Same contents, new mtime:
+    jumpFile = sorted(jumpFiles.keys())[0]
+    os.utime(jumpFile, ns = (0, 0))
+    manifest, updated = updateManifest(_dataLake)
+    assert not updated
+    assert manifest[jumpFile.relative_to(_dataLake).as_posix()]['mtime'] == 0
+
+    with open(jumpFile, 'a') as outputFile:
+        outputFile.write('\n')
+    manifest, updated = updateManifest(_dataLake)
+    assert updated == [ jumpFile.relative_to(_dataLake).as_posix(), ]
+
+    jumpFile.unlink()
+    manifest, updated = updateManifest(_dataLake)
+    assert not updated
+    assert jumpFile.relative_to(_dataLake).as_posix() not in manifest
+
+    manifest, updated = updateManifest(_dataLake, altitudeDZMeters = 42.0)
+    assert len(updated) == len(manifest)
+
+    with pytest.raises(SSScoringError):
+        updateManifest(pathlib.Path(_dataLake) / 'bogus')
+
+
+def test_updateManifest_bundles(_bundleDataLake):
+    manifest, updated = updateManifest(_bundleDataLake)
+    assert updated == [ 'lake.tar/FS1/test-data-00.CSV', 'lake.tar/FS1/test-data-02.CSV', ]
+    assert sorted(manifest.keys()) == updated
+    expected = aggregateResults(processAllJumpFiles(getAllSpeedJumpFilesFrom(_bundleDataLake)))
+    pd.testing.assert_frame_equal(aggregateResultsFromManifest(manifest), expected, check_dtype = False)
+
+    manifest, updated = updateManifest(_bundleDataLake)
+    assert not updated
+
+    # Rewritten bundle, only the changed member is processed again:
+    with tarfile.open(_bundleDataLake / 'lake.tar', 'w') as bundle:
+        bundle.add(pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS1' / 'test-data-00.CSV', 'FS1/test-data-00.CSV')
+        bundle.add(pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS1' / 'test-data-01.CSV', 'FS1/test-data-02.CSV')
+    manifest, updated = updateManifest(_bundleDataLake)
+    assert updated == [ 'lake.tar/FS1/test-data-02.CSV', ]
+
+
+def test_aggregateResultsFromManifest(_dataLake):
+    manifest, _ = updateManifest(_dataLake)
+    expected = aggregateResults(processAllJumpFiles(getAllSpeedJumpFilesFrom(_dataLake)))
+    pd.testing.assert_frame_equal(aggregateResultsFromManifest(manifest), expected, check_dtype = False)
+    pd.testing.assert_frame_equal(aggregateResultsFromManifest(loadManifest(_dataLake)), expected, check_dtype = False)
+    with pytest.raises(SSScoringError):
+        aggregateResultsFromManifest(dict())
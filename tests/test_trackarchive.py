@@ -0,0 +1,106 @@
+# See: https://github.com/pr3d4t0r/SSScoring/blob/master/LICENSE.txt
+
+from ssscoring.calc import processAllJumpFiles
+from ssscoring.constants import RAW_TRACK_COLUMNS
+from ssscoring.errors import SSScoringError
+from ssscoring.flysight import getAllSpeedJumpFilesFrom
+from ssscoring.flysight import getFlySightDataFromCSVFileName
+from ssscoring.trackarchive import compactDataLake
+from ssscoring.trackarchive import getAllTrackArchivesFrom
+from ssscoring.trackarchive import isTrackArchive
+from ssscoring.trackarchive import loadTrackArchive
+from ssscoring.trackarchive import trackArchiveMetadataOf
+from ssscoring.trackarchive import writeTrackArchive
+
+import importlib.util
+import os
+import pathlib
+
+import pandas as pd
+import pytest
+
+
+# +++ constants +++
+
+TEST_FLYSIGHT_DATA_LAKE = './resources/test-tracks'
+TEST_FLYSIGHT_1_DATA = pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS1' / 'test-data-00.CSV'
+TEST_FLYSIGHT_2_DATA = pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'FS2' / '01-00-00' / 'TRACK.CSV'
+TEST_INSIGHT_DATA = pathlib.Path(TEST_FLYSIGHT_DATA_LAKE) / 'INSIGHT' / 'gps_00104.csv'
+TEST_ARCHIVE_ENGINES = ('npz', pytest.param('feather', marks = pytest.mark.skipif(not importlib.util.find_spec('pyarrow'), reason = 'pyarrow not installed')), )
+
+
+# +++ tests +++
+
+def test_isTrackArchive():
+    assert isTrackArchive('TRACK.sstrack')
+    assert isTrackArchive(pathlib.Path('FS2') / 'TRACK.sstrack')
+    assert not isTrackArchive(TEST_FLYSIGHT_2_DATA)
+    assert not isTrackArchive(b'TRACK.sstrack')
+
+
+@pytest.mark.parametrize('engine', TEST_ARCHIVE_ENGINES)
+@pytest.mark.parametrize('jumpFile', [ TEST_FLYSIGHT_1_DATA, TEST_FLYSIGHT_2_DATA, TEST_INSIGHT_DATA, ])
+def test_writeTrackArchive(tmp_path, engine, jumpFile):
+    archiveFile = tmp_path / 'track.sstrack'
+    metadata = writeTrackArchive(jumpFile, archiveFile, engine = engine)
+    assert [ path.name for path in tmp_path.iterdir() ] == [ 'track.sstrack', ]
+    rawData, tag = getFlySightDataFromCSVFileName(jumpFile)
+    archiveData, archiveTag = loadTrackArchive(archiveFile)
+    assert archiveTag == tag
+    pd.testing.assert_frame_equal(archiveData, rawData)
+    archiveData, _ = loadTrackArchive(archiveFile.read_bytes(), columns = RAW_TRACK_COLUMNS)
+    pd.testing.assert_frame_equal(archiveData, rawData[list(RAW_TRACK_COLUMNS)])
+    assert trackArchiveMetadataOf(archiveFile) == metadata
+    assert metadata['source'] == jumpFile.as_posix()
+
+
+def test_trackArchiveMetadataOf(tmp_path):
+    archiveFile = tmp_path / 'track.sstrack'
+    metadata = writeTrackArchive(TEST_FLYSIGHT_2_DATA, archiveFile)
+    assert metadata['version'] == 'V2'
+    assert metadata['header'][0] == '$FLYS,1'
+    assert metadata['header'][-1] == '$DATA'
+    assert metadata['variables']['DEVICE_ID'] == '004e003a484e501420353131'
+    metadata = writeTrackArchive(TEST_FLYSIGHT_1_DATA, archiveFile)
+    assert metadata['version'] == 'V1'
+    assert metadata['header'][0].startswith('time,lat,lon')
+    assert len(metadata['header']) == 2
+    assert not metadata['variables']
+
+    archiveFile.write_bytes(b'bogus')
+    with pytest.raises(SSScoringError):
+        trackArchiveMetadataOf(archiveFile)
+    with pytest.raises(SSScoringError):
+        loadTrackArchive(archiveFile)
+    with pytest.raises(SSScoringError):
+        writeTrackArchive(TEST_FLYSIGHT_1_DATA, archiveFile, engine = 'bogus')
+
+
+def test_compactDataLake(tmp_path):
+    archives = compactDataLake(TEST_FLYSIGHT_DATA_LAKE, tmp_path)
+    jumpFiles = getAllSpeedJumpFilesFrom(TEST_FLYSIGHT_DATA_LAKE)
+    assert list(archives.keys()) == list(jumpFiles.keys())
+    assert archives[TEST_FLYSIGHT_2_DATA] == tmp_path / 'FS2' / '01-00-00' / 'TRACK.sstrack'
+    trackArchives = getAllTrackArchivesFrom(tmp_path)
+    assert set(trackArchives.keys()) == set(archives.values())
+    assert trackArchives[archives[TEST_INSIGHT_DATA]] == 'i'
+
+    # Current archives aren't rewritten:
+    archiveFile = archives[TEST_FLYSIGHT_2_DATA]
+    os.utime(archiveFile, ns = (0, 0))
+    modified = archives[TEST_FLYSIGHT_1_DATA].stat().st_mtime_ns
+    compactDataLake(TEST_FLYSIGHT_DATA_LAKE, tmp_path)
+    assert archiveFile.stat().st_mtime_ns > 0
+    assert archives[TEST_FLYSIGHT_1_DATA].stat().st_mtime_ns == modified
+
+    expected = processAllJumpFiles(jumpFiles)
+    for cacheDir in (None, tmp_path / 'cache', tmp_path / 'cache', ):
+        jumpResults = processAllJumpFiles(trackArchives, cacheDir = cacheDir)
+        assert sorted(jumpResults.keys()) == sorted(expected.keys())
+        for tag, jumpResult in jumpResults.items():
+            assert jumpResult.status == expected[tag].status
+            assert jumpResult.score == expected[tag].score
+            if expected[tag].data is None:
+                assert jumpResult.data is None
+            else:
+                pd.testing.assert_frame_equal(jumpResult.data, expected[tag].data)